@@ -17,6 +17,8 @@
 
 """Commands line interface's command of pydolphinscheduler."""
 
+from pathlib import Path
+
 import click
 from click import echo
 
@@ -96,12 +98,125 @@ def config(getter, setter, init) -> None:
 @click.option(
     "--yaml_file",
     "-f",
+    "yaml_files",
     required=True,
-    help="YAML file path",
-    type=click.Path(exists=True),
+    multiple=True,
+    help="YAML file path, directory or glob pattern like ``'dags/**/*.yaml'``. Use multiple "
+    "``--yaml_file <PATH>`` options to create workflows from multiple paths",
+    type=str,
+)
+@click.option(
+    "--max-workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="Max number of processes create workflows in parallel, default is the number of CPUs",
+)
+def yaml(yaml_files, max_workers) -> None:
+    """Create workflow using YAML file.
+
+    Single YAML file is created in current process, otherwise YAML files are created in parallel processes,
+    and each YAML file referenced by ``$WORKFLOW{...}`` is created only once.
+    """
+    from pydolphinscheduler.core.yaml_workflow import (
+        create_workflow,
+        create_workflows,
+        find_yaml_files,
+    )
+
+    files = find_yaml_files(yaml_files)
+    if not files:
+        raise click.BadParameter(
+            f"No YAML file found in {', '.join(yaml_files)}.", param_hint="--yaml_file"
+        )
+    missing = [str(file) for file in files if not file.exists()]
+    if missing:
+        raise click.BadParameter(
+            f"Path {', '.join(missing)} does not exist.", param_hint="--yaml_file"
+        )
+    if len(yaml_files) == 1 and files == [Path(yaml_files[0]).resolve()]:
+        create_workflow(yaml_files[0])
+        return
+
+    results = create_workflows(files, max_workers=max_workers)
+    for result in results:
+        if result.success:
+            echo(f"Create workflow {result.name} from {result.path}.")
+        else:
+            echo(f"Create workflow from {result.path} failed: {result.error}", err=True)
+    if not all(result.success for result in results):
+        raise click.exceptions.Exit(1)
+
+
+@cli.command(name="compile")
+@click.option(
+    "--file",
+    "-f",
+    "files",
+    required=True,
+    multiple=True,
+    help="Python or YAML file define workflows. Use multiple ``--file <PATH>`` options to compile "
+    "multiple files",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    help="Directory to write workflow artifacts",
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--compress",
+    is_flag=True,
+    default=False,
+    help="Compress workflow artifacts by gzip, to reduce their size",
 )
-def yaml(yaml_file) -> None:
-    """Create workflow using YAML file."""
+def compile_(files, output, compress) -> None:
+    """Compile workflows to artifacts offline, without connecting to Java gateway.
+
+    Workflows submitted in files are written to artifacts, values need Java gateway are kept as
+    placeholders, and artifacts could be pushed by subcommand ``push`` later.
+    """
+    import runpy
+
+    from pydolphinscheduler.core.offline import offline
     from pydolphinscheduler.core.yaml_workflow import create_workflow
 
-    create_workflow(yaml_file)
+    with offline(output, compress) as compiler:
+        for file in files:
+            if file.endswith((".yaml", ".yml")):
+                create_workflow(file)
+            else:
+                runpy.run_path(file, run_name="__main__")
+    echo(f"Compile {len(compiler.artifacts)} workflow artifacts to {output}.")
+
+
+@cli.command()
+@click.argument(
+    "artifacts",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--max-workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="Max number of threads push workflow artifacts concurrently, default is the Java gateway "
+    "connection pool size",
+)
+def push(artifacts, max_workers) -> None:
+    """Push workflow artifacts compiled by subcommand ``compile`` to Java gateway.
+
+    Artifacts could be files or directories contain them, without importing Python code of workflows.
+    """
+    from pydolphinscheduler.core.push import push as push_artifacts
+
+    results = push_artifacts(artifacts, max_workers=max_workers)
+    for result in results:
+        if result.success:
+            echo(f"Push {result.path} with workflow code {result.code}.")
+        else:
+            echo(f"Push {result.path} failed: {result.error}", err=True)
+    if not all(result.success for result in results):
+        raise click.exceptions.Exit(1)
@@ -17,26 +17,60 @@
 
 """Configuration module for pydolphinscheduler."""
 
+from __future__ import annotations
+
+import copy
+import json
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydolphinscheduler.exceptions import PyDSConfException
 from pydolphinscheduler.utils import file
-from pydolphinscheduler.utils.yaml_parser import YamlParser
+
+if TYPE_CHECKING:
+    from pydolphinscheduler.utils.yaml_parser import YamlParser
+
+    configs: YamlParser
 
 BUILD_IN_CONFIG_PATH = Path(__file__).resolve().parent.joinpath("default_config.yaml")
+SNAPSHOT_FILE_NAME = "config.snapshot.json"
+
+# Snapshot of configuration file parsed in current process, keyed by its path, modified time and size
+_snapshot: dict[tuple[str, int, int], dict[str, Any]] = {}
 
 logger = logging.getLogger(__name__)
 logging.basicConfig()
 
 
+def pyds_home() -> Path:
+    """Get the path of pydolphinscheduler home directory, where configuration file and local state live."""
+    return Path(os.environ.get("PYDS_HOME", "~/pydolphinscheduler")).expanduser()
+
+
 def config_path() -> Path:
     """Get the path of pydolphinscheduler configuration file."""
-    pyds_home = os.environ.get("PYDS_HOME", "~/pydolphinscheduler")
-    config_file_path = Path(pyds_home).joinpath("config.yaml").expanduser()
-    return config_file_path
+    return pyds_home().joinpath("config.yaml")
+
+
+def snapshot_path() -> Path:
+    """Get the path of configuration snapshot file, persist parsed configuration across processes."""
+    return pyds_home().joinpath(SNAPSHOT_FILE_NAME)
+
+
+def _using_config_path() -> Path:
+    """Get the path of configuration file in use, custom one if it exists, otherwise build-in one."""
+    return config_path() if config_path().exists() else BUILD_IN_CONFIG_PATH
+
+
+def _snapshot_key(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _snapshot_enabled() -> bool:
+    return get_bool(os.environ.get("PYDS_CONFIG_SNAPSHOT", "false"))
 
 
 def get_configs() -> YamlParser:
@@ -45,11 +79,69 @@ def get_configs() -> YamlParser:
     Will use custom configuration file first if it exists, otherwise default configuration file in
     default path.
     """
-    path = str(config_path()) if config_path().exists() else BUILD_IN_CONFIG_PATH
-    with open(path) as f:
+    from pydolphinscheduler.utils.yaml_parser import YamlParser
+
+    with open(_using_config_path()) as f:
         return YamlParser(f.read())
 
 
+def _save_snapshot(key: tuple[str, int, int], config: YamlParser) -> dict[str, Any]:
+    """Save plain values of parsed configuration as snapshot of configuration file in key."""
+    snapshot = json.loads(json.dumps(config.dict_parser, default=str))
+    _snapshot.clear()
+    _snapshot[key] = snapshot
+    if _snapshot_enabled():
+        path, mtime_ns, size = key
+        content = {
+            "path": path,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "configs": snapshot,
+        }
+        # write to temporary file and replace, so other processes never read a partial snapshot
+        tmp_path = snapshot_path().with_name(f"{SNAPSHOT_FILE_NAME}.{os.getpid()}")
+        try:
+            tmp_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(content))
+            os.replace(tmp_path, snapshot_path())
+        except OSError as ex:
+            logger.debug("Can not write configuration snapshot: %s", ex)
+    return snapshot
+
+
+def _load_snapshot(key: tuple[str, int, int]) -> dict[str, Any] | None:
+    """Load snapshot of configuration file in key from snapshot file, return ``None`` if it is stale."""
+    try:
+        content = json.loads(snapshot_path().read_text())
+    except (OSError, ValueError):
+        return None
+    if (content.get("path"), content.get("mtime_ns"), content.get("size")) != key:
+        return None
+    return content.get("configs")
+
+
+def get_config_snapshot() -> dict[str, Any]:
+    """Get all configuration settings as a snapshot, which is a dict of nested keys and their plain values.
+
+    Comparing to :func:`get_configs`, configuration file is parsed only once in each process until it is
+    changed, keyed by its path, modified time and size. When environment variable ``PYDS_CONFIG_SNAPSHOT``
+    is set to ``true``, the snapshot is also persisted in file ``config.snapshot.json`` of
+    pydolphinscheduler home directory, so other processes, such as short-lived command line interface
+    invocations, could skip parsing YAML when configuration file not changed.
+
+    The snapshot is shared, do not change it or values in it.
+    """
+    key = _snapshot_key(_using_config_path())
+    if key in _snapshot:
+        return _snapshot[key]
+    snapshot = _load_snapshot(key) if _snapshot_enabled() else None
+    if snapshot is None:
+        return _save_snapshot(key, get_configs())
+    _snapshot.clear()
+    _snapshot[key] = snapshot
+    return snapshot
+
+
 def init_config_file() -> None:
     """Initialize configuration file by default configs."""
     path: Path = config_path()
@@ -85,12 +177,12 @@ def get_single_config(key: str) -> Any:
 
     :param key: The config key want to get it value.
     """
-    config = get_configs()
+    config = get_config_snapshot()
     if key not in config:
         raise PyDSConfException(
             "Configuration path %s do not exists. Can not get configuration.", key
         )
-    return config[key]
+    return copy.deepcopy(config[key])
 
 
 def set_single_config(key: str, value: Any) -> None:
@@ -122,6 +214,7 @@ def set_single_config(key: str, value: Any) -> None:
         )
     config[key] = value
     file.write(content=str(config), to_path=str(config_path()), overwrite=True)
+    _save_snapshot(_snapshot_key(config_path()), config)
 
 
 def token_alert(auth_token: str) -> None:
@@ -134,7 +227,7 @@ def token_alert(auth_token: str) -> None:
             "Auth token is None, highly recommend add a token in production, "
             "especially you deploy in public network."
         )
-    config = get_configs()
+    config = get_config_snapshot()
     if config.get("java_gateway.auth_token") == auth_token:
         logger.warning(
             "Auth token is default token, highly recommend add a token in production, "
@@ -142,6 +235,21 @@ def token_alert(auth_token: str) -> None:
         )
 
 
+def __getattr__(name: str) -> Any:
+    """Parse ``configs``, the :class:`YamlParser` of configuration file, when it is first accessed.
+
+    Module variables are read from snapshot of configuration file, see :func:`get_config_snapshot`. The
+    configuration file is still parsed once when this module is imported, unless ``PYDS_CONFIG_SNAPSHOT`` is
+    enabled and the snapshot file is up to date. ``configs`` is kept for users who get settings by nested
+    keys from it, and parsed separately only when it is accessed, see :pep:`562`.
+    """
+    if name != "configs":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = get_configs()
+    globals()[name] = value
+    return value
+
+
 def get_int(val: Any) -> int:
     """Covert value to int."""
     return int(val)
@@ -162,60 +270,115 @@ def get_bool(val: Any) -> bool:
 # Add configs as module variables to avoid read configuration multiple times when
 #  Get common configuration setting
 #  Set or get multiple configs in single time
-configs: YamlParser = get_configs()
+# Settings below are read from the snapshot, and ``configs`` is parsed lazily by ``__getattr__``
+_configs: dict[str, Any] = get_config_snapshot()
+# drop ``configs`` parsed before this module reloaded
+globals().pop("configs", None)
 
 # Java Gateway Settings
 JAVA_GATEWAY_ADDRESS = os.environ.get(
-    "PYDS_JAVA_GATEWAY_ADDRESS", configs.get("java_gateway.address")
+    "PYDS_JAVA_GATEWAY_ADDRESS", _configs.get("java_gateway.address")
 )
 JAVA_GATEWAY_PORT = get_int(
-    os.environ.get("PYDS_JAVA_GATEWAY_PORT", configs.get("java_gateway.port"))
+    os.environ.get("PYDS_JAVA_GATEWAY_PORT", _configs.get("java_gateway.port"))
 )
 JAVA_GATEWAY_AUTO_CONVERT = get_bool(
     os.environ.get(
-        "PYDS_JAVA_GATEWAY_AUTO_CONVERT", configs.get("java_gateway.auto_convert")
+        "PYDS_JAVA_GATEWAY_AUTO_CONVERT", _configs.get("java_gateway.auto_convert")
     )
 )
 JAVA_GATEWAY_AUTH_TOKEN = os.environ.get(
-    "PYDS_JAVA_GATEWAY_AUTH_TOKEN", configs.get("java_gateway.auth_token")
+    "PYDS_JAVA_GATEWAY_AUTH_TOKEN", _configs.get("java_gateway.auth_token")
+)
+JAVA_GATEWAY_POOL_SIZE = get_int(
+    os.environ.get(
+        "PYDS_JAVA_GATEWAY_POOL_SIZE", _configs.get("java_gateway.pool.size")
+    )
+)
+JAVA_GATEWAY_POOL_IDLE_TIMEOUT = get_int(
+    os.environ.get(
+        "PYDS_JAVA_GATEWAY_POOL_IDLE_TIMEOUT",
+        _configs.get("java_gateway.pool.idle_timeout"),
+    )
+)
+JAVA_GATEWAY_POOL_HEALTH_CHECK = get_bool(
+    os.environ.get(
+        "PYDS_JAVA_GATEWAY_POOL_HEALTH_CHECK",
+        _configs.get("java_gateway.pool.health_check"),
+    )
+)
+
+# Cache Settings
+CACHE_SIDE_MODEL_TTL = get_int(
+    os.environ.get("PYDS_CACHE_SIDE_MODEL_TTL", _configs.get("cache.side_model_ttl"))
+)
+CACHE_ENVIRONMENT_TTL = get_int(
+    os.environ.get("PYDS_CACHE_ENVIRONMENT_TTL", _configs.get("cache.environment_ttl"))
+)
+CACHE_DATASOURCE_TTL = get_int(
+    os.environ.get("PYDS_CACHE_DATASOURCE_TTL", _configs.get("cache.datasource_ttl"))
+)
+CACHE_DEPENDENT_TTL = get_int(
+    os.environ.get("PYDS_CACHE_DEPENDENT_TTL", _configs.get("cache.dependent_ttl"))
+)
+CACHE_RESOURCE_TTL = get_int(
+    os.environ.get("PYDS_CACHE_RESOURCE_TTL", _configs.get("cache.resource_ttl"))
+)
+CACHE_ENGINE_RESOURCE_TTL = get_int(
+    os.environ.get(
+        "PYDS_CACHE_ENGINE_RESOURCE_TTL", _configs.get("cache.engine_resource_ttl")
+    )
+)
+CACHE_WORKFLOW_CODE_TTL = get_int(
+    os.environ.get(
+        "PYDS_CACHE_WORKFLOW_CODE_TTL", _configs.get("cache.workflow_code_ttl")
+    )
 )
 
 # User Settings
-USER_NAME = os.environ.get("PYDS_USER_NAME", configs.get("default.user.name"))
+USER_NAME = os.environ.get("PYDS_USER_NAME", _configs.get("default.user.name"))
 USER_PASSWORD = os.environ.get(
-    "PYDS_USER_PASSWORD", configs.get("default.user.password")
+    "PYDS_USER_PASSWORD", _configs.get("default.user.password")
 )
-USER_EMAIL = os.environ.get("PYDS_USER_EMAIL", configs.get("default.user.email"))
-USER_TENANT = os.environ.get("PYDS_USER_TENANT", configs.get("default.user.tenant"))
-USER_PHONE = str(os.environ.get("PYDS_USER_PHONE", configs.get("default.user.phone")))
+USER_EMAIL = os.environ.get("PYDS_USER_EMAIL", _configs.get("default.user.email"))
+USER_TENANT = os.environ.get("PYDS_USER_TENANT", _configs.get("default.user.tenant"))
+USER_PHONE = str(os.environ.get("PYDS_USER_PHONE", _configs.get("default.user.phone")))
 USER_STATE = get_int(
-    os.environ.get("PYDS_USER_STATE", configs.get("default.user.state"))
+    os.environ.get("PYDS_USER_STATE", _configs.get("default.user.state"))
 )
 
 # Workflow Settings
 WORKFLOW_PROJECT = os.environ.get(
-    "PYDS_WORKFLOW_PROJECT", configs.get("default.workflow.project")
+    "PYDS_WORKFLOW_PROJECT", _configs.get("default.workflow.project")
 )
 WORKFLOW_USER = os.environ.get(
-    "PYDS_WORKFLOW_USER", configs.get("default.workflow.user")
+    "PYDS_WORKFLOW_USER", _configs.get("default.workflow.user")
 )
 WORKFLOW_QUEUE = os.environ.get(
-    "PYDS_WORKFLOW_QUEUE", configs.get("default.workflow.queue")
+    "PYDS_WORKFLOW_QUEUE", _configs.get("default.workflow.queue")
 )
 WORKFLOW_RELEASE_STATE = os.environ.get(
-    "PYDS_WORKFLOW_RELEASE_STATE", configs.get("default.workflow.release_state")
+    "PYDS_WORKFLOW_RELEASE_STATE", _configs.get("default.workflow.release_state")
 )
 WORKFLOW_WORKER_GROUP = os.environ.get(
-    "PYDS_WORKFLOW_WORKER_GROUP", configs.get("default.workflow.worker_group")
+    "PYDS_WORKFLOW_WORKER_GROUP", _configs.get("default.workflow.worker_group")
 )
 WORKFLOW_TIME_ZONE = os.environ.get(
-    "PYDS_WORKFLOW_TIME_ZONE", configs.get("default.workflow.time_zone")
+    "PYDS_WORKFLOW_TIME_ZONE", _configs.get("default.workflow.time_zone")
 )
 WORKFLOW_WARNING_TYPE = os.environ.get(
-    "PYDS_WORKFLOW_WARNING_TYPE", configs.get("default.workflow.warning_type")
+    "PYDS_WORKFLOW_WARNING_TYPE", _configs.get("default.workflow.warning_type")
 )
 WORKFLOW_EXECUTION_TYPE = os.environ.get(
-    "PYDS_WORKFLOW_EXECUTION_TYPE", configs.get("default.workflow.execution_type")
+    "PYDS_WORKFLOW_EXECUTION_TYPE", _configs.get("default.workflow.execution_type")
+)
+WORKFLOW_SKIP_UNCHANGED = get_bool(
+    os.environ.get(
+        "PYDS_WORKFLOW_SKIP_UNCHANGED", _configs.get("default.workflow.skip_unchanged")
+    )
+)
+WORKFLOW_JSON_ENCODER = os.environ.get(
+    "PYDS_WORKFLOW_JSON_ENCODER", _configs.get("default.workflow.json_encoder")
 )
 
 # End Common Configuration Setting
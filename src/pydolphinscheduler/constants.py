@@ -144,3 +144,19 @@ class Keyword(str):
 
     DATASOURCE_ID = "id"
     DATASOURCE_TYPE = "type"
+
+
+class SubmitMode(str):
+    """Constants for workflow submit mode."""
+
+    FULL = "full"
+    INCREMENTAL = "incremental"
+
+
+class JsonEncoder(str):
+    """Constants for JSON encoder of workflow definition."""
+
+    AUTO = "auto"
+    ORJSON = "orjson"
+    UJSON = "ujson"
+    JSON = "json"
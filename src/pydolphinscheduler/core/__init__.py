@@ -19,10 +19,12 @@
 
 from pydolphinscheduler.core.engine import Engine
 from pydolphinscheduler.core.task import Task
-from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.core.workflow import SubmitResult, Workflow, submit_many
 
 __all__ = [
     "Engine",
     "Workflow",
     "Task",
+    "SubmitResult",
+    "submit_many",
 ]
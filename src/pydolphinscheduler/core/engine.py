@@ -21,9 +21,15 @@ from __future__ import annotations
 
 from py4j.protocol import Py4JJavaError
 
+from pydolphinscheduler import configuration
+from pydolphinscheduler.core.offline import Placeholder, is_offline
 from pydolphinscheduler.core.task import BatchTask
 from pydolphinscheduler.exceptions import PyDSParamException
 from pydolphinscheduler.java_gateway import gateway
+from pydolphinscheduler.utils.cache import TTLCache
+
+# Resource info of main package, keyed by ``(program_type, main_package)`` and shared by all engine tasks
+engine_resource_cache = TTLCache(configuration.CACHE_ENGINE_RESOURCE_TTL)
 
 
 class ProgramType(str):
@@ -55,21 +61,45 @@ class Engine(BatchTask):
         self.main_class = main_class
         self.main_package = main_package
         self.program_type = program_type
-        self._resource = {}
+
+    @staticmethod
+    def _query_resource_info(program_type, main_package):
+        try:
+            return gateway.get_resources_file_info(program_type, main_package)
+        # Handler source do not exists error, for now we just terminate the process.
+        except Py4JJavaError as ex:
+            raise PyDSParamException(str(ex.java_exception))
 
     def get_resource_info(self, program_type, main_package):
-        """Get resource info from java gateway, contains resource id, name."""
-        if self._resource:
-            return self._resource
-        else:
-            try:
-                self._resource = gateway.get_resources_file_info(
-                    program_type, main_package
-                )
-            # Handler source do not exists error, for now we just terminate the process.
-            except Py4JJavaError as ex:
-                raise PyDSParamException(str(ex.java_exception))
-            return self._resource
+        """Get resource info from java gateway, contains resource id, name.
+
+        The result is cached in :data:`engine_resource_cache`, so engine tasks sharing the same main package
+        only query the Java gateway once.
+        """
+        if is_offline():
+            key = (program_type, main_package)
+            return {"id": Placeholder(Placeholder.ENGINE_RESOURCE, key, "id")}
+        return engine_resource_cache.get_or_set(
+            (program_type, main_package),
+            lambda: self._query_resource_info(program_type, main_package),
+        )
+
+    @classmethod
+    def prefetch(cls, tasks: list[Engine]) -> None:
+        """Override Task.prefetch, query main package resource info of all tasks in one batch."""
+        super().prefetch(tasks)
+        if not engine_resource_cache.enabled:
+            return
+        keys = {(task.program_type, task.main_package) for task in tasks}
+        missing = [key for key in keys if key not in engine_resource_cache]
+        if not missing:
+            return
+        try:
+            infos = gateway.get_resources_file_info_batch(missing)
+        except Py4JJavaError as ex:
+            raise PyDSParamException(str(ex.java_exception))
+        for key, info in zip(missing, infos):
+            engine_resource_cache.set(key, info)
 
     def get_jar_id(self) -> int:
         """Get jar id from java gateway, a wrapper for :func:`get_resource_info`."""
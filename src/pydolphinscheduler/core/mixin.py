@@ -26,7 +26,8 @@ class WorkerResourceMixin:
         self._cpu_quota = kwargs.get("cpu_quota", -1)
         self._memory_max = kwargs.get("memory_max", -1)
         if hasattr(self, "_DEFINE_ATTR"):
-            self._DEFINE_ATTR |= {"cpu_quota", "memory_max"}
+            # do not update set in place, it is shared by all tasks of the same class
+            self._DEFINE_ATTR = self._DEFINE_ATTR | {"cpu_quota", "memory_max"}
 
     @property
     def cpu_quota(self):
@@ -0,0 +1,194 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Offline compile workflows to artifacts without Java gateway.
+
+In offline mode, tasks get provisional codes like :param:`bulk_code_allocation` of workflow does, and all
+values resolved by Java gateway, such as environment code and datasource id, are replaced with
+:class:`Placeholder`. Workflow :func:`submit` writes its artifact into the output directory instead of
+calling Java gateway, and :mod:`pydolphinscheduler.core.push` resolves the placeholders in batch and submits
+the artifacts later.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import json
+from collections.abc import Iterable, Iterator
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from pydolphinscheduler import __version__
+from pydolphinscheduler.exceptions import PyDSParamException
+
+logger = getLogger(__name__)
+
+# Version of artifact layout, increase it when the layout changed
+ARTIFACT_FORMAT = 1
+ARTIFACT_SUFFIX = ".json"
+# Artifact in compact binary format, JSON compressed by gzip
+COMPRESSED_ARTIFACT_SUFFIX = ".json.gz"
+
+
+class Placeholder(str):
+    """Value resolved by Java gateway when workflow pushed, used in place of it in offline mode.
+
+    It is a string with prefix :data:`PREFIX` and a JSON array of its kind, key and field, so it could be
+    hashed, sorted and encoded to JSON just like a normal string.
+
+    :param kind: Kind of placeholder, decide how to resolve it, one of constants in this class.
+    :param key: Key to query the value from Java gateway, such as environment name.
+    :param field: Field of query result, for the query returns multiple values.
+    """
+
+    PREFIX = "$PYDS"
+
+    ENVIRONMENT = "environment"
+    DATASOURCE = "datasource"
+    DEPENDENT = "dependent"
+    RESOURCE = "resource"
+    ENGINE_RESOURCE = "engine_resource"
+    WORKFLOW = "workflow"
+
+    def __new__(cls, kind: str, key: tuple | list, field: str | None = None):
+        """Create placeholder string from its kind, key and field."""
+        body = json.dumps([kind, list(key), field], separators=(",", ":"))
+        return super().__new__(cls, f"{cls.PREFIX}{body}")
+
+    @classmethod
+    def parse(cls, value: Any) -> tuple[str, tuple, str | None] | None:
+        """Parse value to tuple of kind, key and field, return ``None`` if it is not a placeholder."""
+        if not isinstance(value, str) or not value.startswith(f"{cls.PREFIX}["):
+            return None
+        kind, key, field = json.loads(value[len(cls.PREFIX) :])
+        return kind, tuple(key), field
+
+
+class OfflineCompiler:
+    """Write artifacts of workflows submitted in offline mode into :param:`output`.
+
+    :param output: Directory to write artifacts, each workflow in path ``<user>/<project>/<name>.json``.
+    :param compress: Whether write artifacts compressed by gzip or not, with suffix ``.json.gz``.
+    """
+
+    def __init__(self, output: str | Path, compress: bool | None = False):
+        self.output = Path(output)
+        self.compress = compress
+        self.artifacts: list[Path] = []
+
+    def artifact_path(self, user: str, project: str, name: str) -> Path:
+        """Get path of workflow artifact, names are quoted so they are safe as file name."""
+        return self.output.joinpath(
+            quote(user, safe=""),
+            quote(project, safe=""),
+            quote(name, safe="")
+            + (COMPRESSED_ARTIFACT_SUFFIX if self.compress else ARTIFACT_SUFFIX),
+        )
+
+    def write(self, artifact: dict) -> Path:
+        """Write artifact of workflow and return its path."""
+        path = self.artifact_path(
+            artifact["user"], artifact["project"], artifact["name"]
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = json.dumps(artifact, ensure_ascii=False).encode("utf-8")
+        path.write_bytes(gzip.compress(content) if self.compress else content)
+        if path not in self.artifacts:
+            self.artifacts.append(path)
+        logger.info("Workflow %s compiled to %s.", artifact["name"], path)
+        return path
+
+
+_compiler: OfflineCompiler | None = None
+
+
+@contextlib.contextmanager
+def offline(
+    output: str | Path, compress: bool | None = False
+) -> Iterator[OfflineCompiler]:
+    """Enable offline mode in the context, workflows submitted are compiled into :param:`output`.
+
+    See :class:`OfflineCompiler` for parameters.
+
+    .. code-block:: python
+
+        with offline("build") as compiler:
+            with Workflow("workflow") as workflow:
+                Shell(name="task", command="echo 1")
+                workflow.submit()
+        print(compiler.artifacts)
+    """
+    global _compiler
+    if _compiler is not None:
+        raise PyDSParamException("Offline mode is already enabled, can not be nested.")
+    _compiler = OfflineCompiler(output, compress)
+    try:
+        yield _compiler
+    finally:
+        _compiler = None
+
+
+def is_offline() -> bool:
+    """Whether offline mode is enabled or not."""
+    return _compiler is not None
+
+
+def get_compiler() -> OfflineCompiler:
+    """Get compiler of current offline mode."""
+    if _compiler is None:
+        raise PyDSParamException("Offline mode is not enabled.")
+    return _compiler
+
+
+def find_artifacts(paths: Iterable[str | Path]) -> list[Path]:
+    """Find artifacts in paths, directory is searched recursively for both JSON and compressed artifacts."""
+    artifacts = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            artifacts.extend(
+                sorted(
+                    file
+                    for file in path.rglob("*")
+                    if file.is_file()
+                    and file.name.endswith(
+                        (ARTIFACT_SUFFIX, COMPRESSED_ARTIFACT_SUFFIX)
+                    )
+                )
+            )
+        else:
+            artifacts.append(path)
+    return artifacts
+
+
+def load_artifact(path: str | Path) -> dict:
+    """Load workflow artifact from JSON or compressed file, check its format is supported."""
+    content = Path(path).read_bytes()
+    if str(path).endswith(".gz"):
+        content = gzip.decompress(content)
+    artifact = json.loads(content.decode("utf-8"))
+    if artifact.get("format") != ARTIFACT_FORMAT:
+        raise PyDSParamException(
+            "Artifact %s format %s is not supported, recompile it with pydolphinscheduler %s.",
+            str(path),
+            artifact.get("format"),
+            __version__,
+        )
+    return artifact
@@ -0,0 +1,372 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Push workflow artifacts compiled by :mod:`pydolphinscheduler.core.offline` to Java gateway."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable
+
+from pydolphinscheduler import configuration
+from pydolphinscheduler.core.offline import Placeholder, find_artifacts, load_artifact
+from pydolphinscheduler.core.resource import Resource
+from pydolphinscheduler.core.workflow import workflow_code_cache
+from pydolphinscheduler.exceptions import PyDSParamException
+from pydolphinscheduler.java_gateway import gateway
+from pydolphinscheduler.models import Project, User
+from pydolphinscheduler.utils import json_encoder
+from pydolphinscheduler.utils.batch import run_shared, split_waves
+
+logger = getLogger(__name__)
+
+# Keys in task definition and task relation whose value are task codes, or list of task codes
+TASK_CODE_KEYS = {
+    "code",
+    "preTaskCode",
+    "postTaskCode",
+    "depTaskCode",
+    "successNode",
+    "failedNode",
+    "nextNode",
+}
+
+# Query placeholders of each kind from Java gateway in batch, and get the value of field from the result
+_RESOLVERS: dict[
+    str, tuple[Callable[[list[tuple]], list], Callable[[Any, str], Any]]
+] = {
+    Placeholder.ENVIRONMENT: (
+        lambda keys: gateway.query_environment_info_batch([key[0] for key in keys]),
+        lambda result, attr: result,
+    ),
+    Placeholder.DATASOURCE: (
+        lambda keys: gateway.get_datasource_batch(keys),
+        lambda result, attr: (
+            result.getId() if attr == "id" else result.getType().getDescp().upper()
+        ),
+    ),
+    Placeholder.DEPENDENT: (
+        lambda keys: gateway.get_dependent_info_batch(keys),
+        lambda result, attr: result.get(attr),
+    ),
+    Placeholder.RESOURCE: (
+        lambda keys: gateway.query_resources_file_info_batch(keys),
+        lambda result, attr: result.getFullName(),
+    ),
+    Placeholder.ENGINE_RESOURCE: (
+        lambda keys: gateway.get_resources_file_info_batch(keys),
+        lambda result, attr: result.get(attr),
+    ),
+    Placeholder.WORKFLOW: (
+        lambda keys: gateway.get_workflow_info_batch(keys),
+        lambda result, attr: result.get("code"),
+    ),
+}
+
+
+def _workflow_key(artifact: dict) -> tuple[str, str, str]:
+    return artifact["user"], artifact["project"], artifact["name"]
+
+
+def collect_placeholders(value: Any) -> set[Placeholder]:
+    """Collect all placeholders in value of artifact recursively."""
+    if isinstance(value, dict):
+        return set().union(*(collect_placeholders(val) for val in value.values()))
+    if isinstance(value, list):
+        return set().union(*(collect_placeholders(val) for val in value))
+    if Placeholder.parse(value) is not None:
+        return {value}
+    return set()
+
+
+def resolve_placeholders(
+    placeholders: Iterable[str], errors: dict[str, BaseException] | None = None
+) -> dict[str, Any]:
+    """Resolve placeholders from Java gateway, placeholders of the same kind and key are queried once.
+
+    :param placeholders: Placeholders to be resolved.
+    :param errors: Record errors of placeholders into it instead of raising if given. When querying a kind
+        of placeholders in batch failed, each key of it is queried alone, so the error is only recorded to
+        placeholders of the failed key.
+    :return: Mapping from placeholder to its value, placeholders not found in Java gateway or failed are
+        not included.
+    """
+    keys_by_kind: dict[str, dict[tuple, list[tuple[str, str | None]]]] = {}
+    for placeholder in placeholders:
+        kind, key, attr = Placeholder.parse(placeholder)
+        if kind not in _RESOLVERS:
+            error = PyDSParamException("Placeholder %s is not supported.", placeholder)
+            if errors is None:
+                raise error
+            errors[placeholder] = error
+            continue
+        keys_by_kind.setdefault(kind, {}).setdefault(key, []).append(
+            (placeholder, attr)
+        )
+
+    values = {}
+    for kind, keys in keys_by_kind.items():
+        query, extract = _RESOLVERS[kind]
+        try:
+            results = list(zip(keys, query(list(keys))))
+        except Exception:
+            if errors is None:
+                raise
+            results = []
+            for key in keys:
+                try:
+                    results.append((key, query([key])[0]))
+                except Exception as ex:  # noqa: BLE001
+                    errors.update((placeholder, ex) for placeholder, _ in keys[key])
+        for key, result in results:
+            if result is None:
+                continue
+            for placeholder, attr in keys[key]:
+                values[placeholder] = extract(result, attr)
+    return values
+
+
+def push_waves(artifacts: list[dict]) -> list[list[dict]]:
+    """Split artifacts into waves, workflow is in a later wave than all its sub workflows in the same batch.
+
+    Artifacts in the same wave could be pushed concurrently. Workflows in a sub workflow reference cycle can
+    not be ordered, and are put in the last wave.
+    """
+
+    def depends(artifact: dict) -> Iterable[tuple[str, str, str]]:
+        for placeholder in collect_placeholders(artifact["taskDefinitionJson"]):
+            kind, key, _ = Placeholder.parse(placeholder)
+            if kind == Placeholder.WORKFLOW:
+                yield key
+
+    return split_waves(artifacts, _workflow_key, depends)
+
+
+def _replace(value: Any, values: dict[str, Any], codes: dict[int, int], key=None):
+    """Replace placeholders and provisional task codes in value of artifact recursively."""
+    if isinstance(value, dict):
+        return {k: _replace(v, values, codes, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_replace(v, values, codes, key) for v in value]
+    if isinstance(value, str) and value in values:
+        return values[value]
+    if key in TASK_CODE_KEYS and isinstance(value, int) and value in codes:
+        return codes[value]
+    return value
+
+
+def push_artifact(artifact: dict, values: dict[str, Any]) -> int:
+    """Push one artifact to Java gateway, assume its side models and resources exist.
+
+    :param artifact: Artifact of workflow, see :func:`pydolphinscheduler.core.workflow.Workflow.to_artifact`.
+    :param values: Value of placeholders in artifact, see :func:`resolve_placeholders`. Placeholders of
+        workflows pushed in the same process are resolved by the codes they returned.
+    """
+    user, project, name = _workflow_key(artifact)
+    provisional = artifact["provisionalCodes"]
+    codes, versions = {}, {}
+    task_names = list(provisional)
+    results = (
+        gateway.get_code_and_version_batch(project, name, task_names)
+        if task_names
+        else []
+    )
+    for task_name, result in zip(task_names, results):
+        code = result.get("code")
+        codes[provisional[task_name]] = code
+        versions[code] = result.get("version")
+
+    values = dict(values)
+    for placeholder in collect_placeholders(artifact["taskDefinitionJson"]):
+        kind, key, _ = Placeholder.parse(placeholder)
+        if kind == Placeholder.WORKFLOW and placeholder not in values:
+            code = workflow_code_cache.get(key)
+            if code is not None:
+                values[placeholder] = code
+            else:
+                values.update(resolve_placeholders([placeholder]))
+
+    unresolved = collect_placeholders(artifact["taskDefinitionJson"]) - set(values)
+    if unresolved:
+        raise PyDSParamException(
+            "Can not resolve placeholders %s from Java gateway.",
+            ", ".join(sorted(unresolved)),
+        )
+    definitions = _replace(artifact["taskDefinitionJson"], values, codes)
+    for define in definitions:
+        if define.get("code") in versions:
+            define["version"] = versions[define["code"]]
+    relations = _replace(artifact["taskRelationJson"], values, codes)
+    schedule = artifact["schedule"]
+    code = gateway.create_or_update_workflow(
+        user,
+        project,
+        name,
+        artifact["description"],
+        json_encoder.dumps(artifact["globalParams"]),
+        artifact["warningType"],
+        artifact["warningGroupId"],
+        artifact["executionType"],
+        artifact["timeout"],
+        artifact["workerGroup"],
+        artifact["releaseState"],
+        json_encoder.dumps(relations),
+        json_encoder.dumps(definitions),
+        json_encoder.dumps(schedule) if schedule else None,
+        artifact["onlineSchedule"],
+        None,
+    )
+    workflow_code_cache.set((user, project, name), code)
+    logger.info("Workflow %s pushed with code %s.", name, code)
+    return code
+
+
+@dataclass
+class PushResult:
+    """Result of pushing one artifact by :func:`push`.
+
+    :param path: Path of artifact.
+    :param code: Workflow code returned by Java gateway, ``None`` if push failed.
+    :param error: Error raised when loading or pushing artifact, ``None`` if push succeed.
+    """
+
+    path: Path
+    code: int | None = None
+    error: BaseException | None = None
+    artifact: dict | None = field(default=None, repr=False)
+
+    @property
+    def success(self) -> bool:
+        """Whether artifact is pushed successfully or not."""
+        return self.error is None
+
+
+def push(
+    paths: Iterable[str | Path], max_workers: int | None = None
+) -> list[PushResult]:
+    """Push workflow artifacts to Java gateway concurrently, without importing Python code of workflows.
+
+    Comparing to submit workflows, it
+
+    * ensures the side models, user, tenant and project, exist only once for each distinct one;
+    * creates or updates the same resource only once even if it is used by multiple artifacts;
+    * resolves placeholders of all artifacts in one batch for each kind;
+    * pushes artifacts concurrently in threads, workflows referenced by task sub workflow of others are
+      pushed first, so their codes are reused without query.
+
+    Error of one artifact do not affect others, it will be recorded in :class:`PushResult` instead of
+    raising.
+
+    .. code-block:: python
+
+        from pydolphinscheduler.core.push import push
+
+        for result in push(["build"]):
+            print(result.path, result.code, result.error)
+
+    :param paths: Artifact files, or directories contain artifacts in JSON or compressed by gzip.
+    :param max_workers: Max number of threads push artifacts concurrently, default is the Java gateway
+        connection pool size.
+    :return: Push results, in the same order as artifacts found in :param:`paths`.
+    """
+    results = [PushResult(path=path) for path in find_artifacts(paths)]
+    for result in results:
+        try:
+            result.artifact = load_artifact(result.path)
+        except Exception as ex:  # noqa: BLE001
+            result.error = ex
+    pending = [result for result in results if result.success]
+
+    users: dict[str, list[PushResult]] = {}
+    projects: dict[tuple[str, str], list[PushResult]] = {}
+    for result in pending:
+        user, project = result.artifact["user"], result.artifact["project"]
+        users.setdefault(user, []).append(result)
+        projects.setdefault((user, project), []).append(result)
+    for user, shared in users.items():
+        run_shared(shared, lambda _, u=user: User(name=u).ensure_exists())
+    for (user, project), shared in projects.items():
+        run_shared(
+            shared, lambda _, u=user, p=project: Project(name=p).ensure_exists(u)
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or configuration.JAVA_GATEWAY_POOL_SIZE
+    ) as executor:
+        # resources should be created before resolving their fullname
+        resources: dict[tuple[str, str, str], list[PushResult]] = {}
+        resource_objs: dict[tuple[str, str, str], Resource] = {}
+        for result in pending:
+            if not result.success:
+                continue
+            user = result.artifact["user"]
+            for res in result.artifact["resources"]:
+                key = (user, res["name"], res["content"])
+                resources.setdefault(key, []).append(result)
+                resource_objs.setdefault(key, Resource(user_name=user, **res))
+        list(
+            executor.map(
+                lambda key: run_shared(
+                    resources[key],
+                    lambda _: resource_objs[key].create_or_update_resource(),
+                ),
+                resource_objs,
+            )
+        )
+
+        pending = [result for result in pending if result.success]
+        placeholders = {
+            id(result): collect_placeholders(result.artifact["taskDefinitionJson"])
+            for result in pending
+        }
+        # placeholders of workflows in this batch are resolved by the codes they returned when pushed
+        in_batch = {
+            (Placeholder.WORKFLOW, _workflow_key(result.artifact)) for result in pending
+        }
+        errors: dict[str, BaseException] = {}
+        values = resolve_placeholders(
+            (
+                placeholder
+                for placeholder in set().union(*placeholders.values())
+                if Placeholder.parse(placeholder)[:2] not in in_batch
+            ),
+            errors,
+        )
+        # error of placeholder only affects artifacts referencing it
+        for result in pending:
+            failed = sorted(placeholders[id(result)].intersection(errors))
+            if failed:
+                result.error = errors[failed[0]]
+        pending = [result for result in pending if result.success]
+
+        by_artifact = {id(result.artifact): result for result in pending}
+
+        def push_one(artifact: dict) -> None:
+            result = by_artifact[id(artifact)]
+            try:
+                result.code = push_artifact(artifact, values)
+            except Exception as ex:  # noqa: BLE001
+                result.error = ex
+
+        for wave in push_waves([result.artifact for result in pending]):
+            list(executor.map(push_one, wave))
+    return results
@@ -19,9 +19,15 @@
 
 from __future__ import annotations
 
+from pydolphinscheduler import configuration
+from pydolphinscheduler.core.offline import Placeholder, is_offline
 from pydolphinscheduler.exceptions import PyDSParamException
 from pydolphinscheduler.java_gateway import gateway
 from pydolphinscheduler.models import Base
+from pydolphinscheduler.utils.cache import TTLCache
+
+# Process level cache of resource fullname, keyed by (user_name, name)
+resource_fullname_cache = TTLCache(configuration.CACHE_RESOURCE_TTL)
 
 
 class Resource(Base):
@@ -56,8 +62,29 @@ class Resource(Base):
         return gateway.query_resources_file_info(self.user_name, self.name)
 
     def get_fullname_from_database(self):
-        """Get resource fullname from java gateway."""
-        return self.get_info_from_database().getFullName()
+        """Get resource fullname from java gateway, cached in :data:`resource_fullname_cache`."""
+        if is_offline():
+            return Placeholder(Placeholder.RESOURCE, (self.user_name, self.name))
+        return resource_fullname_cache.get_or_set(
+            (self.user_name, self.name),
+            lambda: self.get_info_from_database().getFullName(),
+        )
+
+    @classmethod
+    def prefetch_fullnames(cls, keys: set[tuple[str, str]]) -> None:
+        """Query fullname of all resources not in :data:`resource_fullname_cache` in one batch.
+
+        :param keys: Set of resource ``(user_name, name)``.
+        """
+        if not resource_fullname_cache.enabled:
+            return
+        missing = [key for key in keys if key not in resource_fullname_cache]
+        if not missing:
+            return
+        infos = gateway.query_resources_file_info_batch(missing)
+        for key, info in zip(missing, infos):
+            if info is not None:
+                resource_fullname_cache.set(key, info.getFullName())
 
     def create_or_update_resource(self):
         """Create or update resource via java gateway."""
@@ -0,0 +1,124 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Local index of workflows content hash, used to skip submitting unchanged workflows."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+
+from pydolphinscheduler import configuration
+from pydolphinscheduler.utils import file
+
+logger = getLogger(__name__)
+
+SUBMIT_INDEX_FILE = "submit_index.json"
+
+
+class SubmitIndex:
+    """On disk index of workflows content hash and code of their last successful submit.
+
+    The index file is a JSON object with key of workflow identity and value of its content hash and code,
+    it will be loaded lazily at the first time it is used. The file could be shared by many processes, so
+    each change re-reads it and writes back under a lock across processes, to keep entries written by
+    others.
+
+    :param path: Path of the index file, default is ``submit_index.json`` under ``PYDS_HOME``.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self._path = Path(path) if path else None
+        self._entries: dict[str, dict] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Get path of the index file."""
+        return self._path or configuration.pyds_home().joinpath(SUBMIT_INDEX_FILE)
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning("Submit index %s is corrupted, ignore it.", self.path)
+            return {}
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    @contextmanager
+    def _update(self) -> Iterator[dict[str, dict]]:
+        """Re-read the index file under lock, and write it back after entries changed in the context."""
+        with self._lock, file.lock(self.path.with_name(f"{self.path.name}.lock")):
+            self._entries = self._read()
+            yield self._entries
+            self._dump()
+
+    def _dump(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to temporary file and replace, so other processes never read half written file
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self._entries, sort_keys=True))
+        os.replace(tmp, self.path)
+
+    def get(self, key: str, digest: str) -> int | None:
+        """Get workflow code if its content hash is the same as the :param:`digest`, otherwise ``None``."""
+        entry = self.get_entry(key)
+        if entry is None or entry.get("hash") != digest:
+            return None
+        return entry.get("code")
+
+    def get_entry(self, key: str) -> dict | None:
+        """Get the whole entry of workflow recorded in last submit, ``None`` if it is never recorded."""
+        with self._lock:
+            return self._load().get(key)
+
+    def set(
+        self, key: str, digest: str, code: int, snapshot: dict | None = None
+    ) -> None:
+        """Record workflow content hash and code after it submitted successfully.
+
+        :param snapshot: Snapshot of tasks and task relations in workflow, used by incremental submit to
+            find out the difference, see :class:`pydolphinscheduler.core.workflow_diff.WorkflowDiff`.
+        """
+        entry = {"hash": digest, "code": code}
+        if snapshot is not None:
+            entry["snapshot"] = snapshot
+        with self._update() as entries:
+            entries[key] = entry
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove single workflow from the index, or all workflows when :param:`key` is ``None``."""
+        with self._update() as entries:
+            if key is None:
+                entries.clear()
+            else:
+                entries.pop(key, None)
+
+
+submit_index = SubmitIndex()
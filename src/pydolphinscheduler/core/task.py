@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import copy
+import functools
 import types
 import warnings
 from collections.abc import Sequence
@@ -36,6 +37,7 @@ from pydolphinscheduler.constants import (
     TaskPriority,
     TaskTimeoutFlag,
 )
+from pydolphinscheduler.core.offline import Placeholder, is_offline
 from pydolphinscheduler.core.parameter import BaseDataType, Direction, ParameterHelper
 from pydolphinscheduler.core.resource import Resource
 from pydolphinscheduler.core.resource_plugin import ResourcePlugin
@@ -43,10 +45,22 @@ from pydolphinscheduler.core.workflow import Workflow, WorkflowContext
 from pydolphinscheduler.exceptions import PyDSParamException, PyResPluginException
 from pydolphinscheduler.java_gateway import gateway
 from pydolphinscheduler.models import Base
+from pydolphinscheduler.utils.cache import TTLCache
 from pydolphinscheduler.utils.date import timedelta2timeout
 
 logger = getLogger(__name__)
 
+# Process level cache of environment code, keyed by environment name
+environment_cache = TTLCache(configuration.CACHE_ENVIRONMENT_TTL)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_task_attr(
+    default: frozenset[str], ignore: frozenset[str], custom: frozenset[str]
+) -> frozenset[str]:
+    """Combine task params attributes, see :func:`Task._get_attr`."""
+    return (default - ignore) | custom
+
 
 class TaskRelation(Base):
     """TaskRelation object, describe the relation of exactly two tasks."""
@@ -292,7 +306,7 @@ class Task(Base):
                     stacklevel=2,
                 )
                 resources.add(res.get(ResourceKey.NAME))
-        return [{ResourceKey.NAME: r} for r in resources]
+        return [{ResourceKey.NAME: r} for r in sorted(resources)]
 
     @property
     def user_name(self) -> str | None:
@@ -312,16 +326,17 @@ class Task(Base):
         """Set attribute condition_result."""
         self._condition_result = condition_result
 
-    def _get_attr(self) -> set[str]:
+    def _get_attr(self) -> frozenset[str]:
         """Get final task task_params attribute.
 
         Base on `_task_default_attr`, append attribute from `_task_custom_attr` and subtract attribute from
-        `_task_ignore_attr`.
+        `_task_ignore_attr`. The result is cached by the content of these attributes.
         """
-        attr = copy.deepcopy(self._task_default_attr)
-        attr -= self._task_ignore_attr
-        attr |= self._task_custom_attr
-        return attr
+        return _compile_task_attr(
+            frozenset(self._task_default_attr),
+            frozenset(self._task_ignore_attr),
+            frozenset(self._task_custom_attr),
+        )
 
     @property
     def task_params(self) -> dict | None:
@@ -434,13 +449,19 @@ class Task(Base):
         """Set parameter tasks as downstream to current task."""
         self._set_deps(tasks, upstream=False)
 
-    # TODO code should better generate in bulk mode when :ref: workflow run submit or start
     def gen_code_and_version(self) -> tuple:
         """Generate task code and version from java gateway.
 
         If task name do not exists in workflow before, if will generate new code and version id
         equal to 0 by java gateway, otherwise if will return the exists code and version.
+
+        When workflow enable ``bulk_code_allocation`` or in offline mode, it will return a local provisional
+        code and ``None`` as version, which will be resolved by :func:`Workflow.resolve_task_codes` in batch.
         """
+        if self.workflow is not None and (
+            self.workflow.bulk_code_allocation or is_offline()
+        ):
+            return self.workflow.gen_provisional_code(self.name), None
         # TODO get code from specific project workflow and task name
         result = gateway.get_code_and_version(
             self.workflow._project, self.workflow.name, self.name
@@ -451,10 +472,38 @@ class Task(Base):
 
     @property
     def environment_code(self) -> str:
-        """Convert environment name to code."""
+        """Convert environment name to code, cached in :data:`environment_cache`."""
         if self._environment_name is None:
             return None
-        return gateway.query_environment_info(self._environment_name)
+        if is_offline():
+            return Placeholder(Placeholder.ENVIRONMENT, (self._environment_name,))
+        return environment_cache.get_or_set(
+            self._environment_name,
+            lambda: gateway.query_environment_info(self._environment_name),
+        )
+
+    @classmethod
+    def prefetch(cls, tasks: list[Task]) -> None:
+        """Resolve information of tasks from Java gateway in batch and cache them before serialization.
+
+        It is called by :func:`Workflow.prefetch` with all tasks of this class in workflow, subclasses
+        could override it to prefetch their own information, and should call ``super().prefetch``.
+        """
+        names = {task._environment_name for task in tasks} - {None}
+        missing = [name for name in names if name not in environment_cache]
+        if missing and environment_cache.enabled:
+            codes = gateway.query_environment_info_batch(missing)
+            for name, code in zip(missing, codes):
+                environment_cache.set(name, code)
+
+        Resource.prefetch_fullnames(
+            {
+                (task.user_name, res)
+                for task in tasks
+                for res in task._resource_list
+                if isinstance(res, str)
+            }
+        )
 
     @property
     def local_params(self):
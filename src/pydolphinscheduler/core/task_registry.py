@@ -0,0 +1,91 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Registry of task types, resolve task class by its type name case-insensitively.
+
+Built-in tasks in :mod:`pydolphinscheduler.tasks` and third-party tasks registered by entry points in group
+:data:`ENTRY_POINT_GROUP` are both registered. For example, a third-party package could register its task
+``MyTask`` in its ``setup.cfg`` as below, and use it in YAML file by ``task_type: MyTask``.
+
+.. code-block:: ini
+
+    [options.entry_points]
+    pydolphinscheduler.tasks =
+        MyTask = my_package.tasks:MyTask
+
+Task modules are imported only when their task type is first resolved.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from importlib import metadata
+from typing import Callable
+
+from pydolphinscheduler import tasks
+from pydolphinscheduler.core.task import Task
+from pydolphinscheduler.exceptions import PyDSTaskNoFoundException
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "pydolphinscheduler.tasks"
+
+
+def _entry_points() -> list[metadata.EntryPoint]:
+    """Get entry points in group :data:`ENTRY_POINT_GROUP`, compatible with Python 3.9."""
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=ENTRY_POINT_GROUP))
+    return list(entry_points.get(ENTRY_POINT_GROUP, []))
+
+
+@functools.cache
+def registry() -> dict[str, Callable[[], type[Task]]]:
+    """Get loader of each task type keyed by its lower case name, built once in each process.
+
+    Built-in tasks take precedence over entry points with the same name.
+    """
+    loaders = {
+        name.lower(): functools.partial(getattr, tasks, name) for name in tasks.__all__
+    }
+    for entry_point in _entry_points():
+        if entry_point.name.lower() in loaders:
+            logger.warning(
+                "Task type %s registered by entry point %s conflicts with existing one, ignore it.",
+                entry_point.name,
+                entry_point.value,
+            )
+            continue
+        loaders[entry_point.name.lower()] = entry_point.load
+    return loaders
+
+
+@functools.cache
+def _load(key: str) -> type[Task]:
+    task_cls = registry()[key]()
+    if not (isinstance(task_cls, type) and issubclass(task_cls, Task)):
+        raise PyDSTaskNoFoundException(f"task type {key} is not a task class")
+    return task_cls
+
+
+def get_task_cls(task_type: str) -> type[Task]:
+    """Get the task class by task type, case insensitive."""
+    key = task_type.lower()
+    if key not in registry():
+        raise PyDSTaskNoFoundException(f"cant not find task {task_type}")
+    return _load(key)
@@ -19,17 +19,30 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from logging import getLogger
+from pathlib import Path
 from typing import Any
 
-from pydolphinscheduler import configuration
-from pydolphinscheduler.constants import Symbol, TaskType
+from pydolphinscheduler import __version__, configuration
+from pydolphinscheduler.constants import SubmitMode, Symbol, TaskType
+from pydolphinscheduler.core.offline import ARTIFACT_FORMAT, get_compiler, is_offline
 from pydolphinscheduler.core.resource import Resource
 from pydolphinscheduler.core.resource_plugin import ResourcePlugin
+from pydolphinscheduler.core.submit_index import submit_index
+from pydolphinscheduler.core.workflow_diff import WorkflowDiff
 from pydolphinscheduler.exceptions import PyDSParamException, PyDSTaskNoFoundException
-from pydolphinscheduler.java_gateway import gateway
+from pydolphinscheduler.java_gateway import async_gateway, gateway
 from pydolphinscheduler.models import Base, Project, User
+from pydolphinscheduler.utils import json_encoder
+from pydolphinscheduler.utils.batch import run_shared, split_waves
+from pydolphinscheduler.utils.cache import TTLCache
 from pydolphinscheduler.utils.date import (
     MAX_DATETIME,
     conv_from_str,
@@ -37,6 +50,12 @@ from pydolphinscheduler.utils.date import (
     timedelta2timeout,
 )
 
+logger = getLogger(__name__)
+
+# Workflow code keyed by ``(user_name, project_name, workflow_name)``, filled when workflow is submitted
+# and used to resolve code of task sub workflow
+workflow_code_cache = TTLCache(configuration.CACHE_WORKFLOW_CODE_TTL)
+
 
 class WorkflowContext:
     """Class workflow context, use when task get workflow from context expression."""
@@ -95,6 +114,11 @@ class Workflow(Base):
     :param resource_list: Resource files required by the current workflow.You can create and modify
         resource files from this field. When the workflow is submitted, these resource files are
         also submitted along with it.
+    :param bulk_code_allocation: Whether allocate tasks code in bulk mode or not. Default ``False`` which
+        mean each task get its code and version from Java gateway when it is created. When set to ``True``,
+        tasks get a local provisional code when it is created, and all of them will be resolved to the real
+        code and version in one batch when workflow :func:`submit`. Task relations and tasks which refer to
+        other tasks code, such as task ``Switch`` and ``Condition``, will be rewritten transparently.
     """
 
     # key attribute for identify Workflow object
@@ -144,6 +168,7 @@ class Workflow(Base):
         param: dict | None = None,
         resource_plugin: ResourcePlugin | None = None,
         resource_list: list[Resource] | None = None,
+        bulk_code_allocation: bool | None = False,
         *args,
         **kwargs,
     ):
@@ -198,6 +223,8 @@ class Workflow(Base):
         self._task_relations: set[TaskRelation] = set()  # noqa: F821
         self._workflow_code = None
         self.resource_list = resource_list or []
+        self.bulk_code_allocation = bulk_code_allocation
+        self._provisional_codes: dict[str, int] = {}
 
     def __enter__(self) -> Workflow:
         WorkflowContext.set(self)
@@ -310,19 +337,30 @@ class Workflow(Base):
     @property
     def task_definition_json(self) -> list[dict]:
         """Return all tasks definition in list of dict."""
+        return list(self.iter_task_definition())
+
+    def iter_task_definition(self) -> Iterable[dict]:
+        """Yield tasks definition one by one, a generator version of :func:`task_definition_json`."""
         if not self.tasks:
-            return [self.tasks]
+            yield self.tasks
         else:
-            return [task.get_define() for task in self.tasks.values()]
+            self.prefetch()
+            for task in self.tasks.values():
+                yield task.get_define()
 
     @property
     def task_relation_json(self) -> list[dict]:
         """Return all relation between tasks pair in list of dict."""
+        return list(self.iter_task_relation())
+
+    def iter_task_relation(self) -> Iterable[dict]:
+        """Yield relations between tasks pair one by one, a generator version of :func:`task_relation_json`."""
         if not self.tasks:
-            return [self.tasks]
+            yield self.tasks
         else:
             self._handle_root_relation()
-            return [tr.get_define() for tr in self._task_relations]
+            for tr in self._task_relations:
+                yield tr.get_define()
 
     @property
     def schedule_json(self) -> dict | None:
@@ -364,6 +402,96 @@ class Workflow(Base):
                 root_relation = TaskRelation(pre_task_code=0, post_task_code=task.code)
                 self._task_relations.add(root_relation)
 
+    def gen_provisional_code(self, task_name: str) -> int:
+        """Allocate local provisional code for task, used when :param:`bulk_code_allocation` is ``True``.
+
+        Provisional codes are negative integer which never conflict with code generated by Java gateway, and
+        they are resolved by task name. Java gateway gives tasks with the same name the same code only when
+        the task already exists in workflow, and new codes otherwise, which can not be known before resolving.
+        So task names must be unique in workflow with provisional codes, and
+        :class:`pydolphinscheduler.exceptions.PyDSParamException` will be raised for duplicate task name.
+        """
+        if task_name in self._provisional_codes:
+            raise PyDSParamException(
+                "Task name %s already in workflow %s, task names should be unique when bulk code "
+                "allocation or offline mode enabled.",
+                task_name,
+                self.name,
+            )
+        self._provisional_codes[task_name] = -(len(self._provisional_codes) + 1)
+        return self._provisional_codes[task_name]
+
+    def prefetch(self) -> None:
+        """Resolve information of all tasks from Java gateway in batch and cache them before serialization.
+
+        Tasks are grouped by their class and passed to :func:`Task.prefetch`, so tasks sharing the same
+        information, like environment, only query Java gateway once. Do nothing in offline mode.
+        """
+        if is_offline():
+            return
+        tasks_by_cls: dict[type, list] = {}
+        for task in self.tasks.values():
+            tasks_by_cls.setdefault(type(task), []).append(task)
+        for task_cls, tasks in tasks_by_cls.items():
+            task_cls.prefetch(tasks)
+
+    def resolve_task_codes(
+        self, known_codes: dict[str, tuple[int, int]] | None = None
+    ) -> None:
+        """Resolve all tasks provisional code to code and version from Java gateway in one batch.
+
+        It will rewrite tasks code, version, and the task codes in task relations. Will do nothing if
+        there is no provisional code in current workflow.
+
+        :param known_codes: Code and version of tasks already known, mapping by task name. These tasks will
+            not query from Java gateway.
+        """
+        if not self._provisional_codes:
+            return
+        known_codes = known_codes or {}
+        codes = {}
+        versions = {}
+        for task_name, (code, version) in known_codes.items():
+            if task_name in self._provisional_codes:
+                provisional_code = self._provisional_codes[task_name]
+                codes[provisional_code], versions[provisional_code] = code, version
+        task_names = [
+            name for name in self._provisional_codes if name not in known_codes
+        ]
+        results = (
+            gateway.get_code_and_version_batch(self._project, self.name, task_names)
+            if task_names
+            else []
+        )
+        for task_name, result in zip(task_names, results):
+            provisional_code = self._provisional_codes[task_name]
+            codes[provisional_code] = result.get("code")
+            versions[provisional_code] = result.get("version")
+
+        tasks = {}
+        for task in self.tasks.values():
+            if task.code in codes:
+                task.code, task.version = codes[task.code], versions[task.code]
+            task._upstream_task_codes = {
+                codes.get(code, code) for code in task._upstream_task_codes
+            }
+            task._downstream_task_codes = {
+                codes.get(code, code) for code in task._downstream_task_codes
+            }
+            tasks[task.code] = task
+        self.tasks = tasks
+
+        # Task relation hash by task codes, so we have to rebuild the whole set
+        for relation in self._task_relations:
+            relation.pre_task_code = codes.get(
+                relation.pre_task_code, relation.pre_task_code
+            )
+            relation.post_task_code = codes.get(
+                relation.post_task_code, relation.post_task_code
+            )
+        self._task_relations = set(self._task_relations)
+        self._provisional_codes.clear()
+
     def add_task(self, task: Task) -> None:  # noqa: F821
         """Add a single task to workflow."""
         self.tasks[task.code] = task
@@ -413,6 +541,11 @@ class Workflow(Base):
         self.submit()
         self.start()
 
+    async def arun(self):
+        """Asyncio version of :func:`run`, submit and start workflow instance."""
+        await self.asubmit()
+        await self.astart()
+
     def _ensure_side_model_exists(self):
         """Ensure workflow models model exists.
 
@@ -422,9 +555,9 @@ class Workflow(Base):
         :class:`pydolphinscheduler.configuration`.
         """
         # TODO used metaclass for more pythonic
-        self.user.create_if_not_exists()
+        self.user.ensure_exists()
         # Project model need User object exists
-        self.project.create_if_not_exists(self._user)
+        self.project.ensure_exists(self._user)
 
     def _pre_submit_check(self):
         """Check specific condition satisfy before.
@@ -443,43 +576,293 @@ class Workflow(Base):
                 "be provider if task Switch in workflow."
             )
 
-    def submit(self) -> int:
-        """Submit Workflow instance to java gateway."""
+    def submit(
+        self, skip_unchanged: bool | None = None, mode: str | None = SubmitMode.FULL
+    ) -> int:
+        """Submit Workflow instance to java gateway.
+
+        :param skip_unchanged: Whether skip submitting if workflow content is the same as its last successful
+            submit recorded in :data:`pydolphinscheduler.core.submit_index.submit_index`, and return the code
+            of last submit directly. Default value is ``default.workflow.skip_unchanged`` in configuration.
+        :param mode: Submit mode, ``full`` or ``incremental``. Mode ``incremental`` always skip unchanged
+            workflow, and compute :class:`pydolphinscheduler.core.workflow_diff.WorkflowDiff` between
+            workflow and its last submit. Unchanged tasks reuse their code and version from last submit
+            instead of querying them from Java gateway, only added and changed tasks get new versions. It
+            requires workflow with :param:`bulk_code_allocation`, otherwise
+            :class:`pydolphinscheduler.exceptions.PyDSParamException` will be raised.
+
+        In offline mode of :mod:`pydolphinscheduler.core.offline`, workflow is compiled to artifact instead,
+        and return ``None`` because it has no code yet.
+        """
+        if is_offline():
+            self.compile()
+            return None
+        if mode not in (SubmitMode.FULL, SubmitMode.INCREMENTAL):
+            raise PyDSParamException(
+                "Parameter `mode` only support %s or %s, but got %s.",
+                SubmitMode.FULL,
+                SubmitMode.INCREMENTAL,
+                mode,
+            )
+        incremental = mode == SubmitMode.INCREMENTAL
+        if incremental and not self.bulk_code_allocation:
+            raise PyDSParamException(
+                "Submit mode %s requires parameter `bulk_code_allocation` to be True, tasks already get "
+                "their codes from Java gateway when they are created without it.",
+                SubmitMode.INCREMENTAL,
+            )
+        digest = self._unchanged_digest(True if incremental else skip_unchanged)
+        if digest is not None and self._load_unchanged(digest):
+            return self._workflow_code
+
+        snapshot = diff = known_codes = None
+        if incremental:
+            snapshot = self.task_snapshot()
+            entry = submit_index.get_entry(self.submit_index_key) or {}
+            last_tasks = entry.get("snapshot", {}).get("tasks", {})
+            diff = WorkflowDiff.between(entry.get("snapshot"), snapshot)
+            logger.info(
+                "Submit workflow %s incrementally, tasks added %d, changed %d, removed %d.",
+                self.name,
+                len(diff.added),
+                len(diff.changed),
+                len(diff.removed),
+            )
+            known_codes = {
+                name: (last_tasks[name]["code"], last_tasks[name]["version"])
+                for name in diff.unchanged
+                if last_tasks[name]["version"] is not None
+            }
+
         self._ensure_side_model_exists()
+        self.resolve_task_codes(known_codes)
         self._pre_submit_check()
 
         # resource should be created before workflow
-        if len(self.resource_list) > 0:
-            for res in self.resource_list:
-                res.user_name = self._user
-                res.create_or_update_resource()
+        for res in self._bind_resources():
+            res.create_or_update_resource()
+        code = self._create_or_update_workflow()
+        if digest is not None:
+            if incremental:
+                # Added and changed tasks will get new version after submit, we do not know it and have
+                # to query it next time
+                for task in self.tasks.values():
+                    snapshot["tasks"][task.name].update(
+                        code=task.code,
+                        version=task.version if task.name in diff.unchanged else None,
+                    )
+            submit_index.set(self.submit_index_key, digest, code, snapshot)
+        return code
+
+    def compile(self) -> Path:
+        """Compile workflow to artifact in offline mode, and return the path of artifact.
+
+        Artifact contains the whole definition of workflow with placeholders, and could be submitted by
+        :func:`pydolphinscheduler.core.push.push` without Python code of the workflow.
+        """
+        compiler = get_compiler()
+        self._pre_submit_check()
+        return compiler.write(self.to_artifact())
+
+    def to_artifact(self) -> dict:
+        """Get artifact of workflow, see :func:`compile`.
+
+        Tasks keep their provisional codes, which are mapped by task name in key ``provisionalCodes``.
+        """
+        return {
+            "format": ARTIFACT_FORMAT,
+            "version": __version__,
+            "user": self._user,
+            "project": self._project,
+            "name": self.name,
+            "description": str(self.description) if self.description else "",
+            "globalParams": self.param_json,
+            "warningType": self.warning_type,
+            "warningGroupId": self.warning_group_id,
+            "executionType": self.execution_type,
+            "timeout": self.timeout,
+            "workerGroup": self.worker_group,
+            "releaseState": self.release_state,
+            "taskRelationJson": self.task_relation_json,
+            "taskDefinitionJson": self.task_definition_json,
+            "schedule": self.schedule_json,
+            "onlineSchedule": self.online_schedule,
+            "provisionalCodes": dict(self._provisional_codes),
+            "resources": [
+                {
+                    "name": res.name,
+                    "content": res.content,
+                    "description": res.description,
+                }
+                for res in self._bind_resources()
+            ],
+        }
+
+    def task_snapshot(self) -> dict:
+        """Get snapshot of tasks and task relations, used to compute diff by incremental submit.
+
+        Tasks are keyed by their name, with hash of their definition except code and version, so it is
+        stable for the same task content. Task relations are pairs of upstream and downstream task name.
+        """
+        tasks = {}
+        for task in self.tasks.values():
+            define = {
+                key: value
+                for key, value in task.get_define().items()
+                if key not in {"code", "version"}
+            }
+            tasks[task.name] = {
+                "hash": hashlib.sha256(
+                    json.dumps(define, sort_keys=True).encode()
+                ).hexdigest(),
+                "code": task.code,
+                "version": task.version,
+            }
+        relations = sorted(
+            [self.tasks[upstream].name, task.name]
+            for task in self.tasks.values()
+            for upstream in task._upstream_task_codes
+            if upstream in self.tasks
+        )
+        return {"tasks": tasks, "relations": relations}
+
+    def diff(self) -> WorkflowDiff:
+        """Get difference of tasks and task relations between workflow and its last incremental submit."""
+        entry = submit_index.get_entry(self.submit_index_key) or {}
+        return WorkflowDiff.between(entry.get("snapshot"), self.task_snapshot())
+
+    @property
+    def submit_index_key(self) -> str:
+        """Get the identity of workflow in submit index, workflow in different Java gateway are different."""
+        return "/".join(
+            [
+                f"{configuration.JAVA_GATEWAY_ADDRESS}:{configuration.JAVA_GATEWAY_PORT}",
+                self._user,
+                self._project,
+                self.name,
+            ]
+        )
+
+    def content_hash(self) -> str:
+        """Get canonical and stable hash of workflow content, including its definition and resources.
+
+        Workflow with the same content always has the same hash. Tasks in workflow with
+        :param:`bulk_code_allocation` use provisional codes which are stable across processes, so the hash
+        could be computed without calling Java gateway.
+        """
+        content = {
+            "version": __version__,
+            "workflow": self._workflow_define_args(canonical=True),
+            "resources": sorted((res.name, res.content) for res in self.resource_list),
+        }
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+
+    def _unchanged_digest(self, skip_unchanged: bool | None) -> str | None:
+        """Get content hash of workflow if skip unchanged is enabled, otherwise ``None``."""
+        if skip_unchanged is None:
+            skip_unchanged = configuration.WORKFLOW_SKIP_UNCHANGED
+        return self.content_hash() if skip_unchanged else None
+
+    def _load_unchanged(self, digest: str) -> bool:
+        """Load workflow code from submit index if workflow unchanged, return whether it is unchanged."""
+        code = submit_index.get(self.submit_index_key, digest)
+        if code is None:
+            return False
+        self._workflow_code = code
+        workflow_code_cache.set((self._user, self._project, self.name), code)
+        return True
 
+    def _bind_resources(self) -> list[Resource]:
+        """Bind workflow user to all resources in :param:`resource_list` and return them."""
+        for res in self.resource_list:
+            res.user_name = self._user
+        return self.resource_list
+
+    def _create_or_update_workflow(self) -> int:
+        """Create or update workflow definition through java gateway, assume side models exist."""
         self._workflow_code = gateway.create_or_update_workflow(
+            *self._workflow_define_args()
+        )
+        workflow_code_cache.set(
+            (self._user, self._project, self.name), self._workflow_code
+        )
+        return self._workflow_code
+
+    def sub_workflow_names(self) -> set[str]:
+        """Get names of workflows referenced by task sub workflow in this workflow."""
+        return {
+            task.workflow_name
+            for task in self.tasks.values()
+            if task.task_type == TaskType.SUB_WORKFLOW
+        }
+
+    def _workflow_define_args(self, canonical: bool | None = False) -> list:
+        """Get arguments of workflow definition pass to :func:`create_or_update_workflow` of java gateway.
+
+        Tasks definition and relations are encoded by :mod:`pydolphinscheduler.utils.json_encoder` straight
+        from tasks, without building the intermediate list of them.
+
+        :param canonical: Whether sort task relations and keys of JSON objects or not. They are stored in set
+            and their order is not stable across processes. Canonical arguments always use Python built-in
+            ``json``, so content hash do not depend on the installed encoder. Schedule start time defaults to
+            the current time is dropped in canonical arguments, it is not part of workflow content.
+        """
+        schedule = self.schedule_json
+        if canonical:
+            dumps = functools.partial(json.dumps, sort_keys=True)
+            task_relation = dumps(
+                sorted(
+                    self.task_relation_json,
+                    key=lambda relation: json.dumps(relation, sort_keys=True),
+                )
+            )
+            task_definition = dumps(self.task_definition_json)
+            if schedule and not self.start_time:
+                schedule = dict(schedule, startTime=None)
+        else:
+            dumps = json_encoder.dumps
+            task_relation = json_encoder.dumps_array(self.iter_task_relation())
+            task_definition = json_encoder.dumps_array(self.iter_task_definition())
+        return [
             self._user,
             self._project,
             self.name,
             str(self.description) if self.description else "",
-            json.dumps(self.param_json),
+            dumps(self.param_json),
             self.warning_type,
             self.warning_group_id,
             self.execution_type,
             self.timeout,
             self.worker_group,
             self.release_state,
-            # TODO add serialization function
-            json.dumps(self.task_relation_json),
-            json.dumps(self.task_definition_json),
-            json.dumps(self.schedule_json) if self.schedule_json else None,
+            task_relation,
+            task_definition,
+            dumps(schedule) if schedule else None,
             self.online_schedule,
             None,
-        )
-        return self._workflow_code
+        ]
+
+    async def asubmit(
+        self, skip_unchanged: bool | None = None, mode: str | None = SubmitMode.FULL
+    ) -> int:
+        """Asyncio version of :func:`submit`.
+
+        All py4j calls of :func:`submit` run in the executor of
+        :class:`pydolphinscheduler.java_gateway.AsyncGatewayEntryPoint` with bounded concurrency, so many
+        workflows could be submitted concurrently.
+        """
+        return await async_gateway.run(self.submit, skip_unchanged, mode)
 
     def start(self) -> None:
         """Create and start Workflow instance.
 
         which post to `start-process-instance` to java gateway
         """
+        if is_offline():
+            logger.warning("Workflow %s can not start in offline mode.", self.name)
+            return
         gateway.exec_workflow_instance(
             self._user,
             self._project,
@@ -488,3 +871,166 @@ class Workflow(Base):
             self.warning_type,
             self.warning_group_id,
         )
+
+    async def astart(self) -> None:
+        """Asyncio version of :func:`start`."""
+        if is_offline():
+            logger.warning("Workflow %s can not start in offline mode.", self.name)
+            return
+        await async_gateway.exec_workflow_instance(
+            self._user,
+            self._project,
+            self.name,
+            self.worker_group,
+            self.warning_type,
+            self.warning_group_id,
+        )
+
+
+@dataclass
+class SubmitResult:
+    """Result of single workflow submitted by :func:`submit_many`.
+
+    :param workflow: The workflow submitted.
+    :param code: Workflow code return by Java gateway, ``None`` if submit failed.
+    :param error: Exception raised when submitting this workflow, ``None`` if submit success.
+    :param skipped: Whether workflow submit is skipped because it is unchanged since last submit.
+    """
+
+    workflow: Workflow
+    code: int | None = None
+    error: BaseException | None = None
+    skipped: bool = False
+
+    @property
+    def success(self) -> bool:
+        """Whether workflow submit success or not."""
+        return self.error is None
+
+
+def submit_many(
+    workflows: Iterable[Workflow],
+    max_workers: int | None = None,
+    skip_unchanged: bool | None = None,
+) -> list[SubmitResult]:
+    """Submit many workflows concurrently, a parallel version of :func:`Workflow.submit`.
+
+    Comparing to call :func:`Workflow.submit` in a loop, it
+
+    * ensures the side models, user, tenant and project, exist only once for each distinct one;
+    * creates or updates the same resource only once even if it is used by multiple workflows;
+    * creates or updates workflows definition concurrently in threads, workflows referenced by task sub
+      workflow of others in the same batch are submitted first, so their codes are reused without query.
+
+    Error of one workflow do not affect others, it will be recorded in :class:`SubmitResult` instead
+    of raising.
+
+    :param workflows: Workflows to submit.
+    :param max_workers: Max number of threads submit workflows concurrently, default is the Java gateway
+        connection pool size.
+    :param skip_unchanged: Whether skip submitting unchanged workflows, see :func:`Workflow.submit`.
+    :return: Submit results in the same order as :param:`workflows`.
+    """
+    if is_offline():
+        results = [SubmitResult(workflow=workflow) for workflow in workflows]
+        for result in results:
+            try:
+                result.workflow.compile()
+            except Exception as ex:  # noqa: BLE001
+                result.error = ex
+        return results
+    results = []
+    digests: dict[int, str] = {}
+    for workflow in workflows:
+        result = SubmitResult(workflow=workflow)
+        results.append(result)
+        try:
+            digest = workflow._unchanged_digest(skip_unchanged)
+        except Exception as ex:  # noqa: BLE001
+            result.error = ex
+            continue
+        if digest is None:
+            continue
+        if workflow._load_unchanged(digest):
+            result.code, result.skipped = workflow._workflow_code, True
+        else:
+            digests[id(workflow)] = digest
+    pending = [result for result in results if not result.skipped]
+    max_workers = max_workers or configuration.JAVA_GATEWAY_POOL_SIZE
+
+    # ensure each distinct side model only once, user should be created before project
+    users: dict[str, list[SubmitResult]] = {}
+    projects: dict[tuple[str, str], list[SubmitResult]] = {}
+    for result in pending:
+        workflow = result.workflow
+        users.setdefault(workflow._user, []).append(result)
+        projects.setdefault((workflow._user, workflow._project), []).append(result)
+    for shared in users.values():
+        run_shared(shared, lambda result: result.workflow.user.ensure_exists())
+    for (user, _), shared in projects.items():
+        run_shared(
+            shared, lambda result, u=user: result.workflow.project.ensure_exists(u)
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # resource should be created before workflow
+        resources: dict[tuple[str, str, str], list[SubmitResult]] = {}
+        resource_objs: dict[tuple[str, str, str], Resource] = {}
+        for result in pending:
+            if not result.success:
+                continue
+            for res in result.workflow._bind_resources():
+                key = (res.user_name, res.name, res.content)
+                resources.setdefault(key, []).append(result)
+                resource_objs.setdefault(key, res)
+        for key, error in zip(
+            resource_objs,
+            executor.map(_capture_error, resource_objs.values()),
+        ):
+            for result in resources[key]:
+                result.error = result.error or error
+
+        def submit_one(result: SubmitResult) -> None:
+            if not result.success:
+                return
+            workflow = result.workflow
+            try:
+                workflow.resolve_task_codes()
+                workflow._pre_submit_check()
+                result.code = workflow._create_or_update_workflow()
+                if id(workflow) in digests:
+                    submit_index.set(
+                        workflow.submit_index_key, digests[id(workflow)], result.code
+                    )
+            except Exception as ex:  # noqa: BLE001
+                result.error = ex
+
+        for wave in _submit_waves(pending):
+            list(executor.map(submit_one, wave))
+    return results
+
+
+def _submit_waves(results: list[SubmitResult]) -> list[list[SubmitResult]]:
+    """Split results into waves, workflow is in a later wave than all its sub workflows in the same batch."""
+
+    def key(result: SubmitResult) -> tuple[str, str, str]:
+        workflow = result.workflow
+        return workflow._user, workflow._project, workflow.name
+
+    def depends(result: SubmitResult) -> Iterable[tuple[str, str, str]]:
+        workflow = result.workflow
+        return (
+            (workflow._user, workflow._project, name)
+            for name in workflow.sub_workflow_names()
+        )
+
+    return split_waves(results, key, depends)
+
+
+def _capture_error(resource: Resource) -> BaseException | None:
+    """Create or update resource, and return the error instead of raising it."""
+    try:
+        resource.create_or_update_resource()
+    except Exception as ex:  # noqa: BLE001
+        return ex
+    return None
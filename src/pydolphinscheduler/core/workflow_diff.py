@@ -0,0 +1,73 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Diff between workflow and its last submitted snapshot, used by incremental submit."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class WorkflowDiff:
+    """Difference of tasks and task relations between two workflow snapshots.
+
+    Workflow snapshot is a dict with key ``tasks``, mapping task name to its content ``hash``, ``code`` and
+    ``version``, and key ``relations``, a list of ``[upstream task name, downstream task name]`` pairs.
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    relations_added: list[tuple[str, str]] = field(default_factory=list)
+    relations_removed: list[tuple[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def between(cls, old: dict | None, new: dict) -> WorkflowDiff:
+        """Get the difference from snapshot :param:`old` to snapshot :param:`new`.
+
+        All tasks and relations of :param:`new` are added if :param:`old` is ``None``.
+        """
+        old = old or {"tasks": {}, "relations": []}
+        old_tasks, new_tasks = old["tasks"], new["tasks"]
+        diff = cls(removed=sorted(set(old_tasks) - set(new_tasks)))
+        for name, task in new_tasks.items():
+            if name not in old_tasks:
+                diff.added.append(name)
+            elif old_tasks[name]["hash"] != task["hash"]:
+                diff.changed.append(name)
+            else:
+                diff.unchanged.append(name)
+
+        old_relations = {tuple(relation) for relation in old["relations"]}
+        new_relations = {tuple(relation) for relation in new["relations"]}
+        diff.relations_added = sorted(new_relations - old_relations)
+        diff.relations_removed = sorted(old_relations - new_relations)
+        return diff
+
+    @property
+    def empty(self) -> bool:
+        """Whether there is no difference of tasks and task relations."""
+        return not (
+            self.added
+            or self.changed
+            or self.removed
+            or self.relations_added
+            or self.relations_removed
+        )
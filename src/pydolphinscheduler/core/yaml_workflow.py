@@ -19,18 +19,24 @@
 
 from __future__ import annotations
 
+import copy
+import glob
 import logging
 import os
 import re
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from pydolphinscheduler import configuration, tasks
+from pydolphinscheduler import configuration
 from pydolphinscheduler.constants import Symbol
+from pydolphinscheduler.core import task_registry
 from pydolphinscheduler.core.parameter import ParameterType
 from pydolphinscheduler.core.task import Task
 from pydolphinscheduler.core.workflow import Workflow
-from pydolphinscheduler.exceptions import PyDSTaskNoFoundException
+from pydolphinscheduler.exceptions import PyDSParamException
 from pydolphinscheduler.utils.yaml_parser import YamlParser
 
 logger = logging.getLogger(__file__)
@@ -43,6 +49,17 @@ KEY_OP = "op"
 
 TASK_SPECIAL_KEYS = [KEY_TASK_TYPE, KEY_DEPS]
 
+YAML_SUFFIXES = (".yaml", ".yml")
+PATTERN_REFER_WORKFLOW = re.compile(r"\$WORKFLOW\{\"(.*?)\"\}")
+PATTERN_FILE = re.compile(r"^\$FILE\{\"(.*?)\"\}")
+PATTERN_ENV = re.compile(r"\$ENV\{(.*?)\}")
+PATTERN_CONFIG = re.compile(r"\$\{CONFIG\.(.*?)\}")
+PATTERN_TOKEN = re.compile(r"\$ENV\{(?P<env>.*?)\}|\$\{CONFIG\.(?P<config>.*?)\}")
+PATTERN_PARAMETER = re.compile(r"^(.*?)\((.*?)\)")
+
+# Top level keys whose values could use TYPE(value) to set local params
+PARAMETER_KEYS = {"input_params", "output_params"}
+
 
 class ParseTool:
     """Enhanced parsing tools."""
@@ -50,53 +67,121 @@ class ParseTool:
     @staticmethod
     def parse_string_param_if_file(string_param: str, **kwargs):
         """Use $FILE{"data_path"} to load file from "data_path"."""
-        if string_param.startswith("$FILE"):
-            path = re.findall(r"\$FILE\{\"(.*?)\"\}", string_param)[0]
+        match = PATTERN_FILE.match(string_param)
+        if match:
             base_folder = kwargs.get("base_folder", ".")
-            path = ParseTool.get_possible_path(path, base_folder)
+            path = ParseTool.get_possible_path(match.group(1), base_folder)
             with open(path) as read_file:
                 string_param = "".join(read_file)
         return string_param
 
     @staticmethod
     def parse_string_param_if_env(string_param: str, **kwargs):
-        """Use $ENV{env_name} to load environment variable "env_name"."""
+        """Use $ENV{env_name} to load environment variable "env_name", replace all of them."""
         if "$ENV" in string_param:
-            key = re.findall(r"\$ENV\{(.*?)\}", string_param)[0]
-            env_value = os.environ.get(key, f"${key}")
-            string_param = string_param.replace(f"$ENV{{{key}}}", env_value)
+            string_param = PATTERN_ENV.sub(
+                lambda match: ParseTool.get_env(match.group(1)), string_param
+            )
         return string_param
 
     @staticmethod
     def parse_string_param_if_config(string_param: str, **kwargs):
-        """Use ${CONFIG.var_name} to load variable "var_name" from configuration."""
-        if "${CONFIG" in string_param:
-            key = re.findall(r"\$\{CONFIG\.(.*?)\}", string_param)[0]
-            if hasattr(configuration, key):
-                string_param = getattr(configuration, key)
-            else:
-                string_param = configuration.get_single_config(key)
+        """Use ${CONFIG.var_name} to load variable "var_name" from configuration.
 
+        Keep the type of variable if it is the whole string, otherwise replace it in string.
+        """
+        if "${CONFIG" in string_param:
+            match = PATTERN_CONFIG.fullmatch(string_param)
+            if match:
+                return ParseTool.get_config(match.group(1))
+            string_param = PATTERN_CONFIG.sub(
+                lambda match: str(ParseTool.get_config(match.group(1))), string_param
+            )
         return string_param
 
     @staticmethod
     def parse_string_param_if_parameter(string_param: str, **kwargs):
         """Use TYPE(value) to set local params."""
         key_path = kwargs.get("key_path")
-        if key_path.split(Symbol.POINT)[0] not in {"input_params", "output_params"}:
+        if key_path.split(Symbol.POINT)[0] not in PARAMETER_KEYS:
             return string_param
 
         if not isinstance(string_param, str):
             return string_param
 
-        result = re.findall(r"^(.*?)\((.*?)\)", string_param)
-        if len(result) == 1 and len(result[0]) == 2:
-            type_ = result[0][0].rstrip()
-            value = result[0][1].rstrip()
+        match = PATTERN_PARAMETER.match(string_param)
+        if match:
+            type_ = match.group(1).rstrip()
+            value = match.group(2).rstrip()
             return ParameterType.type_sets[type_](value)
         else:
             return string_param
 
+    @staticmethod
+    def parse_string_param(
+        string_param: str,
+        key_path: str = "",
+        base_folder: str | Path = ".",
+        file_cache: dict[str, str] | None = None,
+    ) -> Any:
+        """Parse all special grammars in string in one pass, the same as applying all rules in order.
+
+        ``$FILE`` is resolved first and its content is parsed further, all ``$ENV`` and ``${CONFIG.}`` are
+        then replaced in a single scan, and ``TYPE(value)`` is parsed at last for local params.
+
+        :param string_param: The string to parse.
+        :param key_path: Nested key of string in YAML file, delimited by ``.``.
+        :param base_folder: Folder to search file of ``$FILE`` if it not exists.
+        :param file_cache: Content of files loaded by ``$FILE``, keyed by their path in ``$FILE``.
+        """
+        if string_param.startswith("$FILE"):
+            match = PATTERN_FILE.match(string_param)
+            if match:
+                file_cache = {} if file_cache is None else file_cache
+                path = match.group(1)
+                if path not in file_cache:
+                    file_cache[path] = ParseTool.parse_string_param_if_file(
+                        string_param, base_folder=base_folder
+                    )
+                string_param = file_cache[path]
+
+        if "$" in string_param:
+            pieces, last = [], 0
+            for match in PATTERN_TOKEN.finditer(string_param):
+                env, config = match.group("env", "config")
+                if env is not None:
+                    value = ParseTool.get_env(env)
+                else:
+                    value = ParseTool.get_config(config)
+                    if match.end() - match.start() == len(string_param):
+                        string_param = value
+                        break
+                pieces.append(string_param[last : match.start()])
+                pieces.append(str(value))
+                last = match.end()
+            else:
+                if pieces:
+                    pieces.append(string_param[last:])
+                    string_param = "".join(pieces)
+
+        if key_path.split(Symbol.POINT)[0] in PARAMETER_KEYS:
+            string_param = ParseTool.parse_string_param_if_parameter(
+                string_param, key_path=key_path
+            )
+        return string_param
+
+    @staticmethod
+    def get_env(key: str) -> str:
+        """Get environment variable, return ``$key`` if it not exists."""
+        return os.environ.get(key, f"${key}")
+
+    @staticmethod
+    def get_config(key: str) -> Any:
+        """Get variable from configuration module first, or from configuration file by nested key."""
+        if hasattr(configuration, key):
+            return getattr(configuration, key)
+        return configuration.get_single_config(key)
+
     @staticmethod
     def get_possible_path(file_path, base_folder):
         """Get file possible path.
@@ -113,22 +198,29 @@ class ParseTool:
         return possible_path
 
 
+def get_refer_key(yaml_file: str | Path) -> tuple[Path, int]:
+    """Get key of YAML file in referenced workflows, its resolved path and modified time in nanoseconds."""
+    resolved = Path(yaml_file).resolve()
+    return resolved, resolved.stat().st_mtime_ns
+
+
 def get_task_cls(task_type) -> Task:
-    """Get the task class object by task_type (case compatible)."""
-    # only get task class from tasks.__all__
-    all_task_types = {type_.capitalize(): type_ for type_ in tasks.__all__}
-    task_type_cap = task_type.capitalize()
-    if task_type_cap not in all_task_types:
-        raise PyDSTaskNoFoundException(f"cant not find task {task_type}")
+    """Get the task class object by task_type (case compatible).
 
-    standard_name = all_task_types[task_type_cap]
-    return getattr(tasks, standard_name)
+    It is an alias of :func:`pydolphinscheduler.core.task_registry.get_task_cls`, which also supports task
+    types registered by entry points.
+    """
+    return task_registry.get_task_cls(task_type)
 
 
 class YamlWorkflow(YamlParser):
     """Yaml parser for create workflow.
 
     :param yaml_file: yaml file path.
+    :param refer_workflows: Names of workflows already created in this run, keyed by
+        :func:`get_refer_key` of their YAML file. Workflows referenced by ``$WORKFLOW{...}`` in this mapping
+        are not parsed again, and those parsed are added to it.
+    :param referring: Resolved path of YAML files referencing this one, to detect reference cycle.
 
         examples1 ::
 
@@ -141,30 +233,32 @@ class YamlWorkflow(YamlParser):
 
     """
 
-    _parse_rules = [
-        ParseTool.parse_string_param_if_file,
-        ParseTool.parse_string_param_if_env,
-        ParseTool.parse_string_param_if_config,
-        ParseTool.parse_string_param_if_parameter,
-    ]
-
-    def __init__(self, yaml_file: str):
+    def __init__(
+        self,
+        yaml_file: str,
+        refer_workflows: dict[tuple[Path, int], str] | None = None,
+        referring: tuple[Path, ...] = (),
+    ):
         with open(yaml_file) as f:
             content = f.read()
 
         self._base_folder = Path(yaml_file).parent
+        self._refer_workflows = {} if refer_workflows is None else refer_workflows
+        self._file_cache: dict[str, str] = {}
+        self._referring = (*referring, Path(yaml_file).resolve())
         content = self.prepare_refer_workflow(content)
         super().__init__(content)
 
     def create_workflow(self):
         """Create workflow main function."""
-        # get workflow parameters with key "workflow"
-        workflow_params = self[KEY_WORKFLOW]
+        # get workflow parameters with key "workflow", copy them because they are changed in place below
+        # and values of YamlParser are its indexed objects
+        workflow_params = copy.deepcopy(self[KEY_WORKFLOW])
 
         # pop "run" parameter, used at the end
         is_run = workflow_params.pop("run", False)
 
-        # use YamlWorkflow._parse_rules to parse special value of yaml file
+        # use ParseTool.parse_string_param to parse special value of yaml file
         workflow_params = self.parse_params(workflow_params)
 
         workflow_name = workflow_params["name"]
@@ -177,7 +271,7 @@ class YamlWorkflow(YamlParser):
             name2task = {}
 
             # get task datas with key "tasks"
-            for task_data in self[KEY_TASK]:
+            for task_data in copy.deepcopy(self[KEY_TASK]):
                 task = self.parse_task(task_data, name2task)
 
                 deps = task_data.get(KEY_DEPS, [])
@@ -206,13 +300,15 @@ class YamlWorkflow(YamlParser):
         The function operates params only when it encounters a string; other types continue recursively.
         """
         if isinstance(params, str):
-            for parse_rule in self._parse_rules:
-                params_ = params
-                params = parse_rule(
-                    params, base_folder=self._base_folder, key_path=key_path
-                )
-                if params_ != params:
-                    logger.info(f"parse {params_} -> {params}")
+            params_ = params
+            params = ParseTool.parse_string_param(
+                params,
+                key_path=key_path,
+                base_folder=self._base_folder,
+                file_cache=self._file_cache,
+            )
+            if params_ != params:
+                logger.debug("parse %s -> %s", params_, params)
 
         elif isinstance(params, list):
             for index in range(len(params)):
@@ -229,26 +325,45 @@ class YamlWorkflow(YamlParser):
         return params
 
     @classmethod
-    def parse(cls, yaml_file: str):
+    def parse(
+        cls,
+        yaml_file: str,
+        refer_workflows: dict[tuple[Path, int], str] | None = None,
+        referring: tuple[Path, ...] = (),
+    ):
         """Recursively resolves the parameter values.
 
         The function operates params only when it encounters a string; other types continue recursively.
         """
-        workflow_name = cls(yaml_file).create_workflow()
+        workflow_name = cls(yaml_file, refer_workflows, referring).create_workflow()
         return workflow_name
 
     def prepare_refer_workflow(self, content):
-        """Allow YAML files to reference workflow derived from other YAML files."""
-        workflow_paths = re.findall(r"\$WORKFLOW\{\"(.*?)\"\}", content)
+        """Allow YAML files to reference workflow derived from other YAML files.
+
+        Each referenced YAML file is parsed only once in the same run, unless it is modified.
+        """
+        workflow_paths = dict.fromkeys(PATTERN_REFER_WORKFLOW.findall(content))
         for workflow_path in workflow_paths:
-            logger.info(
-                f"find special token {workflow_path}, load workflow form {workflow_path}"
-            )
             possible_path = ParseTool.get_possible_path(
                 workflow_path, self._base_folder
             )
-            workflow_name = YamlWorkflow.parse(possible_path)
-            content = content.replace(f'$WORKFLOW{{"{workflow_path}"}}', workflow_name)
+            key = get_refer_key(possible_path)
+            if key[0] in self._referring:
+                raise PyDSParamException(
+                    "Reference cycle of $WORKFLOW found: %s.",
+                    " -> ".join(map(str, (*self._referring, key[0]))),
+                )
+            if key not in self._refer_workflows:
+                logger.info(
+                    f"find special token {workflow_path}, load workflow form {workflow_path}"
+                )
+                self._refer_workflows[key] = YamlWorkflow.parse(
+                    possible_path, self._refer_workflows, self._referring
+                )
+            content = content.replace(
+                f'$WORKFLOW{{"{workflow_path}"}}', self._refer_workflows[key]
+            )
 
         return content
 
@@ -276,16 +391,16 @@ class YamlWorkflow(YamlParser):
 
         task_cls = get_task_cls(task_type)
 
-        # use YamlWorkflow._parse_rules to parse special value of yaml file
+        # use ParseTool.parse_string_param to parse special value of yaml file
         task_params = self.parse_params(task_params)
 
-        if task_cls == tasks.Switch:
+        if task_type.lower() == "switch":
             task = self.parse_switch(task_params, name2task)
 
-        elif task_cls == tasks.Condition:
+        elif task_type.lower() == "condition":
             task = self.parse_condition(task_params, name2task)
 
-        elif task_cls == tasks.Dependent:
+        elif task_type.lower() == "dependent":
             task = self.parse_dependent(task_params, name2task)
 
         else:
@@ -494,3 +609,158 @@ class YamlWorkflow(YamlParser):
 def create_workflow(yaml_file):
     """CLI."""
     YamlWorkflow.parse(yaml_file)
+
+
+@dataclass
+class YamlResult:
+    """Result of single YAML file created by :func:`create_workflows`.
+
+    :param path: Resolved path of YAML file.
+    :param name: Name of workflow created, ``None`` if create failed.
+    :param error: Exception raised when creating workflow from this file, ``None`` if create success.
+    :param refers: Resolved path of YAML files referenced by ``$WORKFLOW{...}`` in this file.
+    """
+
+    path: Path
+    name: str | None = None
+    error: BaseException | None = None
+    refers: list[Path] = field(default_factory=list, repr=False)
+
+    @property
+    def success(self) -> bool:
+        """Whether workflow create success or not."""
+        return self.error is None
+
+
+def find_yaml_files(paths: Iterable[str | Path]) -> list[Path]:
+    """Find YAML files in paths, which could be files, directories or glob patterns.
+
+    Directories are searched recursively for files end with ``.yaml`` or ``.yml``, glob patterns support
+    ``**`` to match any level of directories. Files found more than once are only returned once.
+    """
+    found = []
+    for path in map(str, paths):
+        if Path(path).is_dir():
+            found.extend(
+                sorted(
+                    file
+                    for file in Path(path).rglob("*")
+                    if file.is_file() and file.suffix in YAML_SUFFIXES
+                )
+            )
+        elif glob.has_magic(path):
+            found.extend(sorted(Path(file) for file in glob.glob(path, recursive=True)))
+        else:
+            found.append(Path(path))
+    return list(dict.fromkeys(file.resolve() for file in found))
+
+
+def get_refer_workflows(yaml_file: str | Path) -> list[Path]:
+    """Get resolved path of YAML files referenced by ``$WORKFLOW{...}`` in yaml_file, without parsing it."""
+    content = Path(yaml_file).read_text()
+    base_folder = Path(yaml_file).parent
+    refers = (
+        Path(ParseTool.get_possible_path(path, base_folder)).resolve()
+        for path in PATTERN_REFER_WORKFLOW.findall(content)
+    )
+    return list(dict.fromkeys(refers))
+
+
+def _create_workflow_in_process(yaml_file: Path, refer_names: dict[Path, str]):
+    """Create workflow from YAML file in worker process, referenced workflows are already created."""
+    refer_workflows = {get_refer_key(path): name for path, name in refer_names.items()}
+    return YamlWorkflow(yaml_file, refer_workflows).create_workflow()
+
+
+def create_workflows(
+    paths: Iterable[str | Path], max_workers: int | None = None
+) -> list[YamlResult]:
+    """Create workflows from many YAML files in parallel processes, a parallel version of :func:`create_workflow`.
+
+    All files referenced by ``$WORKFLOW{...}``, including those not in :param:`paths`, are collected into a
+    dependency graph first. Each file is parsed and submitted exactly once, as soon as all files it
+    references are created, and their workflow names are passed to it instead of parsing them again.
+
+    Error of one file do not affect others, except files referencing it, it will be recorded in
+    :class:`YamlResult` instead of raising. Files in a reference cycle are failed without parsing.
+
+    :param paths: YAML files, directories or glob patterns, see :func:`find_yaml_files`.
+    :param max_workers: Max number of processes create workflows in parallel, default is the number of
+        CPUs. Workflows are created in current process one by one when it is ``1``.
+    :return: Results of files in :param:`paths`, followed by files only referenced by others.
+    """
+    results: dict[Path, YamlResult] = {}
+    pending = find_yaml_files(paths)
+    while pending:
+        path = pending.pop(0)
+        if path in results:
+            continue
+        result = results[path] = YamlResult(path=path)
+        try:
+            result.refers = get_refer_workflows(path)
+        except Exception as ex:  # noqa: BLE001
+            result.error = ex
+        pending.extend(result.refers)
+
+    names: dict[Path, str] = {}
+    waiting = {path for path, result in results.items() if result.success}
+
+    def ready() -> list[YamlResult]:
+        """Get waiting results whose referenced files are all created, fail those referenced failed one."""
+        found, changed = [], True
+        while changed:
+            changed = False
+            for path in sorted(waiting):
+                result = results[path]
+                failed = [
+                    refer for refer in result.refers if not results[refer].success
+                ]
+                if failed:
+                    result.error = PyDSParamException(
+                        "Can not create workflow from %s, referenced YAML file %s failed.",
+                        path,
+                        failed[0],
+                    )
+                    changed = True
+                elif any(refer not in names for refer in result.refers):
+                    continue
+                else:
+                    found.append(result)
+                waiting.remove(path)
+        return found
+
+    def done(result: YamlResult, func, *args) -> None:
+        try:
+            result.name = func(*args)
+            names[result.path] = result.name
+        except Exception as ex:  # noqa: BLE001
+            result.error = ex
+
+    if max_workers == 1:
+        while batch := ready():
+            for result in batch:
+                refers = {refer: names[refer] for refer in result.refers}
+                done(result, _create_workflow_in_process, result.path, refers)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            running: dict[Future, YamlResult] = {}
+            while True:
+                for result in ready():
+                    refers = {refer: names[refer] for refer in result.refers}
+                    future = executor.submit(
+                        _create_workflow_in_process, result.path, refers
+                    )
+                    running[future] = result
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done(running.pop(future), future.result)
+
+    # files left are in reference cycles
+    for path in waiting:
+        results[path].error = PyDSParamException(
+            "Can not create workflow from %s, it is in a reference cycle of $WORKFLOW.",
+            path,
+        )
+    return list(results.values())
@@ -19,14 +19,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
+import threading
+import time
 import warnings
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
-from typing import Any
+from typing import Any, TypeVar
 
 from py4j.java_collections import JavaMap
 from py4j.java_gateway import GatewayParameters, JavaGateway
-from py4j.protocol import Py4JError
+from py4j.protocol import Py4JError, Py4JNetworkError
 
 from pydolphinscheduler import __version__, configuration
 from pydolphinscheduler.constants import JavaGatewayDefault, Version
@@ -35,6 +42,8 @@ from pydolphinscheduler.utils.versions import version_match
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def gateway_result_checker(
     result: JavaMap,
@@ -54,8 +63,128 @@ def gateway_result_checker(
     return result
 
 
+class GatewayPool:
+    """Thread safe pool of :class:`py4j.java_gateway.JavaGateway` connections.
+
+    Connections are created lazily until :param:`size` connections exist, after that callers wait until
+    another thread returns its connection back to the pool.
+
+    :param factory: Callable to create new :class:`py4j.java_gateway.JavaGateway` object.
+    :param size: Max number of connections in the pool, must be greater than 0.
+    :param idle_timeout: Seconds a connection could stay idle in the pool before it is closed, ``0`` means
+        connection never expired.
+    :param health_check: Whether ping the Java gateway before reusing an idle connection or not. Unhealthy
+        connection will be closed and replaced by a new one.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], JavaGateway],
+        size: int,
+        idle_timeout: int | None = 0,
+        health_check: bool | None = False,
+    ):
+        if size < 1:
+            raise PyDSJavaGatewayException(
+                f"Java gateway pool size must be greater than 0, but got {size}."
+            )
+        self._factory = factory
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self._idle: deque[tuple[JavaGateway, float]] = deque()
+        self._created = 0
+        self._cond = threading.Condition()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[JavaGateway]:
+        """Borrow a connection from the pool, and return it back when context exits.
+
+        Connection will be discarded instead of return back when it raises network error.
+        """
+        gateway = self._acquire()
+        healthy = True
+        try:
+            yield gateway
+        except Py4JNetworkError:
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                self._release(gateway)
+            else:
+                self._discard(gateway)
+
+    def _acquire(self) -> JavaGateway:
+        while True:
+            with self._cond:
+                while not self._idle and self._created >= self.size:
+                    self._cond.wait()
+                if self._idle:
+                    gateway, last_used = self._idle.pop()
+                else:
+                    self._created += 1
+                    break
+            expired = (
+                self.idle_timeout and time.monotonic() - last_used > self.idle_timeout
+            )
+            if expired or (self.health_check and not self._is_healthy(gateway)):
+                self._discard(gateway)
+            else:
+                return gateway
+
+        try:
+            return self._factory()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, gateway: JavaGateway) -> None:
+        with self._cond:
+            self._idle.append((gateway, time.monotonic()))
+            self._cond.notify()
+
+    def _discard(self, gateway: JavaGateway) -> None:
+        with contextlib.suppress(Exception):
+            gateway.close()
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _is_healthy(gateway: JavaGateway) -> bool:
+        try:
+            gateway.entry_point.ping()
+        except Py4JError:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close all idle connections in the pool."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for gateway, _ in idle:
+            self._discard(gateway)
+
+
+# Java gateway version memoized per process, keyed by gateway address and port, to avoid checking it
+# every time a new :class:`GatewayEntryPoint` connects to the same Java gateway.
+_gateway_versions: dict[tuple[str, int], str] = {}
+
+
 class GatewayEntryPoint:
-    """Launch java gateway to pydolphin scheduler."""
+    """Launch java gateway to pydolphin scheduler.
+
+    Creating this object is cheap and do not touch the network, connection to Java gateway and the version
+    check are deferred until the first real RPC call.
+
+    All RPC methods borrow a connection from :class:`GatewayPool`, so it is safe to share one object
+    across threads, and RPC from different threads run in parallel with up to :param:`pool_size`
+    connections.
+    """
 
     def __init__(
         self,
@@ -63,17 +192,103 @@ class GatewayEntryPoint:
         port: int | None = None,
         auto_convert: bool | None = True,
         auth_token: str | None = None,
+        pool_size: int | None = None,
+        pool_idle_timeout: int | None = None,
+        pool_health_check: bool | None = None,
     ):
         self._gateway = None
+        self._pool = None
+        self._connected = False
+        self._lock = threading.RLock()
         self.address = address or configuration.JAVA_GATEWAY_ADDRESS
         self.port = port or configuration.JAVA_GATEWAY_PORT
         self.auto_convert = auto_convert or configuration.JAVA_GATEWAY_AUTO_CONVERT
         self.auth_token = auth_token or configuration.JAVA_GATEWAY_AUTH_TOKEN
+        self.pool_size = pool_size or configuration.JAVA_GATEWAY_POOL_SIZE
+        self.pool_idle_timeout = (
+            configuration.JAVA_GATEWAY_POOL_IDLE_TIMEOUT
+            if pool_idle_timeout is None
+            else pool_idle_timeout
+        )
+        self.pool_health_check = (
+            configuration.JAVA_GATEWAY_POOL_HEALTH_CHECK
+            if pool_health_check is None
+            else pool_health_check
+        )
+
+    def _new_gateway(self) -> JavaGateway:
+        """Create a new connection to Java gateway.
+
+        Token alert and version check only run when the first connection created.
+
+        TODO Note that automatic conversion makes calling Java methods slightly less efficient because
+        in the worst case, Py4J needs to go through all registered converters for all parameters.
+        This is why automatic conversion is disabled by default.
+        """
+        gateway_parameters = GatewayParameters(
+            address=self.address,
+            port=self.port,
+            auto_convert=self.auto_convert,
+            auth_token=self.auth_token,
+        )
+        gateway = JavaGateway(gateway_parameters=gateway_parameters)
+        with self._lock:
+            first_connect = not self._connected
+            self._connected = True
+        if first_connect:
+            configuration.token_alert(self.auth_token)
+            self._version_check(gateway)
+        return gateway
+
+    @property
+    def gateway(self) -> JavaGateway:
+        """Launch java gateway to pydolphinscheduler.
+
+        It is a single connection shared by all callers which access it directly, RPC methods in this class
+        use connections from :attr:`pool` instead.
+        """
+        if self._gateway is None:
+            with self._lock:
+                if self._gateway is None:
+                    self._gateway = self._new_gateway()
+        return self._gateway
+
+    @property
+    def pool(self) -> GatewayPool:
+        """Get connection pool to Java gateway, create it when first access."""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = GatewayPool(
+                        self._new_gateway,
+                        size=self.pool_size,
+                        idle_timeout=self.pool_idle_timeout,
+                        health_check=self.pool_health_check,
+                    )
+        return self._pool
+
+    def _call(self, method: str, *args) -> Any:
+        """Call Java gateway entry point method with connection borrowed from :attr:`pool`."""
+        with self.pool.connection() as gateway:
+            return getattr(gateway.entry_point, method)(*args)
+
+    def _call_batch(self, method: str, args_list: list[tuple]) -> list:
+        """Call method of Java gateway entry point many times, with each arguments in :param:`args_list`.
+
+        Java gateway do not expose bulk endpoints for now, so all calls share one gateway connection and
+        are issued back to back. The results are in the same order as :param:`args_list`.
+        """
+        with self.pool.connection() as gateway:
+            func = getattr(gateway.entry_point, method)
+            return [func(*args) for args in args_list]
+
+    def _version_check(self, gateway: JavaGateway) -> None:
+        """Warn users when Java gateway version do not match pydolphinscheduler version."""
         gateway_version = "unknown"
         with contextlib.suppress(Py4JError):
             # 1. Java gateway version is too old: doesn't have method 'getGatewayVersion()'
             # 2. Error connecting to Java gateway
-            gateway_version = self.get_gateway_version()
+            gateway_version = self._memoized_gateway_version(gateway)
         if (
             not __version__.endswith("dev")
             and gateway_version
@@ -85,32 +300,25 @@ class GatewayEntryPoint:
                 "We strongly recommend you to find the matched version "
                 "(check: https://pypi.org/project/apache-dolphinscheduler)",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=4,
             )
 
-    @property
-    def gateway(self) -> JavaGateway:
-        """Launch java gateway to pydolphinscheduler.
-
-        TODO Note that automatic conversion makes calling Java methods slightly less efficient because
-        in the worst case, Py4J needs to go through all registered converters for all parameters.
-        This is why automatic conversion is disabled by default.
-        """
-        if self._gateway is not None:
-            return self._gateway
-        configuration.token_alert(self.auth_token)
-        gateway_parameters = GatewayParameters(
-            address=self.address,
-            port=self.port,
-            auto_convert=self.auto_convert,
-            auth_token=self.auth_token,
-        )
-        self._gateway = JavaGateway(gateway_parameters=gateway_parameters)
-        return self._gateway
+    def _memoized_gateway_version(self, gateway: JavaGateway) -> str:
+        key = (self.address, self.port)
+        if key not in _gateway_versions:
+            _gateway_versions[key] = gateway.entry_point.getGatewayVersion()
+        return _gateway_versions[key]
 
     def get_gateway_version(self):
-        """Get the java gateway version, expected to be equal with pydolphinscheduler."""
-        return self.gateway.entry_point.getGatewayVersion()
+        """Get the java gateway version, expected to be equal with pydolphinscheduler.
+
+        The result is memoized per process for the same Java gateway address and port.
+        """
+        key = (self.address, self.port)
+        if key in _gateway_versions:
+            return _gateway_versions[key]
+        with self.pool.connection() as gateway:
+            return self._memoized_gateway_version(gateway)
 
     def get_datasource(self, name: str, type: str | None = None):
         """Get single datasource by java gateway.
@@ -120,69 +328,102 @@ class GatewayEntryPoint:
         :param name: datasource name of the datasource to be queried
         :param type: datasource type of the datasource, only used to filter the result.
         """
-        return self.gateway.entry_point.getDatasource(name, type)
+        return self._call("getDatasource", name, type)
+
+    def get_datasource_batch(self, keys: list[tuple[str, str | None]]) -> list:
+        """Get many datasources by java gateway, with each ``(name, type)`` in :param:`keys`.
+
+        The results are in the same order as :param:`keys`, and ``None`` for datasource not found.
+        """
+        return self._call_batch("getDatasource", keys)
 
     def get_resources_file_info(self, program_type: str, main_package: str):
         """Get resources file info through java gateway."""
-        return self.gateway.entry_point.getResourcesFileInfo(program_type, main_package)
+        return self._call("getResourcesFileInfo", program_type, main_package)
+
+    def get_resources_file_info_batch(self, keys: list[tuple[str, str]]) -> list:
+        """Get many resources file info through java gateway, with each ``(program_type, main_package)`` in :param:`keys`.
+
+        The results are in the same order as :param:`keys`.
+        """
+        return self._call_batch("getResourcesFileInfo", keys)
 
     def create_or_update_resource(self, user_name: str, name: str, content: str):
         """Create or update resource through java gateway."""
-        return self.gateway.entry_point.createOrUpdateResource(user_name, name, content)
+        return self._call("createOrUpdateResource", user_name, name, content)
 
     def query_resources_file_info(self, user_name: str, name: str):
         """Get resources file info through java gateway."""
-        return self.gateway.entry_point.queryResourcesFileInfo(user_name, name)
+        return self._call("queryResourcesFileInfo", user_name, name)
+
+    def query_resources_file_info_batch(self, keys: list[tuple[str, str]]) -> list:
+        """Get many resources file info through java gateway, with each ``(user_name, name)`` in :param:`keys`.
+
+        The results are in the same order as :param:`keys`.
+        """
+        return self._call_batch("queryResourcesFileInfo", keys)
 
     def query_environment_info(self, name: str):
         """Get environment info through java gateway."""
-        return self.gateway.entry_point.getEnvironmentInfo(name)
+        return self._call("getEnvironmentInfo", name)
+
+    def query_environment_info_batch(self, names: list[str]) -> list:
+        """Get environment info for many environments through java gateway, in the order of :param:`names`."""
+        return self._call_batch("getEnvironmentInfo", [(name,) for name in names])
 
     def get_code_and_version(
         self, project_name: str, workflow_name: str, task_name: str
     ):
         """Get code and version through java gateway."""
-        return self.gateway.entry_point.getCodeAndVersion(
-            project_name, workflow_name, task_name
+        return self._call("getCodeAndVersion", project_name, workflow_name, task_name)
+
+    def get_code_and_version_batch(
+        self, project_name: str, workflow_name: str, task_names: list[str]
+    ) -> list:
+        """Get code and version for many tasks of the same workflow through java gateway.
+
+        The results are in the same order as :param:`task_names`.
+        """
+        return self._call_batch(
+            "getCodeAndVersion",
+            [(project_name, workflow_name, task_name) for task_name in task_names],
         )
 
     def create_or_grant_project(
         self, user: str, name: str, description: str | None = None
     ):
         """Create or grant project through java gateway."""
-        return self.gateway.entry_point.createOrGrantProject(user, name, description)
+        return self._call("createOrGrantProject", user, name, description)
 
     def query_project_by_name(self, user: str, name: str):
         """Query project through java gateway."""
-        return self.gateway.entry_point.queryProjectByName(user, name)
+        return self._call("queryProjectByName", user, name)
 
     def update_project(
         self, user: str, project_code: int, project_name: str, description: str
     ):
         """Update project through java gateway."""
-        return self.gateway.entry_point.updateProject(
-            user, project_code, project_name, description
+        return self._call(
+            "updateProject", user, project_code, project_name, description
         )
 
     def delete_project(self, user: str, code: int):
         """Delete project through java gateway."""
-        return self.gateway.entry_point.deleteProject(user, code)
+        return self._call("deleteProject", user, code)
 
     def create_tenant(
         self, tenant_name: str, queue_name: str, description: str | None = None
     ):
         """Create tenant through java gateway."""
-        return self.gateway.entry_point.createTenant(
-            tenant_name, description, queue_name
-        )
+        return self._call("createTenant", tenant_name, description, queue_name)
 
     def query_tenant(self, tenant_code: str):
         """Query tenant through java gateway."""
-        return self.gateway.entry_point.queryTenantByCode(tenant_code)
+        return self._call("queryTenantByCode", tenant_code)
 
     def grant_tenant_to_user(self, user_name: str, tenant_code: str):
         """Grant tenant to user through java gateway."""
-        return self.gateway.entry_point.grantTenantToUser(user_name, tenant_code)
+        return self._call("grantTenantToUser", user_name, tenant_code)
 
     def update_tenant(
         self,
@@ -193,13 +434,11 @@ class GatewayEntryPoint:
         description: str | None = None,
     ):
         """Update tenant through java gateway."""
-        return self.gateway.entry_point.updateTenant(
-            user, tenant_id, code, queue_id, description
-        )
+        return self._call("updateTenant", user, tenant_id, code, queue_id, description)
 
     def delete_tenant(self, user: str, tenant_id: int):
         """Delete tenant through java gateway."""
-        return self.gateway.entry_point.deleteTenantById(user, tenant_id)
+        return self._call("deleteTenantById", user, tenant_id)
 
     def create_user(
         self,
@@ -212,13 +451,13 @@ class GatewayEntryPoint:
         status: int,
     ):
         """Create user through java gateway."""
-        return self.gateway.entry_point.createUser(
-            name, password, email, phone, tenant, queue, status
+        return self._call(
+            "createUser", name, password, email, phone, tenant, queue, status
         )
 
     def query_user(self, user_id: int):
         """Query user through java gateway."""
-        return self.gateway.queryUser(user_id)
+        return self._call("queryUser", user_id)
 
     def update_user(
         self,
@@ -231,13 +470,13 @@ class GatewayEntryPoint:
         status: int,
     ):
         """Update user through java gateway."""
-        return self.gateway.entry_point.updateUser(
-            name, password, email, phone, tenant, queue, status
+        return self._call(
+            "updateUser", name, password, email, phone, tenant, queue, status
         )
 
     def delete_user(self, name: str, user_id: int):
         """Delete user through java gateway."""
-        return self.gateway.entry_point.deleteUser(name, user_id)
+        return self._call("deleteUser", name, user_id)
 
     def get_dependent_info(
         self,
@@ -246,15 +485,25 @@ class GatewayEntryPoint:
         task_name: str | None = None,
     ):
         """Get dependent info through java gateway."""
-        return self.gateway.entry_point.getDependentInfo(
-            project_name, workflow_name, task_name
-        )
+        return self._call("getDependentInfo", project_name, workflow_name, task_name)
+
+    def get_dependent_info_batch(self, keys: list[tuple[str, str, str | None]]) -> list:
+        """Get many dependent info through java gateway, with each ``(project, workflow, task)`` in :param:`keys`.
+
+        The results are in the same order as :param:`keys`.
+        """
+        return self._call_batch("getDependentInfo", keys)
 
     def get_workflow_info(self, user_name: str, project_name: str, workflow_name: str):
         """Get workflow info through java gateway."""
-        return self.gateway.entry_point.getWorkflowInfo(
-            user_name, project_name, workflow_name
-        )
+        return self._call("getWorkflowInfo", user_name, project_name, workflow_name)
+
+    def get_workflow_info_batch(self, keys: list[tuple[str, str, str]]) -> list:
+        """Get many workflow info through java gateway, with each ``(user_name, project_name, workflow_name)`` in :param:`keys`.
+
+        The results are in the same order as :param:`keys`.
+        """
+        return self._call_batch("getWorkflowInfo", keys)
 
     def create_or_update_workflow(
         self,
@@ -276,7 +525,8 @@ class GatewayEntryPoint:
         other_params_json: str | None = None,
     ):
         """Create or update workflow through java gateway."""
-        return self.gateway.entry_point.createOrUpdateWorkflow(
+        return self._call(
+            "createOrUpdateWorkflow",
             user_name,
             project_name,
             name,
@@ -305,7 +555,8 @@ class GatewayEntryPoint:
         warning_group_id: int,
     ):
         """Exec workflow instance through java gateway."""
-        return self.gateway.entry_point.execWorkflowInstance(
+        return self._call(
+            "execWorkflowInstance",
             user_name,
             project_name,
             workflow_name,
@@ -316,3 +567,89 @@ class GatewayEntryPoint:
 
 
 gateway = GatewayEntryPoint()
+
+
+class AsyncGatewayEntryPoint:
+    """Asyncio version of :class:`GatewayEntryPoint`.
+
+    It has the same methods as :class:`GatewayEntryPoint` but all of them are coroutines, the blocking
+    py4j calls run in a thread pool executor and at most :param:`max_concurrency` of them run at the same
+    time, so asyncio applications could submit thousands of workflows without one thread per submission.
+
+    .. code-block:: python
+
+        async_gateway = AsyncGatewayEntryPoint()
+        info = await async_gateway.get_workflow_info(user, project, workflow)
+
+    :param entry_point: The :class:`GatewayEntryPoint` to delegate, default is the module level ``gateway``.
+    :param max_concurrency: Max number of py4j calls run at the same time, default is the pool size of
+        :param:`entry_point`.
+    """
+
+    def __init__(
+        self,
+        entry_point: GatewayEntryPoint | None = None,
+        max_concurrency: int | None = None,
+    ):
+        self._entry_point = entry_point or gateway
+        self.max_concurrency = max_concurrency or self._entry_point.pool_size
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get thread pool executor run py4j calls, create it when first access."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency,
+                        thread_name_prefix="pydolphinscheduler-gateway",
+                    )
+        return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # asyncio semaphore can only be used in the event loop it first used, so keep one per loop
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed in [lp for lp in self._semaphores if lp.is_closed()]:
+                del self._semaphores[closed]
+            if loop not in self._semaphores:
+                self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return self._semaphores[loop]
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run blocking function in executor with bounded concurrency.
+
+        It is useful when you want to run function which make multiple py4j calls as a whole, for example
+        :func:`pydolphinscheduler.core.workflow.Workflow.submit`.
+        """
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        attr = getattr(self._entry_point, name)
+        if name.startswith("_") or not callable(attr):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        @functools.wraps(attr)
+        async def wrapper(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        return wrapper
+
+    def close(self) -> None:
+        """Shutdown the executor, wait for the running py4j calls finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+async_gateway = AsyncGatewayEntryPoint(gateway)
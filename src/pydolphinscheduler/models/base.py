@@ -19,10 +19,24 @@
 
 from __future__ import annotations
 
+import functools
+
 # from pydolphinscheduler.models.user import User
 from pydolphinscheduler.utils.string import attr2camel
 
 
+@functools.lru_cache(maxsize=1024)
+def compile_define(
+    attrs: frozenset[str], camel_attr: bool = True
+) -> tuple[tuple[str, str], ...]:
+    """Compile attributes to pairs of attribute name and its key in definition.
+
+    The result is cached by the content of :param:`attrs`, so each distinct attribute set, usually one per
+    class, converts its keys only once, and attribute set changed in runtime get a new result.
+    """
+    return tuple((attr, attr2camel(attr) if camel_attr else attr) for attr in attrs)
+
+
 class Base:
     """DolphinScheduler Base object."""
 
@@ -51,14 +65,10 @@ class Base:
         self, camel_attr: bool = True, custom_attr: set = None
     ) -> dict:
         """Get object definition attribute by given attr set."""
-        content = {}
-        for attr in custom_attr:
-            val = getattr(self, attr, None)
-            if camel_attr:
-                content[attr2camel(attr)] = val
-            else:
-                content[attr] = val
-        return content
+        return {
+            key: getattr(self, attr, None)
+            for attr, key in compile_define(frozenset(custom_attr), camel_attr)
+        }
 
     def get_define(self, camel_attr: bool = True) -> dict:
         """Get object definition attribute communicate to Java gateway server.
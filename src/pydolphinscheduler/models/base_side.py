@@ -19,13 +19,23 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
+
 from pydolphinscheduler import configuration
 from pydolphinscheduler.models import Base
+from pydolphinscheduler.utils.cache import TTLCache
+
+# Process level registry of side models already ensured exists, key is returned by
+# :func:`BaseSide.ensure_key` and value is attributes set by :func:`BaseSide.create_if_not_exists`
+ensured_registry = TTLCache(configuration.CACHE_SIDE_MODEL_TTL)
 
 
 class BaseSide(Base):
     """Base class for models object, it declare base behavior for them."""
 
+    # Attributes set by :func:`create_if_not_exists`, will be restored when it is skipped by :func:`ensure_exists`
+    _ENSURE_RESULT_ATTR: tuple[str, ...] = ()
+
     def __init__(self, name: str, description: str | None = None):
         super().__init__(name, description)
 
@@ -39,6 +49,39 @@ class BaseSide(Base):
         """Create Base if not exists."""
         raise NotImplementedError
 
+    def ensure_key(self, *args) -> Hashable:
+        """Get key of this side model in :data:`ensured_registry` with arguments of :func:`create_if_not_exists`."""
+        return (type(self).__name__, self.name, *args)
+
+    def ensure_exists(self, *args) -> None:
+        """Create side model if not exists, skip calling Java gateway if it already ensured in this process.
+
+        It is the memoized version of :func:`create_if_not_exists`, the entries of the registry expire after
+        ``cache.side_model_ttl`` seconds, or use :func:`invalidate_ensured` to remove them explicitly.
+        """
+        key = self.ensure_key(*args)
+        result = ensured_registry.get(key)
+        if result is not None:
+            for attr, value in result.items():
+                setattr(self, attr, value)
+            return
+        self.create_if_not_exists(*args)
+        ensured_registry.set(
+            key, {attr: getattr(self, attr) for attr in self._ENSURE_RESULT_ATTR}
+        )
+
+    @classmethod
+    def invalidate_ensured(cls, name: str | None = None) -> None:
+        """Remove side models from ensured registry, make next :func:`ensure_exists` call Java gateway.
+
+        Remove entries of this class, filtered by :param:`name` if given. Calling it by :class:`BaseSide`
+        itself removes all entries in the registry.
+        """
+        ensured_registry.invalidate(
+            predicate=lambda key: (cls is BaseSide or key[0] == cls.__name__)
+            and (name is None or key[1] == name)
+        )
+
     def delete_all(self):
         """Delete all method."""
         if not self:
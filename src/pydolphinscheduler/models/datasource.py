@@ -25,9 +25,16 @@ from dataclasses import dataclass
 
 from py4j.java_gateway import JavaObject
 
+from pydolphinscheduler import configuration
+from pydolphinscheduler.core.offline import Placeholder, is_offline
 from pydolphinscheduler.java_gateway import gateway
 from pydolphinscheduler.models.connection import Connection
 from pydolphinscheduler.models.meta import ModelMeta
+from pydolphinscheduler.utils.cache import TTLCache
+
+# Process level cache of datasource task usage, keyed by datasource (name, type). Use its ``stats``
+# method to get the hits and misses
+datasource_cache = TTLCache(configuration.CACHE_DATASOURCE_TTL)
 
 
 @dataclass
@@ -128,12 +135,51 @@ class Datasource(metaclass=ModelMeta):
     def get_task_usage_4j(
         cls, datasource_name: str, datasource_type: str | None = None
     ) -> TaskUsage:
-        """Get the necessary information of datasource for task usage in web UI."""
-        datasource: Datasource = cls.get(datasource_name, datasource_type)
-        return TaskUsage(
-            id=datasource.id,
-            type=datasource.type.upper(),
-        )
+        """Get the necessary information of datasource for task usage in web UI.
+
+        The result is cached in :data:`datasource_cache` keyed by datasource name and type.
+        """
+        key = (datasource_name, datasource_type)
+        if is_offline():
+            return TaskUsage(
+                id=Placeholder(Placeholder.DATASOURCE, key, "id"),
+                type=(
+                    datasource_type.upper()
+                    if datasource_type
+                    else Placeholder(Placeholder.DATASOURCE, key, "type")
+                ),
+            )
+        task_usage = datasource_cache.get(key)
+        if task_usage is None:
+            datasource: Datasource = cls.get(datasource_name, datasource_type)
+            task_usage = TaskUsage(
+                id=datasource.id,
+                type=datasource.type.upper(),
+            )
+            datasource_cache.set(key, task_usage)
+        return task_usage
+
+    @classmethod
+    def prefetch_task_usage(cls, keys: set[tuple[str, str | None]]) -> None:
+        """Query all datasources not in :data:`datasource_cache` in batch, and cache their task usage.
+
+        :param keys: Set of datasource ``(name, type)``. Datasource not found is skipped here, and will
+            raise error when :func:`get_task_usage_4j` is called.
+        """
+        if not datasource_cache.enabled:
+            return
+        missing = [key for key in keys if key not in datasource_cache]
+        if not missing:
+            return
+        for key, datasource in zip(missing, gateway.get_datasource_batch(missing)):
+            if datasource is not None:
+                datasource_cache.set(
+                    key,
+                    TaskUsage(
+                        id=datasource.getId(),
+                        type=datasource.getType().getDescp().upper(),
+                    ),
+                )
 
     @property
     def connection(self) -> Connection:
@@ -62,11 +62,13 @@ class Project(BaseSide):
         description=None,
     ) -> None:
         """Update Project."""
+        self.invalidate_ensured(self.name)
         gateway.update_project(user, project_code, project_name, description)
         self.name = project_name
         self.description = description
 
     def delete(self, user=configuration.USER_NAME) -> None:
         """Delete Project."""
+        self.invalidate_ensured(self.name)
         gateway.delete_project(user, self.code)
         self.delete_all()
@@ -76,5 +76,7 @@ class Tenant(BaseSide):
 
     def delete(self) -> None:
         """Delete Tenant."""
+        # tenant is ensured together with user, so all ensured side models are out of date
+        BaseSide.invalidate_ensured()
         gateway.delete_tenant(self.user_name, self.tenant_id)
         self.delete_all()
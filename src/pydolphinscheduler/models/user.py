@@ -37,6 +37,8 @@ class User(BaseSide):
         "status",
     }
 
+    _ENSURE_RESULT_ATTR = ("user_id",)
+
     def __init__(
         self,
         name: str,
@@ -61,6 +63,14 @@ class User(BaseSide):
         tenant = Tenant(name=self.tenant, queue=self.queue)
         tenant.create_if_not_exists(self.queue)
 
+    def ensure_key(self, *args) -> tuple:
+        """Get key of user in ensured registry, user would be created again if any key attribute changed."""
+        return (
+            type(self).__name__,
+            self.name,
+            *(getattr(self, attr) for attr in sorted(self._KEY_ATTR - {"name"})),
+        )
+
     def create_if_not_exists(self, **kwargs):
         """Create User if not exists."""
         # Should make sure queue already exists.
@@ -107,6 +117,7 @@ class User(BaseSide):
         status=None,
     ) -> None:
         """Update User."""
+        self.invalidate_ensured(self.name)
         user = gateway.update_user(
             self.name,
             password,
@@ -126,5 +137,6 @@ class User(BaseSide):
 
     def delete(self) -> None:
         """Delete User."""
+        self.invalidate_ensured(self.name)
         gateway.delete_user(self.name, self.user_id)
         self.delete_all()
@@ -15,12 +15,46 @@
 # specific language governing permissions and limitations
 # under the License.
 
-"""Init resources_plugin package."""
+"""Init resources_plugin package.
 
-from pydolphinscheduler.resources_plugin.github import GitHub
-from pydolphinscheduler.resources_plugin.gitlab import GitLab
-from pydolphinscheduler.resources_plugin.local import Local
-from pydolphinscheduler.resources_plugin.oss import OSS
-from pydolphinscheduler.resources_plugin.s3 import S3
+Resource plugins are imported lazily when they are first accessed, so importing one plugin, such as
+``from pydolphinscheduler.resources_plugin import Local``, does not import the SDKs of other plugins, like
+``boto3``, ``oss2`` and ``python-gitlab``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydolphinscheduler.resources_plugin.github import GitHub
+    from pydolphinscheduler.resources_plugin.gitlab import GitLab
+    from pydolphinscheduler.resources_plugin.local import Local
+    from pydolphinscheduler.resources_plugin.oss import OSS
+    from pydolphinscheduler.resources_plugin.s3 import S3
+
+# Submodule of each name imported lazily
+_LAZY_IMPORTS = {
+    "GitHub": "github",
+    "GitLab": "gitlab",
+    "Local": "local",
+    "OSS": "oss",
+    "S3": "s3",
+}
 
 __all__ = ["Local", "GitHub", "GitLab", "OSS", "S3"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import resource plugin from its submodule when it is first accessed, see :pep:`562`."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include names not imported yet in ``dir()`` of package."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
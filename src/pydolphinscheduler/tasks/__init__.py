@@ -15,32 +15,79 @@
 # specific language governing permissions and limitations
 # under the License.
 
-"""Init pydolphinscheduler.tasks package."""
+"""Init pydolphinscheduler.tasks package.
 
-from pydolphinscheduler.tasks.condition import FAILURE, SUCCESS, And, Condition, Or
-from pydolphinscheduler.tasks.datax import CustomDataX, DataX
-from pydolphinscheduler.tasks.dependent import Dependent
-from pydolphinscheduler.tasks.dvc import DVCDownload, DVCInit, DVCUpload
-from pydolphinscheduler.tasks.flink import Flink
-from pydolphinscheduler.tasks.http import Http
-from pydolphinscheduler.tasks.kubernetes import Kubernetes
-from pydolphinscheduler.tasks.map_reduce import MR
-from pydolphinscheduler.tasks.mlflow import (
-    MLflowModels,
-    MLFlowProjectsAutoML,
-    MLFlowProjectsBasicAlgorithm,
-    MLFlowProjectsCustom,
-)
-from pydolphinscheduler.tasks.openmldb import OpenMLDB
-from pydolphinscheduler.tasks.procedure import Procedure
-from pydolphinscheduler.tasks.python import Python
-from pydolphinscheduler.tasks.pytorch import Pytorch
-from pydolphinscheduler.tasks.sagemaker import SageMaker
-from pydolphinscheduler.tasks.shell import Shell
-from pydolphinscheduler.tasks.spark import Spark
-from pydolphinscheduler.tasks.sql import Sql
-from pydolphinscheduler.tasks.sub_workflow import SubWorkflow
-from pydolphinscheduler.tasks.switch import Branch, Default, Switch, SwitchCondition
+Task classes are imported lazily when they are first accessed, so importing one task, such as
+``from pydolphinscheduler.tasks import Shell``, does not import modules of all the other tasks and their
+dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydolphinscheduler.tasks.condition import FAILURE, SUCCESS, And, Condition, Or
+    from pydolphinscheduler.tasks.datax import CustomDataX, DataX
+    from pydolphinscheduler.tasks.dependent import Dependent
+    from pydolphinscheduler.tasks.dvc import DVCDownload, DVCInit, DVCUpload
+    from pydolphinscheduler.tasks.flink import Flink
+    from pydolphinscheduler.tasks.http import Http
+    from pydolphinscheduler.tasks.kubernetes import Kubernetes
+    from pydolphinscheduler.tasks.map_reduce import MR
+    from pydolphinscheduler.tasks.mlflow import (
+        MLflowModels,
+        MLFlowProjectsAutoML,
+        MLFlowProjectsBasicAlgorithm,
+        MLFlowProjectsCustom,
+    )
+    from pydolphinscheduler.tasks.openmldb import OpenMLDB
+    from pydolphinscheduler.tasks.procedure import Procedure
+    from pydolphinscheduler.tasks.python import Python
+    from pydolphinscheduler.tasks.pytorch import Pytorch
+    from pydolphinscheduler.tasks.sagemaker import SageMaker
+    from pydolphinscheduler.tasks.shell import Shell
+    from pydolphinscheduler.tasks.spark import Spark
+    from pydolphinscheduler.tasks.sql import Sql
+    from pydolphinscheduler.tasks.sub_workflow import SubWorkflow
+    from pydolphinscheduler.tasks.switch import Branch, Default, Switch, SwitchCondition
+
+# Submodule of each name imported lazily
+_LAZY_IMPORTS = {
+    "FAILURE": "condition",
+    "SUCCESS": "condition",
+    "And": "condition",
+    "Condition": "condition",
+    "Or": "condition",
+    "CustomDataX": "datax",
+    "DataX": "datax",
+    "Dependent": "dependent",
+    "DVCDownload": "dvc",
+    "DVCInit": "dvc",
+    "DVCUpload": "dvc",
+    "Flink": "flink",
+    "Http": "http",
+    "Kubernetes": "kubernetes",
+    "MR": "map_reduce",
+    "MLflowModels": "mlflow",
+    "MLFlowProjectsAutoML": "mlflow",
+    "MLFlowProjectsBasicAlgorithm": "mlflow",
+    "MLFlowProjectsCustom": "mlflow",
+    "OpenMLDB": "openmldb",
+    "Procedure": "procedure",
+    "Python": "python",
+    "Pytorch": "pytorch",
+    "SageMaker": "sagemaker",
+    "Shell": "shell",
+    "Spark": "spark",
+    "Sql": "sql",
+    "SubWorkflow": "sub_workflow",
+    "Branch": "switch",
+    "Default": "switch",
+    "Switch": "switch",
+    "SwitchCondition": "switch",
+}
 
 __all__ = [
     "Condition",
@@ -69,3 +116,17 @@ __all__ = [
     "SageMaker",
     "Kubernetes",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import task class from its submodule when it is first accessed, see :pep:`562`."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include names not imported yet in ``dir()`` of package."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
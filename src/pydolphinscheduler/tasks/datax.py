@@ -194,6 +194,15 @@ class DataX(WorkerResourceMixin, BatchTask):
             "dataTarget": datasource_task_u.id,
         }
 
+    @classmethod
+    def prefetch(cls, tasks: list[DataX]) -> None:
+        """Prefetch all distinct source and target datasources of tasks in batch."""
+        super().prefetch(tasks)
+        Datasource.prefetch_task_usage(
+            {(task.datasource_name, task.datasource_type) for task in tasks}
+            | {(task.datatarget_name, task.datatarget_type) for task in tasks}
+        )
+
     @property
     def task_params(self, camel_attr: bool = True, custom_attr: set = None) -> dict:
         """Override Task.task_params for datax task.
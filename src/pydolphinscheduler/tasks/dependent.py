@@ -20,15 +20,24 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterable, Iterator
 
+from py4j.protocol import Py4JError
+
+from pydolphinscheduler import configuration
 from pydolphinscheduler.constants import TaskType
+from pydolphinscheduler.core.offline import Placeholder, is_offline
 from pydolphinscheduler.core.task import BatchTask
 from pydolphinscheduler.exceptions import PyDSJavaGatewayException, PyDSParamException
 from pydolphinscheduler.java_gateway import gateway
 from pydolphinscheduler.models.base import Base
+from pydolphinscheduler.utils.cache import TTLCache
 
 DEPENDENT_ALL_TASK_IN_WORKFLOW = "0"
 
+# Process level cache of dependent info, keyed by :attr:`DependentItem.code_parameter`
+dependent_cache = TTLCache(configuration.CACHE_DEPENDENT_TTL)
+
 
 class DependentDate(str):
     """Constant of Dependent date value.
@@ -181,16 +190,56 @@ class DependentItem(Base):
         return param
 
     def get_code_from_gateway(self) -> dict:
-        """Get project, definition, task code from given parameter."""
+        """Get project, definition, task code from given parameter, cached in :data:`dependent_cache`."""
         if self._code:
             return self._code
+        elif is_offline():
+            return {
+                field: Placeholder(Placeholder.DEPENDENT, self.code_parameter, field)
+                for field in (
+                    "projectCode",
+                    "workflowDefinitionCode",
+                    "taskDefinitionCode",
+                )
+            }
         else:
             try:
-                self._code = gateway.get_dependent_info(*self.code_parameter)
+                self._code = dependent_cache.get_or_set(
+                    self.code_parameter,
+                    lambda: gateway.get_dependent_info(*self.code_parameter),
+                )
                 return self._code
             except Exception:
                 raise PyDSJavaGatewayException("Function get_code_from_gateway error.")
 
+    @classmethod
+    def prefetch(cls, items: Iterable[DependentItem]) -> None:
+        """Resolve codes of many dependent items in one batch, items with the same parameter resolve once.
+
+        Items already resolved or in :data:`dependent_cache` are skipped.
+        """
+        pending: dict[tuple, list[DependentItem]] = {}
+        for item in items:
+            if item._code:
+                continue
+            code = dependent_cache.get(item.code_parameter)
+            if code is not None:
+                item._code = code
+            else:
+                pending.setdefault(item.code_parameter, []).append(item)
+        if not pending:
+            return
+        try:
+            codes = gateway.get_dependent_info_batch(list(pending))
+        except Py4JError as ex:
+            raise PyDSJavaGatewayException(
+                "Function get_dependent_info_batch error."
+            ) from ex
+        for key, code in zip(pending, codes):
+            dependent_cache.set(key, code)
+            for item in pending[key]:
+                item._code = code
+
 
 class DependentOperator(Base):
     """Set DependentItem or dependItemList with specific operator."""
@@ -206,6 +255,14 @@ class DependentOperator(Base):
     def __repr__(self) -> str:
         return "depend_task_list"
 
+    def items(self) -> Iterator[DependentItem]:
+        """Get all :class:`DependentItem` in this operator and its children operators recursively."""
+        for dependent in self.args:
+            if isinstance(dependent, DependentItem):
+                yield dependent
+            elif isinstance(dependent, DependentOperator):
+                yield from dependent.items()
+
     @classmethod
     def operator_name(cls) -> str:
         """Get operator name in different class."""
@@ -291,3 +348,14 @@ class Dependent(BatchTask):
         params = super().task_params
         params["dependence"] = self.dependence.get_define()
         return params
+
+    @classmethod
+    def prefetch(cls, tasks: list[Dependent]) -> None:
+        """Prefetch codes of all dependent items in tasks in one batch."""
+        super().prefetch(tasks)
+        DependentItem.prefetch(
+            item
+            for task in tasks
+            if isinstance(task.dependence, DependentOperator)
+            for item in task.dependence.items()
+        )
@@ -67,6 +67,14 @@ class Procedure(BatchTask):
             "type": datasource_task_u.type,
         }
 
+    @classmethod
+    def prefetch(cls, tasks: list[Procedure]) -> None:
+        """Prefetch all distinct datasources of tasks in batch."""
+        super().prefetch(tasks)
+        Datasource.prefetch_task_usage(
+            {(task.datasource_name, task.datasource_type) for task in tasks}
+        )
+
     @property
     def task_params(self, camel_attr: bool = True, custom_attr: set = None) -> dict:
         """Override Task.task_params for produce task.
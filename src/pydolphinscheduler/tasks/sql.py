@@ -149,6 +149,14 @@ class Sql(BatchTask):
             "type": datasource_task_u.type,
         }
 
+    @classmethod
+    def prefetch(cls, tasks: list[Sql]) -> None:
+        """Prefetch all distinct datasources of tasks in batch."""
+        super().prefetch(tasks)
+        Datasource.prefetch_task_usage(
+            {(task.datasource_name, task.datasource_type) for task in tasks}
+        )
+
     @property
     def task_params(self, camel_attr: bool = True, custom_attr: set = None) -> dict:
         """Override Task.task_params for sql task.
@@ -20,7 +20,9 @@
 from __future__ import annotations
 
 from pydolphinscheduler.constants import TaskType
+from pydolphinscheduler.core.offline import Placeholder, is_offline
 from pydolphinscheduler.core.task import BatchTask
+from pydolphinscheduler.core.workflow import workflow_code_cache
 from pydolphinscheduler.exceptions import PyDSWorkflowNotAssignException
 from pydolphinscheduler.java_gateway import gateway
 
@@ -40,8 +42,39 @@ class SubWorkflow(BatchTask):
 
         We can not change this function name to workflow_code, because it is a keyword used in
         dolphinscheduler itself.
+
+        The code is cached in :data:`pydolphinscheduler.core.workflow.workflow_code_cache`, which also
+        contains codes of workflows submitted in the same process.
         """
-        return self.get_workflow_info(self.workflow_name).get("code")
+        if not self.workflow:
+            # raise the same error as it is in get_workflow_info
+            return self.get_workflow_info(self.workflow_name).get("code")
+        if is_offline():
+            return Placeholder(Placeholder.WORKFLOW, self.workflow_code_key)
+        return workflow_code_cache.get_or_set(
+            self.workflow_code_key,
+            lambda: self.get_workflow_info(self.workflow_name).get("code"),
+        )
+
+    @property
+    def workflow_code_key(self) -> tuple[str, str, str]:
+        """Get key of referenced workflow in workflow code cache, it is user name, project name and workflow name."""
+        return self.workflow.user.name, self.workflow.project.name, self.workflow_name
+
+    @classmethod
+    def prefetch(cls, tasks: list[SubWorkflow]) -> None:
+        """Override Task.prefetch, query codes of all referenced workflows not cached in one batch."""
+        super().prefetch(tasks)
+        if not workflow_code_cache.enabled:
+            return
+        keys = {task.workflow_code_key for task in tasks if task.workflow}
+        missing = [key for key in keys if key not in workflow_code_cache]
+        if not missing:
+            return
+        infos = gateway.get_workflow_info_batch(missing)
+        for key, info in zip(missing, infos):
+            if info is not None:
+                workflow_code_cache.set(key, info.get("code"))
 
     def get_workflow_info(self, workflow_name: str) -> dict:
         """Get workflow info from java gateway, contains workflow id, name, code."""
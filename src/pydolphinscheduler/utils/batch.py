@@ -0,0 +1,73 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Helpers for submitting or pushing a batch of workflows, where error of one item do not affect others."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def split_waves(
+    items: list[T],
+    key: Callable[[T], Hashable],
+    depends: Callable[[T], Iterable[Hashable]],
+) -> list[list[T]]:
+    """Split items into waves, item is in a later wave than all items it depends on in the same batch.
+
+    Items in the same wave could be handled concurrently. Items in a dependency cycle can not be ordered,
+    and are put in the last wave.
+
+    :param items: Items to be split, keep their order in each wave.
+    :param key: Get the key of item which other items depend on.
+    :param depends: Get keys of items the item depends on, keys not in the batch are ignored.
+    """
+    keys = [key(item) for item in items]
+    requires = [
+        set(depends(item)).intersection(keys) - {item_key}
+        for item, item_key in zip(items, keys)
+    ]
+    waves, done, remain = [], set(), list(range(len(items)))
+    while remain:
+        wave = [idx for idx in remain if requires[idx] <= done]
+        if not wave:
+            waves.append([items[idx] for idx in remain])
+            break
+        waves.append([items[idx] for idx in wave])
+        done.update(keys[idx] for idx in wave)
+        handled = set(wave)
+        remain = [idx for idx in remain if idx not in handled]
+    return waves
+
+
+def run_shared(shared: list, func: Callable[[Any], Any]) -> None:
+    """Run func once for results sharing the same dependency, and record its error to all of them.
+
+    :param shared: Results with attributes ``success`` and ``error``, results already failed are skipped.
+    :param func: Function called with the first result not failed yet.
+    """
+    pending = [result for result in shared if result.success]
+    if not pending:
+        return
+    try:
+        func(pending[0])
+    except Exception as ex:  # noqa: BLE001
+        for result in pending:
+            result.error = ex
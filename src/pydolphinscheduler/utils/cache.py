@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""In memory cache used to avoid calling Java gateway repeatedly in one process."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread safe in memory cache which entries expire after :param:`ttl` seconds.
+
+    :param ttl: Seconds an entry stays in the cache, ``0`` means cache is disabled and nothing will be
+        stored, negative value means entries never expired.
+    """
+
+    def __init__(self, ttl: float = 0):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache store entries or not."""
+        return self.ttl != 0
+
+    def _expired(self, expire_at: float) -> bool:
+        return self.ttl > 0 and time.monotonic() >= expire_at
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value of key, return :param:`default` if key not exists or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Set value of key, do nothing when cache is disabled."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Get value of key, call :param:`func` and cache its return value when missing."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            self.set(key, value)
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        # check existence only, do not count it as hit or miss
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and not self._expired(entry[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def invalidate(
+        self,
+        key: Hashable = _MISSING,
+        predicate: Callable[[Hashable], bool] | None = None,
+    ) -> None:
+        """Remove entries from cache.
+
+        Remove single :param:`key` if given, entries whose key matches :param:`predicate` if given, otherwise
+        remove all entries.
+        """
+        with self._lock:
+            if key is not _MISSING:
+                self._data.pop(key, None)
+            elif predicate is not None:
+                for k in [k for k in self._data if predicate(k)]:
+                    del self._data[k]
+            else:
+                self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get hits, misses and size of the cache."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
@@ -19,6 +19,9 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -56,3 +59,41 @@ def write(
         raise FileExistsError(
             "File %s already exists and you choose not overwrite mode.", to_path
         )
+
+
+@contextmanager
+def lock(path: str | Path) -> Iterator[None]:
+    """Hold an exclusive lock of file :param:`path` across processes in the context, block until acquired.
+
+    The lock file is created if it does not exist, and is kept after released so other processes could
+    lock the same file.
+
+    :param path: The path of lock file, usually next to the file to be protected.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode="a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    # LK_LOCK retries only for about 10 seconds before raising
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
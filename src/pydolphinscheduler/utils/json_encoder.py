@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Pluggable JSON encoder for workflow definition sent to Java gateway."""
+
+from __future__ import annotations
+
+import functools
+import io
+import json
+from collections.abc import Iterable
+from typing import Any, Callable
+
+from pydolphinscheduler import configuration
+from pydolphinscheduler.constants import JsonEncoder
+from pydolphinscheduler.exceptions import PyDSConfException
+
+
+def _to_builtin(obj: Any) -> Any:
+    """Convert subclasses of builtin scalar types, like ``ScalarFloat`` loaded by ruamel, to builtin ones."""
+    for type_ in (float, int, str):
+        if isinstance(obj, type_):
+            return type_(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _orjson_dumps() -> Callable[[Any], str]:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_to_builtin, option=option).decode()
+
+    return dumps
+
+
+def _ujson_dumps() -> Callable[[Any], str]:
+    import ujson
+
+    return functools.partial(ujson.dumps, ensure_ascii=False)
+
+
+_ENCODERS = {
+    JsonEncoder.ORJSON: _orjson_dumps,
+    JsonEncoder.UJSON: _ujson_dumps,
+    JsonEncoder.JSON: lambda: json.dumps,
+}
+
+
+def get_dumps(encoder: str | None = None) -> Callable[[Any], str]:
+    """Get function encoding object to JSON string with given encoder.
+
+    :param encoder: Name of encoder, one of :class:`pydolphinscheduler.constants.JsonEncoder`. Default use
+        ``default.workflow.json_encoder`` in configuration. ``auto`` use the first installed one of ``orjson``
+        and ``ujson``, and fall back to Python built-in ``json``.
+    """
+    return _load_dumps((encoder or configuration.WORKFLOW_JSON_ENCODER).lower())
+
+
+@functools.cache
+def _load_dumps(encoder: str) -> Callable[[Any], str]:
+    """Import encoder and get its dumps function, cached so each encoder only imported once."""
+    if encoder == JsonEncoder.AUTO:
+        for candidate in (JsonEncoder.ORJSON, JsonEncoder.UJSON):
+            try:
+                return _ENCODERS[candidate]()
+            except ImportError:
+                continue
+        return json.dumps
+    if encoder not in _ENCODERS:
+        raise PyDSConfException(
+            "JSON encoder %s is not supported, only support %s.",
+            encoder,
+            ", ".join([JsonEncoder.AUTO, *_ENCODERS]),
+        )
+    try:
+        return _ENCODERS[encoder]()
+    except ImportError as ex:
+        raise PyDSConfException(
+            "JSON encoder %s is not installed, install it or use another encoder.",
+            encoder,
+        ) from ex
+
+
+def dumps(obj: Any, encoder: str | None = None) -> str:
+    """Encode object to JSON string, see :func:`get_dumps` for :param:`encoder`."""
+    return get_dumps(encoder)(obj)
+
+
+def dumps_array(items: Iterable[Any], encoder: str | None = None) -> str:
+    """Encode items to JSON array string, items are written to one buffer once they are produced.
+
+    Comparing to :func:`dumps` a list, :param:`items` could be a generator, so the whole list of items do
+    not have to be kept in memory before encoding.
+    """
+    encode = get_dumps(encoder)
+    buffer = io.StringIO()
+    buffer.write("[")
+    for idx, item in enumerate(items):
+        if idx:
+            buffer.write(",")
+        buffer.write(encode(item))
+    buffer.write("]")
+    return buffer.getvalue()
@@ -19,7 +19,6 @@
 
 from __future__ import annotations
 
-import copy
 import io
 from typing import Any
 
@@ -58,12 +57,17 @@ class YamlParser:
 
         yaml_parser["one.two1.three"] = "value3"
         yaml_parser["one.two2"] = "value4"
+
+    All nested keys are indexed once when content loaded, and kept in sync when value changed by nested path,
+    so get and set value by nested path do not copy or walk the whole object. Values returned are the objects
+    in :class:`ruamel.yaml.YAML` object rather than their copies, change them by nested path assigned instead
+    of in place, to keep the index in sync.
     """
 
     def __init__(self, content: str, delimiter: str | None = "."):
         self._content = content
-        self.src_parser = content
         self._delimiter = delimiter
+        self.src_parser = content
 
     @property
     def src_parser(self) -> CommentedMap:
@@ -75,24 +79,31 @@ class YamlParser:
         """Set src_parser property."""
         self._yaml = YAML()
         self._src_parser = self._yaml.load(content)
+        self._index: dict[str, tuple[CommentedMap, Any]] = {}
+        self.parse_nested_dict(self._index, self._src_parser, None)
 
     def parse_nested_dict(
-        self, result: dict, commented_map: CommentedMap, key: str
+        self, result: dict, commented_map: CommentedMap, key: str | None
     ) -> None:
-        """Parse :class:`ruamel.yaml.comments.CommentedMap` to nested dict using :param:`delimiter`."""
+        """Index :class:`ruamel.yaml.comments.CommentedMap` to nested dict using :param:`delimiter`.
+
+        Each nested key is mapped to its parent map and the key in parent, so value could be got or set
+        directly by it.
+        """
         if not isinstance(commented_map, CommentedMap):
             return
-        for sub_key in set(commented_map.keys()):
-            next_key = f"{key}{self._delimiter}{sub_key}"
-            result[next_key] = commented_map[sub_key]
+        for sub_key in commented_map:
+            next_key = sub_key if key is None else f"{key}{self._delimiter}{sub_key}"
+            result[next_key] = (commented_map, sub_key)
             self.parse_nested_dict(result, commented_map[sub_key], next_key)
 
     @property
     def dict_parser(self) -> dict:
         """Get :class:`CommentedMap` to nested dict using :param:`delimiter` as key delimiter.
 
-        Use Depth-First-Search get all nested key and value, and all key connect by :param:`delimiter`.
-        It make users could easier access or change :class:`CommentedMap` object.
+        Get all nested key and value from the index, and all key connect by :param:`delimiter`. Values are
+        the objects in :class:`CommentedMap` without copy. It make users could easier access or change
+        :class:`CommentedMap` object.
 
         For example, yaml config named ``test.yaml`` and its content as below:
 
@@ -114,35 +125,28 @@ class YamlParser:
                 "one.two2": "value2",
             }
         """
-        res = dict()
-        src_parser_copy = copy.deepcopy(self.src_parser)
-
-        base_keys = set(src_parser_copy.keys())
-        if not base_keys:
-            return res
-        else:
-            for key in base_keys:
-                res[key] = src_parser_copy[key]
-                self.parse_nested_dict(res, src_parser_copy[key], key)
-            return res
+        return {key: parent[sub_key] for key, (parent, sub_key) in self._index.items()}
 
     def __contains__(self, key) -> bool:
-        return key in self.dict_parser
+        return key in self._index
 
     def __getitem__(self, key: str) -> Any:
-        return self.dict_parser[key]
+        parent, sub_key = self._index[key]
+        return parent[sub_key]
 
     def __setitem__(self, key: str, val: Any) -> None:
-        if key not in self.dict_parser:
+        if key not in self._index:
             raise KeyError("Key %s do not exists.", key)
 
-        mid = None
-        keys = key.split(self._delimiter)
-        for idx, k in enumerate(keys, 1):
-            if idx == len(keys):
-                mid[k] = val
-            else:
-                mid = mid[k] if mid else self.src_parser[k]
+        parent, sub_key = self._index[key]
+        if isinstance(parent[sub_key], CommentedMap):
+            prefix = f"{key}{self._delimiter}"
+            for nested in [
+                nested for nested in self._index if str(nested).startswith(prefix)
+            ]:
+                del self._index[nested]
+        parent[sub_key] = val
+        self.parse_nested_dict(self._index, val, key)
 
     def get(self, key: str) -> Any:
         """Get value by key, is call ``__getitem__``."""
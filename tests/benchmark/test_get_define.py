@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Benchmark serializing task definition with compiled attribute keys."""
+
+import time
+from unittest.mock import patch
+
+from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.models import base
+from pydolphinscheduler.tasks.shell import Shell
+from pydolphinscheduler.utils.string import attr2camel
+
+TASK_NUM = 5000
+
+
+def legacy_get_define_custom(self, camel_attr=True, custom_attr=None):
+    """Implementation of :func:`Base.get_define_custom` before attributes keys compiled."""
+    content = {}
+    for attr in custom_attr:
+        val = getattr(self, attr, None)
+        if camel_attr:
+            content[attr2camel(attr)] = val
+        else:
+            content[attr] = val
+    return content
+
+
+def _timeit(tasks) -> float:
+    start = time.perf_counter()
+    for task in tasks:
+        task.get_define()
+    return time.perf_counter() - start
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    side_effect=[(i, 1) for i in range(TASK_NUM)],
+)
+def test_benchmark_get_define(mock_code_version):
+    """Compare serializing tasks definition with and without compiled attribute keys."""
+    with Workflow("benchmark-get-define"):
+        tasks = [Shell(name=f"task-{i}", command="echo 1") for i in range(TASK_NUM)]
+
+    with patch.object(base.Base, "get_define_custom", legacy_get_define_custom):
+        legacy_defines = [task.get_define() for task in tasks]
+        legacy = _timeit(tasks)
+    assert [task.get_define() for task in tasks] == legacy_defines
+    compiled = _timeit(tasks)
+
+    print(
+        f"\nget_define of {TASK_NUM} tasks: legacy {legacy:.3f}s, compiled {compiled:.3f}s, "
+        f"speedup {legacy / compiled:.2f}x"
+    )
+    assert compiled < legacy
@@ -0,0 +1,32 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark import time of package with single task and all tasks imported."""
+
+from tests.test_import_time import import_time
+
+
+def test_benchmark_import_tasks():
+    """Compare import time of package with single task imported lazily and all tasks imported."""
+    single, _ = import_time("from pydolphinscheduler.tasks import Shell")
+    every, _ = import_time("from pydolphinscheduler.tasks import *")
+    single_us, every_us = sum(single.values()), sum(every.values())
+    print(
+        f"\nImport time of pydolphinscheduler with single task {single_us}us, "
+        f"with all tasks {every_us}us, speedup {every_us / single_us:.2f}x"
+    )
+    assert single_us < every_us
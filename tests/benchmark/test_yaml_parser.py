@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark loading and looking up YAML by nested key with indexed keys."""
+
+import copy
+import time
+
+from pydolphinscheduler.configuration import BUILD_IN_CONFIG_PATH
+from pydolphinscheduler.utils.yaml_parser import YamlParser
+
+# Lookups ``pydolphinscheduler.configuration`` does when imported
+CONFIG_LOOKUPS = 20
+WORKFLOW_TASK_NUM = 200
+WORKFLOW_LOOKUPS = 20
+
+
+class LegacyYamlParser(YamlParser):
+    """Implementation of :class:`YamlParser` before nested keys indexed, deep copy in each lookup."""
+
+    @property
+    def dict_parser(self) -> dict:
+        """Deep copy the whole object and flatten its nested keys."""
+        res = {}
+        src_parser_copy = copy.deepcopy(self.src_parser)
+        for key in src_parser_copy:
+            res[key] = src_parser_copy[key]
+            self._legacy_nested(res, src_parser_copy[key], key)
+        return res
+
+    def _legacy_nested(self, result, commented_map, key) -> None:
+        if not isinstance(commented_map, dict):
+            return
+        for sub_key in commented_map:
+            next_key = f"{key}{self._delimiter}{sub_key}"
+            result[next_key] = commented_map[sub_key]
+            self._legacy_nested(result, commented_map[sub_key], next_key)
+
+    def __contains__(self, key) -> bool:
+        return key in self.dict_parser
+
+    def __getitem__(self, key: str):
+        return self.dict_parser[key]
+
+
+def _timeit(parser_cls, content: str, keys: list[str]) -> float:
+    start = time.perf_counter()
+    parser = parser_cls(content)
+    for key in keys:
+        parser[key]
+    return time.perf_counter() - start
+
+
+def _compare(title: str, content: str, keys: list[str]) -> None:
+    legacy_parser, indexed_parser = LegacyYamlParser(content), YamlParser(content)
+    assert all(legacy_parser[key] == indexed_parser[key] for key in set(keys))
+
+    legacy = _timeit(LegacyYamlParser, content, keys)
+    indexed = _timeit(YamlParser, content, keys)
+    print(
+        f"\n{title}, load and {len(keys)} lookups: legacy {legacy:.3f}s, indexed {indexed:.3f}s, "
+        f"speedup {legacy / indexed:.2f}x"
+    )
+    assert indexed < legacy
+
+
+def test_benchmark_config_lookup():
+    """Compare loading configuration and looking up keys like module import, with and without index."""
+    content = BUILD_IN_CONFIG_PATH.read_text()
+    keys = [key for key in YamlParser(content).dict_parser if key.count(".") >= 2]
+    keys = (keys * CONFIG_LOOKUPS)[:CONFIG_LOOKUPS]
+    _compare("Default configuration", content, keys)
+
+
+def test_benchmark_workflow_lookup():
+    """Compare loading large workflow YAML and looking up keys, with and without index."""
+    tasks = "".join(
+        f"  - name: task-{i}\n    task_type: Shell\n    deps: [task-{i - 1}]\n"
+        f"    command: echo {i}\n"
+        for i in range(WORKFLOW_TASK_NUM)
+    )
+    content = f"workflow:\n  name: benchmark\n  project: benchmark\ntasks:\n{tasks}"
+    # lookups ``YamlWorkflow`` does when creating workflow, repeated for many workflows
+    keys = ["workflow", "tasks"] * (WORKFLOW_LOOKUPS // 2)
+    _compare(f"Workflow with {WORKFLOW_TASK_NUM} tasks", content, keys)
@@ -0,0 +1,85 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test command line interface subcommand `compile` and `push`."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from pydolphinscheduler.cli.commands import cli
+from pydolphinscheduler.core.push import PushResult
+from tests.testing.cli import CliTestWrapper
+
+DAG = """
+from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.tasks.shell import Shell
+
+for name in ("first", "second"):
+    with Workflow(name) as workflow:
+        Shell(name="task", command="echo 1", environment_name="prod")
+        workflow.submit()
+"""
+
+
+def test_compile_and_push(tmp_path):
+    """Test subcommand `compile` write artifacts and `push` submit them."""
+    dag = tmp_path.joinpath("dag.py")
+    dag.write_text(DAG)
+    output = tmp_path.joinpath("build")
+    cli_test = CliTestWrapper(cli, ["compile", "-f", str(dag), "-o", str(output)])
+    cli_test.assert_success(output=f"Compile 2 workflow artifacts to {output}.")
+
+    artifacts = sorted(str(path) for path in output.rglob("*.json"))
+    assert [path.rsplit("/", 1)[1] for path in artifacts] == [
+        "first.json",
+        "second.json",
+    ]
+    results = [
+        PushResult(path=Path(path), code=code) for path, code in zip(artifacts, [1, 2])
+    ]
+    with patch("pydolphinscheduler.core.push.push", return_value=results) as mock_push:
+        cli_test = CliTestWrapper(cli, ["push", *artifacts])
+    mock_push.assert_called_once_with(tuple(artifacts), max_workers=None)
+    cli_test.assert_success(
+        output="\n".join(
+            f"Push {path} with workflow code {code}."
+            for path, code in zip(artifacts, [1, 2])
+        )
+    )
+
+
+def test_push_not_exists():
+    """Test subcommand `push` with artifact not exists."""
+    cli_test = CliTestWrapper(cli, ["push", "not-exists.json"])
+    cli_test.assert_fail(ret_code=2, output="does not exist", fuzzy=True)
+
+
+def test_push_directory_failed(tmp_path):
+    """Test subcommand `push` directory with concurrency, and exit with error when any artifact failed."""
+    results = [
+        PushResult(path=tmp_path.joinpath("ok.json"), code=1),
+        PushResult(path=tmp_path.joinpath("bad.json"), error=ValueError("broken")),
+    ]
+    with patch("pydolphinscheduler.core.push.push", return_value=results) as mock_push:
+        cli_test = CliTestWrapper(cli, ["push", str(tmp_path), "-w", "4"])
+    mock_push.assert_called_once_with((str(tmp_path),), max_workers=4)
+    cli_test.assert_fail(
+        ret_code=1,
+        output=f"Push {tmp_path.joinpath('bad.json')} failed: broken",
+        fuzzy=True,
+    )
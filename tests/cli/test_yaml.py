@@ -0,0 +1,80 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Test command line interface subcommand `yaml`."""
+
+from unittest.mock import patch
+
+from pydolphinscheduler.cli.commands import cli
+from pydolphinscheduler.core.yaml_workflow import YamlResult
+from tests.testing.cli import CliTestWrapper
+
+
+def test_yaml_single_file(tmp_path):
+    """Test subcommand `yaml` create single file in current process."""
+    path = tmp_path.joinpath("workflow.yaml")
+    path.write_text("")
+    with patch("pydolphinscheduler.core.yaml_workflow.create_workflow") as mock_create:
+        cli_test = CliTestWrapper(cli, ["yaml", "-f", str(path)])
+    cli_test.assert_success()
+    mock_create.assert_called_once_with(str(path))
+
+
+def test_yaml_multiple_paths(tmp_path):
+    """Test subcommand `yaml` create files in directories and globs in parallel."""
+    for name in ("dir/one.yaml", "dir/two.yml", "three.yaml"):
+        tmp_path.joinpath(name).parent.mkdir(exist_ok=True)
+        tmp_path.joinpath(name).write_text("")
+    paths = [
+        tmp_path.joinpath("dir", "one.yaml"),
+        tmp_path.joinpath("dir", "two.yml"),
+        tmp_path.joinpath("three.yaml"),
+    ]
+    results = [
+        YamlResult(path=paths[0], name="one"),
+        YamlResult(path=paths[1], error=ValueError("broken")),
+        YamlResult(path=paths[2], name="three"),
+    ]
+    with patch(
+        "pydolphinscheduler.core.yaml_workflow.create_workflows", return_value=results
+    ) as mock_create:
+        cli_test = CliTestWrapper(
+            cli,
+            [
+                "yaml",
+                "-f",
+                str(tmp_path / "dir"),
+                "-f",
+                f"{tmp_path}/t*.yaml",
+                "-w",
+                "2",
+            ],
+        )
+    mock_create.assert_called_once_with(paths, max_workers=2)
+    cli_test.assert_fail(
+        ret_code=1,
+        output=f"Create workflow one from {paths[0]}.\n"
+        f"Create workflow from {paths[1]} failed: broken\n"
+        f"Create workflow three from {paths[2]}.",
+        fuzzy=True,
+    )
+
+
+def test_yaml_not_exists():
+    """Test subcommand `yaml` with file not exists."""
+    cli_test = CliTestWrapper(cli, ["yaml", "-f", "not-exists.yaml"])
+    cli_test.assert_fail(ret_code=2, output="does not exist", fuzzy=True)
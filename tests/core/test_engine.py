@@ -21,7 +21,8 @@ from unittest.mock import patch
 
 import pytest
 
-from pydolphinscheduler.core.engine import Engine, ProgramType
+from pydolphinscheduler.core.engine import Engine, ProgramType, engine_resource_cache
+from pydolphinscheduler.core.workflow import Workflow
 
 TEST_ENGINE_TASK_TYPE = "ENGINE"
 TEST_MAIN_CLASS = "org.apache.examples.mock.Mock"
@@ -149,3 +150,69 @@ def test_engine_get_define(mock_resource, mock_code_version, attr, expect):
     """Test task engine function get_define."""
     task = Engine(**attr)
     assert task.get_define() == expect
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    return_value=(123, 1),
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_resources_file_info",
+    side_effect=lambda program_type, main_package: {"id": main_package},
+)
+def test_engine_resource_info_cache(mock_resource, mock_code_version):
+    """Test main package resource info cached and shared by all engine tasks."""
+    engine_resource_cache.invalidate()
+    tasks = [
+        Engine(
+            f"task-{i}",
+            TEST_ENGINE_TASK_TYPE,
+            TEST_MAIN_CLASS,
+            TEST_MAIN_PACKAGE,
+            TEST_PROGRAM_TYPE,
+        )
+        for i in range(3)
+    ]
+    assert [task.get_jar_id() for task in tasks] == [TEST_MAIN_PACKAGE] * 3
+    mock_resource.assert_called_once_with(TEST_PROGRAM_TYPE, TEST_MAIN_PACKAGE)
+
+    engine_resource_cache.invalidate((TEST_PROGRAM_TYPE, TEST_MAIN_PACKAGE))
+    assert tasks[0].get_jar_id() == TEST_MAIN_PACKAGE
+    assert mock_resource.call_count == 2
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    side_effect=[(i, 1) for i in range(6)],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_resources_file_info_batch",
+    side_effect=lambda keys: [{"id": main_package} for _, main_package in keys],
+)
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_resources_file_info")
+def test_workflow_prefetch_engine_resource_info(
+    mock_resource, mock_resource_batch, mock_code_version
+):
+    """Test workflow prefetch all distinct main packages of engine tasks in one batch."""
+    engine_resource_cache.invalidate()
+    with Workflow(name="test-prefetch-engine") as workflow:
+        for i in range(6):
+            Engine(
+                f"task-{i}",
+                TEST_ENGINE_TASK_TYPE,
+                TEST_MAIN_CLASS,
+                f"mock-{i % 2}.jar",
+                TEST_PROGRAM_TYPE,
+            )
+
+    defines = workflow.task_definition_json
+    assert [define["taskParams"]["mainJar"]["id"] for define in defines] == [
+        "mock-0.jar",
+        "mock-1.jar",
+    ] * 3
+    mock_resource_batch.assert_called_once()
+    assert sorted(mock_resource_batch.call_args.args[0]) == [
+        (TEST_PROGRAM_TYPE, "mock-0.jar"),
+        (TEST_PROGRAM_TYPE, "mock-1.jar"),
+    ]
+    mock_resource.assert_not_called()
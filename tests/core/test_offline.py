@@ -0,0 +1,191 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test offline compile workflow."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pydolphinscheduler.core.offline import (
+    Placeholder,
+    find_artifacts,
+    is_offline,
+    load_artifact,
+    offline,
+)
+from pydolphinscheduler.core.workflow import Workflow, submit_many
+from pydolphinscheduler.exceptions import PyDSParamException
+from pydolphinscheduler.tasks.shell import Shell
+from pydolphinscheduler.tasks.spark import Spark
+from pydolphinscheduler.tasks.sql import Sql
+from pydolphinscheduler.tasks.sub_workflow import SubWorkflow
+
+
+@pytest.mark.parametrize(
+    "kind, key, field",
+    [
+        (Placeholder.ENVIRONMENT, ("prod",), None),
+        (Placeholder.DATASOURCE, ("ds", None), "id"),
+        (Placeholder.WORKFLOW, ("user", "project", "name:with/special\\chars"), None),
+    ],
+)
+def test_placeholder_parse(kind, key, field):
+    """Test placeholder is a string and could be parsed back."""
+    placeholder = Placeholder(kind, key, field)
+    assert isinstance(placeholder, str)
+    assert Placeholder.parse(placeholder) == (kind, key, field)
+    assert Placeholder.parse(json.loads(json.dumps(placeholder))) == (kind, key, field)
+
+
+@pytest.mark.parametrize("value", [None, 1, "", "plain", "$PYDS", {"a": 1}])
+def test_placeholder_parse_not_placeholder(value):
+    """Test parse value which is not a placeholder."""
+    assert Placeholder.parse(value) is None
+
+
+def test_offline_context(tmp_path):
+    """Test offline mode enabled only in context, and can not be nested."""
+    assert not is_offline()
+    with offline(tmp_path) as compiler:
+        assert is_offline()
+        assert compiler.output == tmp_path
+        with pytest.raises(PyDSParamException, match="can not be nested"), offline(
+            tmp_path
+        ):
+            pass
+    assert not is_offline()
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.exec_workflow_instance")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint._call")
+def test_offline_compile(mock_call, mock_code_version, mock_exec, tmp_path):
+    """Test workflow compiled to artifact with placeholders and without calling Java gateway."""
+    with offline(tmp_path) as compiler, Workflow(
+        "workflow/with.dots", param={"key": "value"}
+    ) as workflow:
+        shell = Shell(
+            name="shell",
+            command="echo 1",
+            environment_name="prod",
+            resource_list=["a.sh"],
+        )
+        sql = Sql(name="sql", datasource_name="ds", sql="select 1")
+        spark = Spark(name="spark", main_class="Main", main_package="main.jar")
+        sub = SubWorkflow(name="sub", workflow_name="child")
+        shell >> [sql, spark] >> sub
+        assert workflow.submit() is None
+        workflow.run()
+
+    mock_call.assert_not_called()
+    mock_code_version.assert_not_called()
+    mock_exec.assert_not_called()
+    path = tmp_path.joinpath(
+        "userPythonGateway", "project-pydolphin", "workflow%2Fwith.dots.json"
+    )
+    assert compiler.artifacts == [path]
+
+    artifact = json.loads(path.read_text())
+    assert artifact["name"] == "workflow/with.dots"
+    assert artifact["globalParams"] == workflow.param_json
+    assert artifact["provisionalCodes"] == {
+        "shell": -1,
+        "sql": -2,
+        "spark": -3,
+        "sub": -4,
+    }
+    defines = {define["name"]: define for define in artifact["taskDefinitionJson"]}
+    assert defines["shell"]["code"] == -1 and defines["shell"]["version"] is None
+    assert Placeholder.parse(defines["shell"]["environmentCode"]) == (
+        Placeholder.ENVIRONMENT,
+        ("prod",),
+        None,
+    )
+    assert Placeholder.parse(
+        defines["shell"]["taskParams"]["resourceList"][0]["resourceName"]
+    ) == (Placeholder.RESOURCE, ("userPythonGateway", "a.sh"), None)
+    assert Placeholder.parse(defines["sql"]["taskParams"]["datasource"]) == (
+        Placeholder.DATASOURCE,
+        ("ds", None),
+        "id",
+    )
+    assert Placeholder.parse(defines["spark"]["taskParams"]["mainJar"]["id"]) == (
+        Placeholder.ENGINE_RESOURCE,
+        ("SCALA", "main.jar"),
+        "id",
+    )
+    assert Placeholder.parse(
+        defines["sub"]["taskParams"]["workflowDefinitionCode"]
+    ) == (
+        Placeholder.WORKFLOW,
+        ("userPythonGateway", "project-pydolphin", "child"),
+        None,
+    )
+    assert {
+        (relation["preTaskCode"], relation["postTaskCode"])
+        for relation in artifact["taskRelationJson"]
+    } == {(0, -1), (-1, -2), (-1, -3), (-2, -4), (-3, -4)}
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.exec_workflow_instance")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint._call")
+def test_offline_arun(mock_call, mock_exec, tmp_path):
+    """Test asyncio run workflow in offline mode compile it without calling Java gateway."""
+    with offline(tmp_path) as compiler, Workflow("async") as workflow:
+        Shell(name="shell", command="echo 1")
+        asyncio.run(workflow.arun())
+
+    mock_call.assert_not_called()
+    mock_exec.assert_not_called()
+    assert [path.name for path in compiler.artifacts] == ["async.json"]
+
+
+def test_offline_submit_many(tmp_path):
+    """Test submit many workflows in offline mode compile all of them."""
+    with offline(tmp_path) as compiler:
+        workflows = [Workflow(f"workflow-{i}") for i in range(3)]
+        results = submit_many(workflows)
+    assert all(result.success and result.code is None for result in results)
+    assert len(compiler.artifacts) == 3
+
+
+def test_offline_compress(tmp_path):
+    """Test offline compile write artifacts compressed by gzip, and load them back."""
+    with offline(tmp_path, compress=True) as compiler, Workflow("compress") as workflow:
+        workflow.submit()
+    path = compiler.artifacts[0]
+    assert path.name == "compress.json.gz"
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert load_artifact(path) == workflow.to_artifact()
+
+
+def test_find_artifacts(tmp_path):
+    """Test find artifacts in directories recursively, and keep files as they are."""
+    for name in ("b/two.json.gz", "a/one.json", "a/ignore.txt", "three.json"):
+        tmp_path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(name).write_text("")
+    single = tmp_path.joinpath("a", "ignore.txt")
+    assert find_artifacts([tmp_path, single]) == [
+        tmp_path.joinpath("a", "one.json"),
+        tmp_path.joinpath("b", "two.json.gz"),
+        tmp_path.joinpath("three.json"),
+        single,
+    ]
@@ -0,0 +1,288 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test push workflow artifacts."""
+
+import json
+from unittest.mock import patch
+
+from pydolphinscheduler.core.offline import Placeholder, offline
+from pydolphinscheduler.core.push import push, push_waves
+from pydolphinscheduler.core.workflow import Workflow, workflow_code_cache
+from pydolphinscheduler.exceptions import PyDSParamException
+from pydolphinscheduler.models import BaseSide
+from pydolphinscheduler.tasks.condition import Condition, Or, Status
+from pydolphinscheduler.tasks.shell import Shell
+from pydolphinscheduler.tasks.sql import Sql
+from pydolphinscheduler.tasks.sub_workflow import SubWorkflow
+from tests.testing.datasource import java_datasource
+
+
+def _compile(tmp_path, compress=False):
+    with offline(tmp_path, compress) as compiler:
+        with Workflow("child") as child:
+            Shell(name="child-task", command="echo child", environment_name="prod")
+            child.submit()
+        with Workflow("parent") as parent:
+            pre = Shell(name="pre", command="echo 1", environment_name="prod")
+            sql = Sql(name="sql", datasource_name="ds", sql="select 1")
+            sub = SubWorkflow(name="sub", workflow_name="child")
+            condition = Condition(
+                name="condition",
+                condition=Or(Status(pre)),
+                success_task=sql,
+                failed_task=sub,
+            )
+            pre >> condition
+            parent.submit()
+    return compiler.artifacts
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info_batch")
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource_batch",
+    side_effect=lambda keys: [java_datasource(7) for _ in keys],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info_batch",
+    side_effect=lambda names: [f"code-{name}" for name in names],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": 100 + idx + (10 if workflow == "parent" else 0), "version": 2}
+        for idx, _ in enumerate(names)
+    ],
+)
+@patch("pydolphinscheduler.models.project.Project.create_if_not_exists")
+@patch("pydolphinscheduler.models.user.User.create_if_not_exists")
+def test_push(
+    mock_user,
+    mock_project,
+    mock_code_version,
+    mock_environment,
+    mock_datasource,
+    mock_workflow_info,
+    tmp_path,
+):
+    """Test push artifacts resolve placeholders in batch and submit sub workflow first."""
+    BaseSide.invalidate_ensured()
+    workflow_code_cache.invalidate()
+    child_path, parent_path = _compile(tmp_path)
+
+    payloads = {}
+
+    def create_or_update_workflow(*args):
+        payloads[args[2]] = args
+        return {"child": 1, "parent": 2}[args[2]]
+
+    with patch(
+        "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+        side_effect=create_or_update_workflow,
+    ):
+        results = push([parent_path, child_path])
+    assert [(result.path, result.code, result.error) for result in results] == [
+        (parent_path, 2, None),
+        (child_path, 1, None),
+    ]
+
+    assert list(payloads) == ["child", "parent"]
+    mock_user.assert_called_once()
+    mock_project.assert_called_once()
+    mock_environment.assert_called_once_with(["prod"])
+    mock_datasource.assert_called_once_with([("ds", None)])
+    mock_workflow_info.assert_not_called()
+
+    defines = {define["name"]: define for define in json.loads(payloads["parent"][12])}
+    assert {name: define["code"] for name, define in defines.items()} == {
+        "pre": 110,
+        "sql": 111,
+        "sub": 112,
+        "condition": 113,
+    }
+    assert all(define["version"] == 2 for define in defines.values())
+    assert defines["pre"]["environmentCode"] == "code-prod"
+    assert defines["sql"]["taskParams"]["datasource"] == 7
+    assert defines["sql"]["taskParams"]["type"] == "MYSQL"
+    assert defines["sub"]["taskParams"]["workflowDefinitionCode"] == 1
+    condition_params = defines["condition"]["taskParams"]
+    assert condition_params["conditionResult"] == {
+        "successNode": [111],
+        "failedNode": [112],
+    }
+    assert condition_params["dependence"]["dependItemList"][0]["depTaskCode"] == 110
+    assert {
+        (relation["preTaskCode"], relation["postTaskCode"])
+        for relation in json.loads(payloads["parent"][11])
+    } == {(0, 110), (110, 113), (113, 111), (113, 112)}
+
+
+def test_push_waves():
+    """Test push waves put workflow after its sub workflows, and cycle in the last wave."""
+
+    def artifact(name, *subs):
+        return {
+            "user": "user",
+            "project": "project",
+            "name": name,
+            "taskDefinitionJson": [
+                {
+                    "workflowDefinitionCode": Placeholder(
+                        Placeholder.WORKFLOW, ("user", "project", sub)
+                    )
+                }
+                for sub in subs
+            ],
+        }
+
+    artifacts = [
+        artifact("a", "b", "outside"),
+        artifact("b", "c"),
+        artifact("c"),
+        artifact("x", "y"),
+        artifact("y", "x"),
+    ]
+    assert [[item["name"] for item in wave] for wave in push_waves(artifacts)] == [
+        ["c"],
+        ["b"],
+        ["a"],
+        ["x", "y"],
+    ]
+
+
+def test_push_not_supported_format(tmp_path):
+    """Test push artifact with not supported format."""
+    path = tmp_path.joinpath("artifact.json")
+    path.write_text(json.dumps({"format": 0}))
+    (result,) = push([path])
+    assert not result.success
+    assert isinstance(result.error, PyDSParamException)
+    assert "not supported" in str(result.error)
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info_batch",
+    side_effect=lambda keys: [None for _ in keys],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource_batch",
+    side_effect=lambda keys: [java_datasource(7) for _ in keys],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info_batch",
+    side_effect=lambda names: [f"code-{name}" for name in names],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": 100 + idx, "version": 1} for idx, _ in enumerate(names)
+    ],
+)
+@patch("pydolphinscheduler.models.project.Project.create_if_not_exists")
+@patch("pydolphinscheduler.models.user.User.create_if_not_exists")
+def test_push_directory_error_isolated(
+    mock_user,
+    mock_project,
+    mock_code_version,
+    mock_environment,
+    mock_datasource,
+    mock_workflow_info,
+    tmp_path,
+):
+    """Test push compressed artifacts in directory, error of one artifact do not affect others."""
+    BaseSide.invalidate_ensured()
+    workflow_code_cache.invalidate()
+    _compile(tmp_path.joinpath("build"), compress=True)
+    with offline(tmp_path.joinpath("build")), Workflow("other") as other:
+        Shell(name="other-task", command="echo other")
+        other.submit()
+    tmp_path.joinpath("build", "broken.json").write_text("{")
+
+    def create_or_update_workflow(*args):
+        if args[2] == "child":
+            raise RuntimeError("child failed")
+        return 3
+
+    with patch(
+        "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+        side_effect=create_or_update_workflow,
+    ):
+        results = {
+            result.path.name: result
+            for result in push([tmp_path.joinpath("build")], max_workers=2)
+        }
+
+    assert set(results) == {
+        "broken.json",
+        "child.json.gz",
+        "parent.json.gz",
+        "other.json",
+    }
+    assert results["other.json"].success and results["other.json"].code == 3
+    assert isinstance(results["broken.json"].error, ValueError)
+    assert str(results["child.json.gz"].error) == "child failed"
+    # sub workflow failed and could not be found in Java gateway either
+    assert "Can not resolve placeholders" in str(results["parent.json.gz"].error)
+    mock_user.assert_called_once()
+    mock_project.assert_called_once()
+
+
+def _query_environment(names):
+    if "missing" in names:
+        raise RuntimeError("environment missing not found")
+    return [f"code-{name}" for name in names]
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info_batch",
+    side_effect=_query_environment,
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": 100 + idx, "version": 1} for idx, _ in enumerate(names)
+    ],
+)
+@patch("pydolphinscheduler.models.project.Project.create_if_not_exists")
+@patch("pydolphinscheduler.models.user.User.create_if_not_exists")
+def test_push_placeholder_error_isolated(
+    mock_user, mock_project, mock_code_version, mock_environment, tmp_path
+):
+    """Test placeholder failed to resolve only affects artifacts referencing it."""
+    BaseSide.invalidate_ensured()
+    workflow_code_cache.invalidate()
+    with offline(tmp_path) as compiler:
+        for name, environment in [("good", "prod"), ("bad", "missing")]:
+            with Workflow(name) as workflow:
+                Shell(name="task", command="echo 1", environment_name=environment)
+                workflow.submit()
+
+    with patch(
+        "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+        return_value=5,
+    ) as mock_create:
+        good, bad = push(compiler.artifacts)
+
+    assert good.success and good.code == 5
+    assert not bad.success and bad.code is None
+    assert str(bad.error) == "environment missing not found"
+    mock_create.assert_called_once()
+    # batch query failed, then query each environment alone
+    first, *alone = [call.args[0] for call in mock_environment.call_args_list]
+    assert sorted(first) == ["missing", "prod"]
+    assert sorted(alone) == [["missing"], ["prod"]]
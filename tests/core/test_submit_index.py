@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test submit index."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from pydolphinscheduler.core.submit_index import SUBMIT_INDEX_FILE, SubmitIndex
+
+
+def test_submit_index_get_set(tmp_path):
+    """Test submit index return code only when hash matched, and persist to file."""
+    path = tmp_path.joinpath("index.json")
+    index = SubmitIndex(path)
+    assert index.get("key", "hash") is None
+    index.set("key", "hash", 123)
+    assert index.get("key", "hash") == 123
+    assert index.get("key", "other-hash") is None
+
+    assert path.exists()
+    assert SubmitIndex(path).get("key", "hash") == 123
+
+
+def test_submit_index_invalidate(tmp_path):
+    """Test submit index invalidate single key and all keys."""
+    index = SubmitIndex(tmp_path.joinpath("index.json"))
+    index.set("key1", "hash", 1)
+    index.set("key2", "hash", 2)
+    index.invalidate("key1")
+    assert index.get("key1", "hash") is None
+    assert index.get("key2", "hash") == 2
+    index.invalidate()
+    assert SubmitIndex(index.path).get("key2", "hash") is None
+
+
+def test_submit_index_default_path_and_corrupted(tmp_path, monkeypatch):
+    """Test submit index use file under PYDS_HOME by default and ignore corrupted file."""
+    monkeypatch.setenv("PYDS_HOME", str(tmp_path))
+    index = SubmitIndex()
+    assert index.path == tmp_path.joinpath(SUBMIT_INDEX_FILE)
+    index.path.write_text("not json")
+    assert index.get("key", "hash") is None
+    index.set("key", "hash", 1)
+    assert SubmitIndex().get("key", "hash") == 1
+
+
+def test_submit_index_keep_entries_of_others(tmp_path):
+    """Test submit index keep entries written by other index sharing the same file."""
+    path = tmp_path.joinpath("index.json")
+    first, second = SubmitIndex(path), SubmitIndex(path)
+    # load entries before the other writes
+    assert first.get("key2", "hash") is None
+    second.set("key2", "hash", 2)
+    first.set("key1", "hash", 1)
+    assert first.get("key2", "hash") == 2
+    assert SubmitIndex(path).get("key1", "hash") == 1
+    assert SubmitIndex(path).get("key2", "hash") == 2
+
+
+def _set_in_process(path: str, key: str) -> None:
+    SubmitIndex(path).set(key, "hash", 1)
+
+
+def test_submit_index_concurrent_processes(tmp_path):
+    """Test submit index written by many processes concurrently do not lose entries."""
+    path = str(tmp_path.joinpath("index.json"))
+    keys = [f"key{i}" for i in range(40)]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_set_in_process, [path] * len(keys), keys))
+    index = SubmitIndex(path)
+    assert all(index.get(key, "hash") == 1 for key in keys)
@@ -23,12 +23,13 @@ import logging
 import re
 import warnings
 from datetime import timedelta
-from unittest.mock import PropertyMock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 
 from pydolphinscheduler.core.parameter import ParameterType
-from pydolphinscheduler.core.task import Task, TaskRelation
+from pydolphinscheduler.core.resource import resource_fullname_cache
+from pydolphinscheduler.core.task import Task, TaskRelation, environment_cache
 from pydolphinscheduler.core.workflow import Workflow
 from pydolphinscheduler.exceptions import PyResPluginException
 from pydolphinscheduler.resources_plugin import Local
@@ -105,6 +106,20 @@ def test__get_attr(addition: set, ignore: set, expect: set):
     assert task._get_attr() == expect
 
 
+def test_task_params_attr_changed():
+    """Test task params follow attributes changed after they are compiled."""
+    task = TestTask(name="test-attr-changed", task_type="test")
+    assert "rawScript" not in task.task_params
+    task._task_custom_attr = {"raw_script"}
+    task.raw_script = "echo changed"
+    assert task.task_params["rawScript"] == "echo changed"
+    task._task_ignore_attr = {"local_params"}
+    assert "localParams" not in task.task_params
+    assert "local_params" in task.get_define_custom(
+        camel_attr=False, custom_attr={"local_params"}
+    )
+
+
 @pytest.mark.parametrize(
     "value, expect",
     [
@@ -581,3 +596,82 @@ def test_local_parameter(m_code_version):
         return (x["prop"], x["direct"])
 
     assert sorted(task.local_params, key=sorted_func) == sorted(expect, key=sorted_func)
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info_batch")
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info",
+    side_effect=lambda name: f"code-{name}",
+)
+def test_task_environment_code_cache(mock_query, mock_query_batch):
+    """Test task environment code cached and shared by all tasks."""
+    environment_cache.invalidate()
+    tasks = [
+        TestTask(name=f"task-{i}", task_type="type", environment_name="env")
+        for i in range(3)
+    ]
+    assert [task.environment_code for task in tasks] == ["code-env"] * 3
+    assert tasks[0].get_define()["environmentCode"] == "code-env"
+    mock_query.assert_called_once_with("env")
+    mock_query_batch.assert_not_called()
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info_batch",
+    side_effect=lambda names: [f"code-{name}" for name in names],
+)
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.query_environment_info")
+def test_workflow_prefetch_environment_code(mock_query, mock_query_batch):
+    """Test workflow prefetch all distinct environment codes in one batch before serialization."""
+    environment_cache.invalidate()
+    with Workflow(name="test-prefetch") as workflow:
+        for i in range(6):
+            TestTask(
+                name=f"task-{i}", task_type="type", environment_name=f"env-{i % 2}"
+            )
+        TestTask(name="task-without-env", task_type="type")
+
+    defines = workflow.task_definition_json
+    assert [define["environmentCode"] for define in defines] == [
+        "code-env-0",
+        "code-env-1",
+    ] * 3 + [None]
+    mock_query_batch.assert_called_once()
+    assert sorted(mock_query_batch.call_args.args[0]) == ["env-0", "env-1"]
+    mock_query.assert_not_called()
+
+    # all environment cached, no more query
+    assert workflow.task_definition_json == defines
+    mock_query_batch.assert_called_once()
+
+
+def _resource_info(user_name: str, name: str) -> Mock:
+    info = Mock()
+    info.getFullName.return_value = f"/{user_name}/resources/{name}"
+    return info
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.query_resources_file_info")
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.query_resources_file_info_batch",
+    side_effect=lambda keys: [_resource_info(*key) for key in keys],
+)
+def test_workflow_prefetch_resource_fullname(mock_query_batch, mock_query):
+    """Test workflow prefetch all distinct resource fullname in one batch before serialization."""
+    resource_fullname_cache.invalidate()
+    with Workflow(name="test-prefetch", user="user") as workflow:
+        for i in range(4):
+            TestTask(
+                name=f"task-{i}",
+                task_type="type",
+                resource_list=["shared.jar", f"own-{i % 2}.sh"],
+            )
+
+    defines = workflow.task_definition_json
+    assert defines[1]["taskParams"]["resourceList"] == [
+        {"resourceName": "/user/resources/own-1.sh"},
+        {"resourceName": "/user/resources/shared.jar"},
+    ]
+    mock_query_batch.assert_called_once()
+    assert len(mock_query_batch.call_args.args[0]) == 3
+    mock_query.assert_not_called()
@@ -0,0 +1,79 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Test task types registry."""
+
+from importlib import metadata
+from unittest.mock import patch
+
+import pytest
+
+from pydolphinscheduler import tasks
+from pydolphinscheduler.core import task_registry
+from pydolphinscheduler.exceptions import PyDSTaskNoFoundException
+from tests.testing.task import Task
+
+
+def _entry_point(name: str, value: str) -> metadata.EntryPoint:
+    return metadata.EntryPoint(
+        name=name, value=value, group=task_registry.ENTRY_POINT_GROUP
+    )
+
+
+@pytest.fixture
+def clean_registry():
+    """Rebuild registry before and after test."""
+    task_registry.registry.cache_clear()
+    task_registry._load.cache_clear()
+    yield
+    task_registry.registry.cache_clear()
+    task_registry._load.cache_clear()
+
+
+@pytest.mark.parametrize("task_type", ["shell", "Shell", "SHELL", "sHeLl"])
+def test_get_task_cls_case_insensitive(clean_registry, task_type):
+    """Test get task class by task type case insensitive."""
+    assert task_registry.get_task_cls(task_type) is tasks.Shell
+
+
+def test_get_task_cls_not_found(clean_registry):
+    """Test get task class with not exists task type."""
+    with pytest.raises(PyDSTaskNoFoundException, match="cant not find task NotExists"):
+        task_registry.get_task_cls("NotExists")
+
+
+def test_get_task_cls_entry_point(clean_registry, caplog):
+    """Test get task class registered by entry point, built-in task take precedence."""
+    entry_points = [
+        _entry_point("ThirdParty", "tests.testing.task:Task"),
+        _entry_point("shell", "tests.testing.task:Task"),
+        _entry_point("NotTask", "tests.testing.task:uuid"),
+    ]
+    with patch.object(task_registry, "_entry_points", return_value=entry_points):
+        assert task_registry.get_task_cls("thirdparty") is Task
+        assert task_registry.get_task_cls("Shell") is tasks.Shell
+        with pytest.raises(PyDSTaskNoFoundException, match="is not a task class"):
+            task_registry.get_task_cls("NotTask")
+    assert "conflicts with existing one" in caplog.text
+
+
+def test_entry_points_group():
+    """Test entry points of registry group are selected."""
+    assert all(
+        entry_point.group == task_registry.ENTRY_POINT_GROUP
+        for entry_point in task_registry._entry_points()
+    )
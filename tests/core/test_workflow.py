@@ -19,6 +19,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import warnings
 from datetime import datetime, timedelta
 from typing import Any
@@ -29,9 +31,10 @@ from freezegun import freeze_time
 
 from pydolphinscheduler import configuration
 from pydolphinscheduler.core.resource import Resource
-from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.core.submit_index import SubmitIndex
+from pydolphinscheduler.core.workflow import Workflow, submit_many, workflow_code_cache
 from pydolphinscheduler.exceptions import PyDSParamException
-from pydolphinscheduler.models import Project, User
+from pydolphinscheduler.models import BaseSide, Project, User
 from pydolphinscheduler.tasks.switch import Branch, Default, Switch, SwitchCondition
 from pydolphinscheduler.utils.date import conv_to_schedule
 from tests.testing.task import Task
@@ -40,7 +43,9 @@ TEST_WORKFLOW_NAME = "simple-test-workflow"
 TEST_TASK_TYPE = "test-task-type"
 
 
-@pytest.mark.parametrize("func", ["run", "submit", "start"])
+@pytest.mark.parametrize(
+    "func", ["run", "submit", "start", "arun", "asubmit", "astart"]
+)
 def test_workflow_key_attr(func):
     """Test workflow have specific functions or attributes."""
     with Workflow(TEST_WORKFLOW_NAME) as workflow:
@@ -573,3 +578,395 @@ def test_schedule_json_start_and_end_time(start_time, end_time, expect_date):
         timezone=configuration.WORKFLOW_TIME_ZONE,
     ) as workflow:
         assert workflow.schedule_json == expect
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": 1000 + idx, "version": 1} for idx, _ in enumerate(names)
+    ],
+)
+def test_workflow_bulk_code_allocation(mock_code_version_batch):
+    """Test workflow allocate provisional code and resolve them in one batch."""
+    from pydolphinscheduler.tasks.shell import Shell
+
+    with Workflow(TEST_WORKFLOW_NAME, bulk_code_allocation=True) as workflow:
+        parent = Shell(name="parent", command="echo parent")
+        switch_child_1 = Shell(name="switch_child_1", command="echo 1")
+        switch_child_2 = Shell(name="switch_child_2", command="echo 2")
+        switch = Switch(
+            name="switch",
+            condition=SwitchCondition(
+                Branch(condition="${var} > 1", task=switch_child_1),
+                Default(task=switch_child_2),
+            ),
+        )
+        parent >> switch
+        # task names should be unique, provisional code is resolved by task name
+        with pytest.raises(
+            PyDSParamException, match="Task name %s already in workflow"
+        ):
+            Shell(name="parent", command="echo duplicate")
+
+    assert mock_code_version_batch.call_count == 0
+    assert all(code < 0 for code in workflow.tasks)
+    assert len(workflow.tasks) == 4
+
+    workflow.resolve_task_codes()
+    mock_code_version_batch.assert_called_once()
+    assert set(workflow.tasks) == {1000, 1001, 1002, 1003}
+    assert all(task.version == 1 for task in workflow.task_list)
+    assert switch._upstream_task_codes == {parent.code}
+    assert switch._downstream_task_codes == {switch_child_1.code, switch_child_2.code}
+    assert {
+        (tr.pre_task_code, tr.post_task_code) for tr in workflow._task_relations
+    } == {
+        (parent.code, switch.code),
+        (switch.code, switch_child_1.code),
+        (switch.code, switch_child_2.code),
+    }
+    assert [branch.next_node for branch in switch.condition.args] == [
+        switch_child_1.code,
+        switch_child_2.code,
+    ]
+
+    # resolve again should not call java gateway
+    workflow.resolve_task_codes()
+    mock_code_version_batch.assert_called_once()
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.exec_workflow_instance")
+@patch("pydolphinscheduler.core.workflow.Workflow.submit", return_value=123)
+def test_workflow_asyncio_submit_and_run(mock_submit, mock_exec):
+    """Test workflow asyncio function asubmit and arun."""
+
+    async def main(workflows):
+        return await asyncio.gather(*(wf.asubmit() for wf in workflows))
+
+    workflows = [Workflow(f"{TEST_WORKFLOW_NAME}-{i}") for i in range(5)]
+    assert asyncio.run(main(workflows)) == [123] * 5
+    assert mock_submit.call_count == 5
+
+    asyncio.run(workflows[0].arun())
+    assert mock_submit.call_count == 6
+    mock_exec.assert_called_once()
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    return_value=(123, 1),
+)
+@patch("pydolphinscheduler.core.resource.Resource.create_or_update_resource")
+@patch("pydolphinscheduler.models.project.Project.create_if_not_exists")
+@patch("pydolphinscheduler.models.user.User.create_if_not_exists")
+def test_submit_many(mock_user, mock_project, mock_resource, mock_code_version):
+    """Test submit many workflows share side models and resources, and collect errors."""
+    BaseSide.invalidate_ensured()
+    workflows = []
+    for i in range(4):
+        with Workflow(
+            f"{TEST_WORKFLOW_NAME}-{i}",
+            project="project-a" if i < 3 else "project-b",
+            resource_list=[Resource(name="shared.sh", content="echo shared")],
+        ) as workflow:
+            Task(name="task", task_type=TEST_TASK_TYPE)
+            workflows.append(workflow)
+
+    def create_or_update_workflow(*args):
+        if args[2] == f"{TEST_WORKFLOW_NAME}-2":
+            raise RuntimeError("submit failed")
+        return int(args[2].rsplit("-", 1)[1]) + 100
+
+    with patch(
+        "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+        side_effect=create_or_update_workflow,
+    ):
+        results = submit_many(workflows, max_workers=2)
+
+    assert mock_user.call_count == 1
+    assert mock_project.call_count == 2
+    assert mock_resource.call_count == 1
+    assert [result.workflow for result in results] == workflows
+    assert [result.code for result in results] == [100, 101, None, 103]
+    assert [result.success for result in results] == [True, True, False, True]
+    assert str(results[2].error) == "submit failed"
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    side_effect=[(i, 1) for i in range(3)],
+)
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info")
+@patch("pydolphinscheduler.models.project.Project.create_if_not_exists")
+@patch("pydolphinscheduler.models.user.User.create_if_not_exists")
+def test_submit_many_sub_workflow_first(
+    mock_user, mock_project, mock_workflow_info, mock_code_version
+):
+    """Test submit many submit sub workflows first and reuse their codes in parent workflows."""
+    from pydolphinscheduler.tasks.sub_workflow import SubWorkflow
+
+    BaseSide.invalidate_ensured()
+    workflow_code_cache.invalidate()
+    with Workflow("parent") as parent:
+        SubWorkflow("run-child", "child")
+        SubWorkflow("run-grandchild", "grandchild")
+    with Workflow("child") as child:
+        SubWorkflow("run-grandchild", "grandchild")
+    grandchild = Workflow("grandchild")
+
+    submitted = []
+
+    def create_or_update_workflow(*args):
+        submitted.append(args[2])
+        return {"parent": 1, "child": 2, "grandchild": 3}[args[2]]
+
+    with patch(
+        "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+        side_effect=create_or_update_workflow,
+    ):
+        results = submit_many([parent, child, grandchild])
+
+    assert [result.code for result in results] == [1, 2, 3]
+    assert submitted == ["grandchild", "child", "parent"]
+    mock_workflow_info.assert_not_called()
+    assert {
+        task.name: task.workflow_definition_code for task in parent.tasks.values()
+    } == {"run-child": 2, "run-grandchild": 3}
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow")
+@patch(
+    "pydolphinscheduler.models.project.Project.create_if_not_exists",
+    side_effect=RuntimeError("project error"),
+)
+@patch("pydolphinscheduler.models.user.User.create_if_not_exists")
+def test_submit_many_side_model_error(mock_user, mock_project, mock_workflow):
+    """Test submit many skip workflows which side model ensure failed."""
+    BaseSide.invalidate_ensured()
+    workflows = [Workflow(f"{TEST_WORKFLOW_NAME}-{i}") for i in range(3)]
+    results = submit_many(workflows)
+    assert mock_project.call_count == 1
+    assert all(str(result.error) == "project error" for result in results)
+    mock_workflow.assert_not_called()
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_grant_project")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_user")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_tenant")
+def test_workflow_side_model_ensured_once(
+    mock_tenant, mock_user, mock_project, mock_workflow
+):
+    """Test workflow submit skip ensuring side models already ensured, until invalidate them."""
+    BaseSide.invalidate_ensured()
+    mock_user.return_value.getId.return_value = 1
+    for i in range(3):
+        Workflow(f"{TEST_WORKFLOW_NAME}-{i}").submit()
+    assert mock_tenant.call_count == mock_user.call_count == 1
+    assert mock_project.call_count == 1
+    assert mock_workflow.call_count == 3
+
+    # different project and user need to be ensured
+    Workflow(TEST_WORKFLOW_NAME, project="other-project").submit()
+    assert mock_project.call_count == 2
+    Workflow(TEST_WORKFLOW_NAME, user="other-user").submit()
+    assert mock_user.call_count == 2 and mock_project.call_count == 3
+
+    # invalidate specific model or all of them
+    Project.invalidate_ensured("other-project")
+    Workflow(TEST_WORKFLOW_NAME, project="other-project").submit()
+    assert mock_user.call_count == 2 and mock_project.call_count == 4
+    BaseSide.invalidate_ensured()
+    Workflow(TEST_WORKFLOW_NAME).submit()
+    assert mock_user.call_count == 3 and mock_project.call_count == 5
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_user")
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_tenant")
+def test_user_ensure_exists_restore_user_id(mock_tenant, mock_user):
+    """Test user skipped by ensured registry still have user id."""
+    BaseSide.invalidate_ensured()
+    mock_user.return_value.getId.return_value = 10
+    User("ensure-user").ensure_exists()
+    user = User("ensure-user")
+    user.ensure_exists()
+    assert mock_user.call_count == 1
+    assert user.user_id == 10
+
+
+def _bulk_workflow(command: str) -> Workflow:
+    """Create workflow with bulk code allocation for skip unchanged tests."""
+    from pydolphinscheduler.tasks.shell import Shell
+
+    with Workflow(TEST_WORKFLOW_NAME, bulk_code_allocation=True) as workflow:
+        Shell(name="parent", command="echo parent") >> Shell(
+            name="child", command=command
+        )
+    return workflow
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": 1000 + idx, "version": 1} for idx, _ in enumerate(names)
+    ],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+    return_value=123,
+)
+@patch("pydolphinscheduler.core.workflow.Workflow._ensure_side_model_exists")
+def test_workflow_submit_skip_unchanged(
+    mock_ensure, mock_workflow, mock_code_version_batch, tmp_path
+):
+    """Test workflow submit skip unchanged workflow without calling Java gateway."""
+    index = SubmitIndex(tmp_path.joinpath("submit_index.json"))
+    with patch("pydolphinscheduler.core.workflow.submit_index", index):
+        assert _bulk_workflow("echo child").submit(skip_unchanged=True) == 123
+        assert mock_workflow.call_count == mock_code_version_batch.call_count == 1
+
+        # the same content in new workflow object, and hash not affected by relation order
+        workflow = _bulk_workflow("echo child")
+        assert workflow.submit(skip_unchanged=True) == 123
+        assert mock_workflow.call_count == mock_code_version_batch.call_count == 1
+        assert mock_ensure.call_count == 1
+
+        # changed content or disable skip unchanged will submit again
+        assert _bulk_workflow("echo changed").submit(skip_unchanged=True) == 123
+        assert mock_workflow.call_count == 2
+        _bulk_workflow("echo changed").submit(skip_unchanged=False)
+        assert mock_workflow.call_count == 3
+
+
+def test_workflow_content_hash():
+    """Test workflow content hash is stable and changed with its content."""
+    assert _bulk_workflow("echo child").content_hash() == (
+        _bulk_workflow("echo child").content_hash()
+    )
+    assert _bulk_workflow("echo child").content_hash() != (
+        _bulk_workflow("echo changed").content_hash()
+    )
+
+
+def test_workflow_content_hash_schedule():
+    """Test content hash of scheduled workflow without start time do not change with the clock."""
+    with freeze_time("2021-01-01 00:00:00"):
+        workflow = _bulk_workflow("echo child")
+        workflow.schedule = "0 0 0 * * ? *"
+        digest = workflow.content_hash()
+    with freeze_time("2021-01-01 00:00:02"):
+        assert workflow.content_hash() == digest
+        # start time in the arguments sent to Java gateway still is the current time
+        schedule = json.loads(workflow._workflow_define_args()[13])
+        assert schedule["startTime"] == "2021-01-01 00:00:02"
+
+    workflow.start_time = "2021-01-01"
+    assert workflow.content_hash() != digest
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "ujson", "json"])
+def test_workflow_define_args_encoder(encoder):
+    """Test workflow definition encoded by different JSON encoders get the same content."""
+    if encoder != "json":
+        pytest.importorskip(encoder)
+    workflow = _bulk_workflow("echo child")
+    workflow.param = {"key": "value"}
+    expect = workflow._workflow_define_args()
+    with patch("pydolphinscheduler.configuration.WORKFLOW_JSON_ENCODER", encoder):
+        args = workflow._workflow_define_args()
+    assert len(args) == len(expect)
+    for arg, expect_arg in zip(args, expect):
+        if isinstance(arg, str) and arg.startswith(("[", "{")):
+            assert json.loads(arg) == json.loads(expect_arg)
+        else:
+            assert arg == expect_arg
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": {"parent": 1000, "child": 1001}[name], "version": 1} for name in names
+    ],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+    return_value=123,
+)
+@patch("pydolphinscheduler.core.workflow.Workflow._ensure_side_model_exists")
+def test_workflow_submit_incremental(
+    mock_ensure, mock_workflow, mock_code_version_batch, tmp_path
+):
+    """Test workflow incremental submit only query code and version of changed tasks."""
+    index = SubmitIndex(tmp_path.joinpath("submit_index.json"))
+    with patch("pydolphinscheduler.core.workflow.submit_index", index):
+        workflow = _bulk_workflow("echo child")
+        assert workflow.diff().added == ["parent", "child"]
+        workflow.submit(mode="incremental")
+        assert mock_code_version_batch.call_args.args[2] == ["parent", "child"]
+
+        # unchanged workflow skipped entirely
+        assert _bulk_workflow("echo child").diff().empty
+        _bulk_workflow("echo child").submit(mode="incremental")
+        assert mock_workflow.call_count == mock_code_version_batch.call_count == 1
+
+        # version of added and changed tasks unknown after submit, should query them again
+        workflow = _bulk_workflow("echo changed")
+        diff = workflow.diff()
+        assert diff.changed == ["child"] and diff.unchanged == ["parent"]
+        workflow.submit(mode="incremental")
+        assert mock_code_version_batch.call_args.args[2] == ["parent", "child"]
+
+        workflow = _bulk_workflow("echo changed again")
+        workflow.submit(mode="incremental")
+        assert mock_code_version_batch.call_args.args[2] == ["child"]
+        assert mock_workflow.call_count == 3
+        assert {task.name: task.code for task in workflow.tasks.values()} == {
+            "parent": 1000,
+            "child": 1001,
+        }
+
+
+@pytest.mark.parametrize("mode", ["full", "incremental"])
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_code_and_version_batch",
+    side_effect=lambda project, workflow, names: [
+        {"code": 1000 + idx, "version": 1} for idx, _ in enumerate(names)
+    ],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+    return_value=123,
+)
+@patch("pydolphinscheduler.core.workflow.Workflow._ensure_side_model_exists")
+def test_workflow_submit_schedule_unchanged(
+    mock_ensure, mock_workflow, mock_code_version_batch, mode, tmp_path
+):
+    """Test scheduled workflow without start time is skipped when submitted again later."""
+    index = SubmitIndex(tmp_path.joinpath("submit_index.json"))
+    with patch("pydolphinscheduler.core.workflow.submit_index", index):
+        for now in ("2021-01-01 00:00:00", "2021-01-01 00:00:02"):
+            with freeze_time(now):
+                workflow = _bulk_workflow("echo child")
+                workflow.schedule = "0 0 0 * * ? *"
+                assert workflow.submit(skip_unchanged=True, mode=mode) == 123
+    assert mock_workflow.call_count == mock_code_version_batch.call_count == 1
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow")
+@patch("pydolphinscheduler.core.workflow.Workflow._ensure_side_model_exists")
+def test_workflow_submit_incremental_without_bulk(mock_ensure, mock_workflow):
+    """Test workflow incremental submit in default configuration without bulk code allocation."""
+    with Workflow(TEST_WORKFLOW_NAME) as workflow:
+        assert not workflow.bulk_code_allocation
+        with pytest.raises(
+            PyDSParamException, match=".*requires parameter `bulk_code_allocation`.*"
+        ):
+            workflow.submit(mode="incremental")
+    mock_ensure.assert_not_called()
+    mock_workflow.assert_not_called()
+
+
+def test_workflow_submit_invalid_mode():
+    """Test workflow submit with invalid mode."""
+    with pytest.raises(PyDSParamException, match="Parameter `mode` only support.*"):
+        Workflow(TEST_WORKFLOW_NAME).submit(mode="invalid")
@@ -0,0 +1,51 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test workflow diff."""
+
+from pydolphinscheduler.core.workflow_diff import WorkflowDiff
+
+
+def _snapshot(tasks: dict, relations: list) -> dict:
+    return {
+        "tasks": {name: {"hash": digest} for name, digest in tasks.items()},
+        "relations": relations,
+    }
+
+
+def test_workflow_diff_between():
+    """Test workflow diff between two snapshots."""
+    old = _snapshot({"a": "1", "b": "2", "c": "3"}, [["a", "b"], ["b", "c"]])
+    new = _snapshot({"a": "1", "b": "changed", "d": "4"}, [["a", "b"], ["b", "d"]])
+    diff = WorkflowDiff.between(old, new)
+    assert diff.added == ["d"]
+    assert diff.changed == ["b"]
+    assert diff.removed == ["c"]
+    assert diff.unchanged == ["a"]
+    assert diff.relations_added == [("b", "d")]
+    assert diff.relations_removed == [("b", "c")]
+    assert not diff.empty
+
+
+def test_workflow_diff_empty_and_without_old():
+    """Test workflow diff without difference, and without old snapshot."""
+    snapshot = _snapshot({"a": "1", "b": "2"}, [["a", "b"]])
+    assert WorkflowDiff.between(snapshot, snapshot).empty
+    diff = WorkflowDiff.between(None, snapshot)
+    assert diff.added == ["a", "b"]
+    assert diff.relations_added == [("a", "b")]
@@ -17,6 +17,8 @@
 
 """Test YAML workflow."""
 
+from __future__ import annotations
+
 import os
 from pathlib import Path
 from unittest.mock import patch
@@ -28,10 +30,14 @@ from pydolphinscheduler.core.parameter import ParameterType
 from pydolphinscheduler.core.workflow import Workflow
 from pydolphinscheduler.core.yaml_workflow import (
     ParseTool,
+    YamlWorkflow,
     create_workflow,
+    create_workflows,
+    find_yaml_files,
+    get_refer_key,
     get_task_cls,
 )
-from pydolphinscheduler.exceptions import PyDSTaskNoFoundException
+from pydolphinscheduler.exceptions import PyDSParamException, PyDSTaskNoFoundException
 from pydolphinscheduler.models.datasource import TaskUsage
 from tests.testing.path import path_yaml_example
 from tests.testing.task import Task
@@ -49,6 +55,13 @@ def test_parse_tool_env_exist(string_param, expect):
     assert expect == ParseTool.parse_string_param_if_env(string_param)
 
 
+def test_parse_tool_env_multiple():
+    """Test parsing all environment variables in one string."""
+    with patch.dict(os.environ, {"PYDS_ENV_A": "a", "PYDS_ENV_B": "b"}):
+        string_param = "$ENV{PYDS_ENV_A}-$ENV{PYDS_ENV_B}-$ENV{PYDS_ENV_A}"
+        assert "a-b-a" == ParseTool.parse_string_param_if_env(string_param)
+
+
 def test_parse_tool_env_not_exist():
     """Test parsing the not exist environment variable."""
     key = "THIS_ENV_NOT_EXIST_0000000"
@@ -100,6 +113,53 @@ def test_parse_possible_yaml_file():
     assert expect == content_
 
 
+def test_parse_tool_config_in_string():
+    """Test parsing configuration in part of string."""
+    expect = f"user-{configuration.USER_NAME}@{configuration.USER_TENANT}"
+    string_param = "user-${CONFIG.USER_NAME}@${CONFIG.USER_TENANT}"
+    assert expect == ParseTool.parse_string_param_if_config(string_param)
+    assert expect == ParseTool.parse_string_param(string_param)
+
+
+@pytest.mark.parametrize(
+    "string_param, key_path, expect",
+    [
+        ("plain string", "", "plain string"),
+        ("$ENV{PYDS_ENV_A}", "", "a"),
+        ("$ENV{PYDS_ENV_A}/${CONFIG.USER_NAME}", "", f"a/{configuration.USER_NAME}"),
+        ("${CONFIG.JAVA_GATEWAY_PORT}", "", configuration.JAVA_GATEWAY_PORT),
+        ("$ENV{THIS_ENV_NOT_EXIST_0000000}", "", "$THIS_ENV_NOT_EXIST_0000000"),
+        ("VARCHAR($ENV{PYDS_ENV_A})", "input_params.a", ParameterType.VARCHAR("a")),
+        ("VARCHAR($ENV{PYDS_ENV_A})", "params.a", "VARCHAR(a)"),
+    ],
+)
+def test_parse_tool_parse_string_param(string_param, key_path, expect):
+    """Test parsing all special grammars in one pass."""
+    with patch.dict(os.environ, {"PYDS_ENV_A": "a"}):
+        value = ParseTool.parse_string_param(string_param, key_path=key_path)
+    assert value == expect
+
+
+def test_parse_tool_parse_string_param_file_cache(tmp_path):
+    """Test file of $FILE only read once with file cache."""
+    path = tmp_path.joinpath("example.sh")
+    path.write_text("echo $ENV{PYDS_ENV_A}")
+    file_cache = {}
+    string_param = '$FILE{"example.sh"}'
+
+    with patch.dict(os.environ, {"PYDS_ENV_A": "a"}), patch(
+        "pydolphinscheduler.core.yaml_workflow.ParseTool.parse_string_param_if_file",
+        wraps=ParseTool.parse_string_param_if_file,
+    ) as mock_read:
+        for _ in range(3):
+            value = ParseTool.parse_string_param(
+                string_param, base_folder=tmp_path, file_cache=file_cache
+            )
+            assert value == "echo a"
+    assert mock_read.call_count == 1
+    assert file_cache == {"example.sh": "echo $ENV{PYDS_ENV_A}"}
+
+
 def test_parse_tool_parse_possible_path_file():
     """Test parsing possible path."""
     folder = Path(path_yaml_example)
@@ -206,3 +266,169 @@ def test_get_create_workflow(
         side_effect=Task("test_func_wrap", "func_wrap").gen_code_and_version,
     ):
         create_workflow(yaml_file_path)
+
+
+@patch.object(Workflow, "run")
+@patch.object(Workflow, "submit")
+def test_create_workflow_keep_parser(mock_submit, mock_run, tmp_path):
+    """Test create workflow do not change values behind the index of parser."""
+    path = tmp_path.joinpath("keep.yaml")
+    path.write_text(
+        "workflow:\n  name: keep\n  run: true\n  description: $ENV{PYDS_ENV_A}\n"
+        "tasks:\n  - name: task\n    task_type: Shell\n    command: echo $ENV{PYDS_ENV_A}\n"
+    )
+    parser = YamlWorkflow(str(path))
+    with patch.dict(os.environ, {"PYDS_ENV_A": "a"}), patch(
+        "pydolphinscheduler.core.task.Task.gen_code_and_version",
+        side_effect=Task("test_func_wrap", "func_wrap").gen_code_and_version,
+    ):
+        assert parser.create_workflow() == "keep"
+    mock_run.assert_called_once()
+
+    assert "workflow.run" in parser
+    assert parser["workflow.run"] is True
+    assert parser["workflow.description"] == "$ENV{PYDS_ENV_A}"
+    assert parser["tasks"][0]["command"] == "echo $ENV{PYDS_ENV_A}"
+
+
+def _write_yaml(folder: Path, name: str, refer: str | None = None) -> Path:
+    path = folder.joinpath(f"{name}.yaml")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    description = f'$WORKFLOW{{"{refer}"}}' if refer else "none"
+    path.write_text(
+        f"workflow:\n  name: {path.stem}\n  description: {description}\n"
+        "tasks:\n  - name: task\n    task_type: Shell\n    command: echo 1\n"
+    )
+    return path
+
+
+def test_find_yaml_files(tmp_path):
+    """Test find YAML files from files, directories and glob patterns without duplicate."""
+    one = _write_yaml(tmp_path, "dir/one")
+    two = _write_yaml(tmp_path, "dir/sub/two")
+    three = _write_yaml(tmp_path, "three")
+    tmp_path.joinpath("dir", "ignore.txt").write_text("")
+    assert find_yaml_files(
+        [tmp_path.joinpath("dir"), f"{tmp_path}/**/t*.yaml", three]
+    ) == [one, two, three]
+
+
+@patch.object(Workflow, "submit", autospec=True)
+def test_create_workflows(mock_submit, tmp_path):
+    """Test create workflows in dependency order, referenced files are created once and failure propagates."""
+    common = _write_yaml(tmp_path, "refer/common")
+    first = _write_yaml(tmp_path, "first", "refer/common.yaml")
+    second = _write_yaml(tmp_path, "second", "refer/common.yaml")
+    missing = _write_yaml(tmp_path, "missing", "not-exists.yaml")
+    top = _write_yaml(tmp_path, "top", "missing.yaml")
+    cycle_a = _write_yaml(tmp_path, "cycle/a", "b.yaml")
+    cycle_b = _write_yaml(tmp_path, "cycle/b", "a.yaml")
+
+    with patch(
+        "pydolphinscheduler.core.task.Task.gen_code_and_version",
+        side_effect=Task("test_func_wrap", "func_wrap").gen_code_and_version,
+    ):
+        results = create_workflows(
+            [first, second, top, tmp_path.joinpath("cycle")], max_workers=1
+        )
+
+    by_path = {result.path: result for result in results}
+    assert [result.path for result in results][:5] == [
+        first,
+        second,
+        top,
+        cycle_a,
+        cycle_b,
+    ]
+    assert set(by_path) == {
+        first,
+        second,
+        top,
+        cycle_a,
+        cycle_b,
+        common,
+        missing,
+        Path("not-exists.yaml").resolve(),
+    }
+    assert {path.stem: by_path[path].name for path in (first, second, common)} == {
+        "first": "first",
+        "second": "second",
+        "common": "common",
+    }
+    submitted = [call.args[0] for call in mock_submit.call_args_list]
+    assert [workflow.name for workflow in submitted] == ["common", "first", "second"]
+    assert [workflow.description for workflow in submitted] == [
+        "none",
+        "common",
+        "common",
+    ]
+
+    assert isinstance(by_path[Path("not-exists.yaml").resolve()].error, OSError)
+    for path in (missing, top, cycle_a, cycle_b):
+        assert isinstance(by_path[path].error, PyDSParamException)
+    assert "reference cycle" in str(by_path[cycle_a].error)
+
+
+def test_create_workflows_process_pool(tmp_path):
+    """Test create workflows in process pool, error raised in worker process is recorded."""
+    for name in ("a", "b"):
+        tmp_path.joinpath(f"{name}.yaml").write_text(
+            f"workflow:\n  name: {name}\n"
+            "tasks:\n  - name: task\n    task_type: NotExists\n    command: echo 1\n"
+        )
+    results = create_workflows([tmp_path], max_workers=2)
+    assert [result.path.name for result in results] == ["a.yaml", "b.yaml"]
+    assert all(isinstance(result.error, PyDSTaskNoFoundException) for result in results)
+
+
+@patch.object(Workflow, "submit", autospec=True)
+def test_create_workflow_refer_once(mock_submit, tmp_path):
+    """Test workflow referenced many times in the same run is created once."""
+    _write_yaml(tmp_path, "common")
+    _write_yaml(tmp_path, "first", "common.yaml")
+    _write_yaml(tmp_path, "second", "common.yaml")
+    top = tmp_path.joinpath("top.yaml")
+    top.write_text(
+        "workflow:\n  name: top\n"
+        '  description: $WORKFLOW{"first.yaml"} $WORKFLOW{"second.yaml"} $WORKFLOW{"common.yaml"}\n'
+        "tasks:\n  - name: task\n    task_type: Shell\n    command: echo 1\n"
+    )
+    with patch(
+        "pydolphinscheduler.core.task.Task.gen_code_and_version",
+        side_effect=Task("test_func_wrap", "func_wrap").gen_code_and_version,
+    ):
+        create_workflow(top)
+    submitted = [call.args[0] for call in mock_submit.call_args_list]
+    assert [workflow.name for workflow in submitted] == [
+        "common",
+        "first",
+        "second",
+        "top",
+    ]
+    assert submitted[-1].description == "first second common"
+
+
+@patch.object(YamlWorkflow, "create_workflow", return_value="new")
+def test_prepare_refer_workflow_modified(mock_create, tmp_path):
+    """Test referenced workflow is parsed again if its YAML file is modified."""
+    common = _write_yaml(tmp_path, "common")
+    path, mtime = get_refer_key(common)
+    refer_workflows = {(path, mtime): "cached"}
+    parser = YamlWorkflow(_write_yaml(tmp_path, "top", "common.yaml"), refer_workflows)
+    assert parser["workflow"]["description"] == "cached"
+    mock_create.assert_not_called()
+
+    os.utime(common, ns=(mtime + 10**9, mtime + 10**9))
+    parser = YamlWorkflow(tmp_path.joinpath("top.yaml"), refer_workflows)
+    assert parser["workflow"]["description"] == "new"
+    mock_create.assert_called_once()
+    assert refer_workflows[get_refer_key(common)] == "new"
+
+
+def test_prepare_refer_workflow_cycle(tmp_path):
+    """Test reference cycle of $WORKFLOW raise error instead of recursing forever."""
+    first = _write_yaml(tmp_path, "first", "second.yaml")
+    second = _write_yaml(tmp_path, "second", "first.yaml")
+    with pytest.raises(PyDSParamException, match="Reference cycle") as ex:
+        create_workflow(first)
+    assert f"{first} -> {second} -> {first}" in str(ex.value)
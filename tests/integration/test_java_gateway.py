@@ -84,7 +84,8 @@ def test_gateway_entry_point_version_warning(
 
     importlib.reload(java_gateway)
     with warnings.catch_warnings(record=True) as w:
-        _ = java_gateway.GatewayEntryPoint()
+        # version check is deferred until the first time connect to java gateway
+        _ = java_gateway.GatewayEntryPoint().gateway
         if is_warning:
             assert len(w) == 1
             assert issubclass(w[-1].category, UserWarning)
@@ -18,12 +18,13 @@
 """Test Database."""
 
 import json
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from pydolphinscheduler.models.connection import Connection
-from pydolphinscheduler.models.datasource import Datasource
+from pydolphinscheduler.models.datasource import Datasource, TaskUsage, datasource_cache
+from tests.testing.datasource import java_datasource
 
 TEST_DATABASE_DATASOURCE_NAME = "test_datasource"
 TEST_DATABASE_TYPE = "mysql"
@@ -72,3 +73,39 @@ def test_get_datasource_attr(mock_datasource, attr, value):
     """Test get datasource attr."""
     datasource_get = Datasource.get(TEST_DATABASE_DATASOURCE_NAME, TEST_DATABASE_TYPE)
     assert value == getattr(datasource_get, attr)
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource",
+    return_value=Mock(id=1, type="mysql"),
+)
+def test_get_task_usage_cache(mock_get_datasource):
+    """Test datasource task usage cached by name and type, with hits and misses stats."""
+    datasource_cache.invalidate()
+    datasource_cache.hits = datasource_cache.misses = 0
+    for _ in range(3):
+        assert Datasource.get_task_usage_4j("cache", "mysql") == TaskUsage(1, "MYSQL")
+    Datasource.get_task_usage_4j("cache")
+    assert mock_get_datasource.call_count == 2
+    assert datasource_cache.stats() == {"hits": 2, "misses": 2, "size": 2}
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource")
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource_batch",
+    side_effect=lambda keys: [
+        None if name == "not-exists" else java_datasource(len(name)) for name, _ in keys
+    ],
+)
+def test_prefetch_task_usage(mock_get_batch, mock_get_datasource):
+    """Test prefetch datasource task usage only query missing datasources in batch."""
+    datasource_cache.invalidate()
+    hits, misses = datasource_cache.hits, datasource_cache.misses
+    keys = {("ds", None), ("ds-long", "mysql"), ("not-exists", None)}
+    Datasource.prefetch_task_usage(keys)
+    Datasource.prefetch_task_usage(keys | {("ds", "mysql")})
+    assert [len(call.args[0]) for call in mock_get_batch.call_args_list] == [3, 2]
+    assert Datasource.get_task_usage_4j("ds-long", "mysql") == TaskUsage(7, "MYSQL")
+    mock_get_datasource.assert_not_called()
+    # prefetch do not count hits or misses, only the lookup counts
+    assert (datasource_cache.hits - hits, datasource_cache.misses - misses) == (1, 0)
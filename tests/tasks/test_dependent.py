@@ -24,8 +24,10 @@ import warnings
 from unittest.mock import patch
 
 import pytest
+from py4j.protocol import Py4JError
 
-from pydolphinscheduler.exceptions import PyDSParamException
+from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.exceptions import PyDSJavaGatewayException, PyDSParamException
 from pydolphinscheduler.tasks.dependent import (
     And,
     Dependent,
@@ -33,6 +35,7 @@ from pydolphinscheduler.tasks.dependent import (
     DependentItem,
     DependentOperator,
     Or,
+    dependent_cache,
 )
 
 TEST_PROJECT = "test-project"
@@ -809,3 +812,66 @@ def test_dependent_get_define(mock_code_version, mock_dep_code):
 
     task = Dependent(name, dependence=dep_operator)
     assert task.task_params == expect_task_params
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_dependent_info")
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_dependent_info_batch",
+    side_effect=lambda keys: [
+        {
+            "projectCode": TEST_PROJECT_CODE,
+            "workflowDefinitionCode": TEST_DEFINITION_CODE,
+            "taskDefinitionCode": len(task or ""),
+        }
+        for _, _, task in keys
+    ],
+)
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    side_effect=[(code, 1) for code in range(2)],
+)
+def test_dependent_prefetch_items(mock_code_version, mock_get_batch, mock_get):
+    """Test workflow resolve all dependent items in one batch, and duplicate items resolve once."""
+    dependent_cache.invalidate()
+    with Workflow("test-dependent-prefetch") as workflow:
+        for i in range(2):
+            Dependent(
+                name=f"dependent-{i}",
+                dependence=And(
+                    Or(
+                        DependentItem(TEST_PROJECT, TEST_WORKFLOW, "task"),
+                        DependentItem(TEST_PROJECT, TEST_WORKFLOW, "other-task"),
+                    ),
+                    And(DependentItem(TEST_PROJECT, TEST_WORKFLOW)),
+                ),
+            )
+    defines = workflow.task_definition_json
+    mock_get_batch.assert_called_once()
+    keys = mock_get_batch.call_args.args[0]
+    assert len(keys) == 3
+    assert set(keys) == {
+        (TEST_PROJECT, TEST_WORKFLOW, None),
+        (TEST_PROJECT, TEST_WORKFLOW, "other-task"),
+        (TEST_PROJECT, TEST_WORKFLOW, "task"),
+    }
+    mock_get.assert_not_called()
+    items = defines[0]["taskParams"]["dependence"]["dependTaskList"][0]
+    assert [item["depTaskCode"] for item in items["dependItemList"]] == [4, 10]
+
+    # new dependent item with the same parameter use cache
+    assert DependentItem(TEST_PROJECT, TEST_WORKFLOW, "task").dep_task_code == 4
+    mock_get.assert_not_called()
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_dependent_info_batch",
+    side_effect=Py4JError("workflow not found"),
+)
+def test_dependent_prefetch_error(mock_get_batch):
+    """Test dependent prefetch raise gateway exception and keep the original error."""
+    dependent_cache.invalidate()
+    with pytest.raises(
+        PyDSJavaGatewayException, match="get_dependent_info_batch error"
+    ) as excinfo:
+        DependentItem.prefetch([DependentItem(TEST_PROJECT, TEST_WORKFLOW, "task")])
+    assert isinstance(excinfo.value.__cause__, Py4JError)
@@ -22,10 +22,12 @@ from unittest.mock import patch
 
 import pytest
 
-from pydolphinscheduler.models.datasource import TaskUsage
+from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.models.datasource import TaskUsage, datasource_cache
 from pydolphinscheduler.resources_plugin import Local
 from pydolphinscheduler.tasks.sql import Sql, SqlType
 from pydolphinscheduler.utils import file
+from tests.testing.datasource import java_datasource
 from tests.testing.file import delete_file
 
 file_name = "local_res.sql"
@@ -215,3 +217,27 @@ def test_resources_local_sql_command_content(
     """Test sql content through the local resource plug-in."""
     sql = Sql(**attr)
     assert expect == getattr(sql, "sql")
+
+
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource")
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_datasource_batch",
+    side_effect=lambda keys: [
+        java_datasource(len(name), type_ or "mysql") for name, type_ in keys
+    ],
+)
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    side_effect=[(code, 1) for code in range(10)],
+)
+def test_sql_prefetch_datasource(mock_code_version, mock_get_batch, mock_get):
+    """Test workflow prefetch all distinct datasources of sql tasks in one batch."""
+    datasource_cache.invalidate()
+    with Workflow("test-sql-prefetch") as workflow:
+        for i in range(10):
+            Sql(name=f"sql-{i}", datasource_name=f"ds-{i % 3}", sql="select 1")
+    defines = workflow.task_definition_json
+    assert {define["taskParams"]["datasource"] for define in defines} == {4}
+    mock_get_batch.assert_called_once()
+    assert len(mock_get_batch.call_args.args[0]) == 3
+    mock_get.assert_not_called()
@@ -22,7 +22,7 @@ from unittest.mock import patch
 
 import pytest
 
-from pydolphinscheduler.core.workflow import Workflow
+from pydolphinscheduler.core.workflow import Workflow, workflow_code_cache
 from pydolphinscheduler.tasks.sub_workflow import SubWorkflow
 
 TEST_SUB_WORKFLOW_NAME = "sub-test-workflow"
@@ -135,3 +135,78 @@ def test_deprecated_sub_workflow_get_define(mock_workflow_definition):
             with Workflow(TEST_WORKFLOW_NAME):
                 sub_workflow = SubProcess(name, TEST_SUB_WORKFLOW_NAME)
                 assert sub_workflow.task_params == expect_task_params
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    return_value=(123, 1),
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info",
+    side_effect=lambda user, project, workflow: {"code": f"code-{workflow}"},
+)
+def test_sub_workflow_code_cache(mock_workflow_info, mock_code_version):
+    """Test workflow code of task sub workflow cached per user and project."""
+    workflow_code_cache.invalidate()
+    with Workflow(TEST_WORKFLOW_NAME):
+        tasks = [SubWorkflow(f"task-{i}", TEST_SUB_WORKFLOW_NAME) for i in range(3)]
+    with Workflow(TEST_WORKFLOW_NAME, project="other-project"):
+        tasks.append(SubWorkflow("task-other", TEST_SUB_WORKFLOW_NAME))
+
+    assert {task.workflow_definition_code for task in tasks} == {
+        f"code-{TEST_SUB_WORKFLOW_NAME}"
+    }
+    assert mock_workflow_info.call_count == 2
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    side_effect=[(i, 1) for i in range(6)],
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info_batch",
+    side_effect=lambda keys: [{"code": f"code-{key[2]}"} for key in keys],
+)
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info")
+def test_workflow_prefetch_sub_workflow_code(
+    mock_workflow_info, mock_workflow_info_batch, mock_code_version
+):
+    """Test workflow prefetch codes of all distinct sub workflows in one batch."""
+    workflow_code_cache.invalidate()
+    with Workflow(TEST_WORKFLOW_NAME) as workflow:
+        for i in range(6):
+            SubWorkflow(f"task-{i}", f"sub-{i % 2}")
+
+    defines = workflow.task_definition_json
+    assert [define["taskParams"]["workflowDefinitionCode"] for define in defines] == [
+        "code-sub-0",
+        "code-sub-1",
+    ] * 3
+    mock_workflow_info_batch.assert_called_once()
+    assert sorted(mock_workflow_info_batch.call_args.args[0]) == [
+        ("userPythonGateway", "project-pydolphin", "sub-0"),
+        ("userPythonGateway", "project-pydolphin", "sub-1"),
+    ]
+    mock_workflow_info.assert_not_called()
+
+
+@patch(
+    "pydolphinscheduler.core.task.Task.gen_code_and_version",
+    return_value=(123, 1),
+)
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.create_or_update_workflow",
+    return_value=456,
+)
+@patch("pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info")
+@patch("pydolphinscheduler.core.workflow.Workflow._ensure_side_model_exists")
+def test_sub_workflow_reuse_submitted_code(
+    mock_side_model, mock_workflow_info, mock_workflow, mock_code_version
+):
+    """Test task sub workflow reuse code of workflow submitted in the same process."""
+    workflow_code_cache.invalidate()
+    Workflow(TEST_SUB_WORKFLOW_NAME).submit()
+    with Workflow(TEST_WORKFLOW_NAME):
+        task = SubWorkflow("task", TEST_SUB_WORKFLOW_NAME)
+    assert task.workflow_definition_code == 456
+    mock_workflow_info.assert_not_called()
@@ -21,8 +21,11 @@ import importlib
 import logging
 import os
 import re
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -168,12 +171,43 @@ def test_get_configs_build_in():
     assert YamlParser(content).dict_parser == configuration.get_configs().dict_parser
 
 
+def test_configs_parsed_lazily():
+    """Test module variable ``configs`` is a YamlParser parsed when first accessed, and reset by reload."""
+    importlib.reload(configuration)
+    assert "configs" not in vars(configuration)
+    with patch(
+        "pydolphinscheduler.configuration.get_configs",
+        wraps=configuration.get_configs,
+    ) as mock_get_configs:
+        configs = configuration.configs
+        assert configuration.configs is configs
+        assert mock_get_configs.call_count == 1
+    assert isinstance(configs, YamlParser)
+    assert configs["java_gateway.address"] == configuration.get_configs().get(
+        "java_gateway.address"
+    )
+    assert "java_gateway:" in str(configs)
+
+    importlib.reload(configuration)
+    assert "configs" not in vars(configuration)
+    with pytest.raises(AttributeError, match="no attribute 'not_exists'"):
+        configuration.not_exists  # noqa: B018
+
+
 @pytest.mark.parametrize(
     "key, val, new_val",
     [
         ("java_gateway.address", "127.0.0.1", "127.1.1.1"),
         ("java_gateway.port", 25333, 25555),
         ("java_gateway.auto_convert", True, False),
+        ("java_gateway.pool.size", 8, 16),
+        ("cache.side_model_ttl", 600, 60),
+        ("cache.environment_ttl", 600, 60),
+        ("cache.datasource_ttl", 600, 60),
+        ("cache.dependent_ttl", 600, 60),
+        ("cache.resource_ttl", 600, 60),
+        ("cache.engine_resource_ttl", 600, 60),
+        ("cache.workflow_code_ttl", 600, 60),
         ("default.user.name", "userPythonGateway", "editUserPythonGateway"),
         ("default.user.password", "userPythonGateway", "editUserPythonGateway"),
         (
@@ -190,6 +224,8 @@ def test_get_configs_build_in():
         ("default.workflow.worker_group", "default", "specific"),
         ("default.workflow.time_zone", "Asia/Shanghai", "Asia/Beijing"),
         ("default.workflow.warning_type", "NONE", "ALL"),
+        ("default.workflow.skip_unchanged", False, True),
+        ("default.workflow.json_encoder", "auto", "json"),
     ],
 )
 def test_single_config_get_set(teardown_file_env, key: str, val: Any, new_val: Any):
@@ -214,6 +250,9 @@ def test_single_config_get_set_not_exists_key():
         ("JAVA_GATEWAY_ADDRESS", "127.0.0.1"),
         ("JAVA_GATEWAY_PORT", 25333),
         ("JAVA_GATEWAY_AUTO_CONVERT", True),
+        ("JAVA_GATEWAY_POOL_SIZE", 8),
+        ("JAVA_GATEWAY_POOL_IDLE_TIMEOUT", 300),
+        ("JAVA_GATEWAY_POOL_HEALTH_CHECK", False),
         ("USER_NAME", "userPythonGateway"),
         ("USER_PASSWORD", "userPythonGateway"),
         ("USER_EMAIL", "userPythonGateway@dolphinscheduler.com"),
@@ -238,6 +277,9 @@ def test_get_configuration(config_name: str, expect: Any):
         ("JAVA_GATEWAY_ADDRESS", "127.0.0.1", "192.168.1.1"),
         ("JAVA_GATEWAY_PORT", 25333, 25334),
         ("JAVA_GATEWAY_AUTO_CONVERT", True, False),
+        ("JAVA_GATEWAY_POOL_SIZE", 8, 16),
+        ("JAVA_GATEWAY_POOL_IDLE_TIMEOUT", 300, 0),
+        ("JAVA_GATEWAY_POOL_HEALTH_CHECK", False, True),
         ("USER_NAME", "userPythonGateway", "envUserPythonGateway"),
         ("USER_PASSWORD", "userPythonGateway", "envUserPythonGateway"),
         (
@@ -287,3 +329,90 @@ def test_token_alert(caplog):
             ),
         ]
     )
+
+
+def test_config_snapshot_cached(tmp_path):
+    """Test configuration file parsed once in process until it changed."""
+    os.environ[ENV_PYDS_HOME] = str(tmp_path)
+    try:
+        configuration.init_config_file()
+        with patch(
+            "pydolphinscheduler.configuration.get_configs",
+            wraps=configuration.get_configs,
+        ) as mock_get_configs:
+            assert get_single_config("java_gateway.port") == 25333
+            assert get_single_config("java_gateway.address") == "127.0.0.1"
+            assert mock_get_configs.call_count == 1
+
+            set_single_config("java_gateway.port", 25444)
+            assert mock_get_configs.call_count == 2
+            assert get_single_config("java_gateway.port") == 25444
+            assert mock_get_configs.call_count == 2
+
+            config_path().write_text(
+                config_path().read_text().replace("25444", "25555")
+            )
+            assert get_single_config("java_gateway.port") == 25555
+            assert mock_get_configs.call_count == 3
+    finally:
+        os.environ.pop(ENV_PYDS_HOME, None)
+
+
+def test_config_snapshot_import_without_yaml(tmp_path):
+    """Test importing configuration parse YAML by default, and skip it when snapshot file is up to date."""
+    statement = (
+        "import sys\n"
+        "import pydolphinscheduler.configuration as configuration\n"
+        "print('ruamel.yaml' in sys.modules)\n"
+        "configuration.configs\n"
+        "print('ruamel.yaml' in sys.modules)"
+    )
+
+    def run(snapshot: str) -> str:
+        env = dict(os.environ, PYDS_CONFIG_SNAPSHOT=snapshot)
+        env[ENV_PYDS_HOME] = str(tmp_path)
+        return subprocess.run(
+            [sys.executable, "-c", statement],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+
+    assert run("false") == ["True", "True"]
+    # the first run in snapshot mode writes the snapshot file, and later runs use it
+    assert run("true") == ["True", "True"]
+    assert run("true") == ["False", "True"]
+
+
+def test_config_snapshot_file(tmp_path):
+    """Test configuration snapshot persisted in file, and used by other process without parsing YAML."""
+    os.environ[ENV_PYDS_HOME] = str(tmp_path)
+    os.environ["PYDS_CONFIG_SNAPSHOT"] = "true"
+    try:
+        configuration.init_config_file()
+        assert get_single_config("default.user.tenant") == "tenant_pydolphin"
+        assert configuration.snapshot_path().exists()
+
+        # new process only has snapshot file
+        configuration._snapshot.clear()
+        with patch(
+            "pydolphinscheduler.configuration.get_configs",
+            side_effect=AssertionError("YAML should not be parsed"),
+        ):
+            assert get_single_config("default.user.tenant") == "tenant_pydolphin"
+            assert get_single_config("java_gateway.pool") == {
+                "size": 8,
+                "idle_timeout": 300,
+                "health_check": False,
+            }
+
+        # snapshot file is stale after configuration file changed
+        configuration._snapshot.clear()
+        config_path().write_text(
+            config_path().read_text().replace("tenant_pydolphin", "tenant_changed")
+        )
+        assert get_single_config("default.user.tenant") == "tenant_changed"
+    finally:
+        os.environ.pop(ENV_PYDS_HOME, None)
+        os.environ.pop("PYDS_CONFIG_SNAPSHOT", None)
@@ -0,0 +1,109 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Test import time of package, guard lazy imports from regression by ``python -X importtime``."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from pydolphinscheduler import tasks
+
+HEAVY_MODULES = {"boto3", "oss2", "gitlab", "stmdency"}
+
+
+def import_time(statement: str) -> tuple[dict[str, int], set[str]]:
+    """Run statement in new interpreter, return self import time in microseconds and all modules imported.
+
+    Modules imported by :func:`importlib.import_module` are not reported by ``-X importtime``, so all
+    imported modules are collected from :data:`sys.modules` after statement run.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, module = line.split("|")
+        self_time = self_time.removeprefix("import time:").strip()
+        if self_time.isdigit():
+            times[module.strip()] = int(self_time)
+    return times, set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "statement, expect, not_expect",
+    [
+        (
+            "from pydolphinscheduler.tasks import Shell",
+            {"pydolphinscheduler.tasks.shell"},
+            {
+                f"pydolphinscheduler.tasks.{module}"
+                for module in set(tasks._LAZY_IMPORTS.values()) - {"shell"}
+            },
+        ),
+        (
+            "from pydolphinscheduler.core.task_registry import get_task_cls; get_task_cls('shell')",
+            {"pydolphinscheduler.tasks.shell"},
+            {
+                f"pydolphinscheduler.tasks.{module}"
+                for module in set(tasks._LAZY_IMPORTS.values()) - {"shell"}
+            },
+        ),
+        (
+            "from pydolphinscheduler.resources_plugin import Local",
+            {"pydolphinscheduler.resources_plugin.local"},
+            {
+                "pydolphinscheduler.resources_plugin.s3",
+                "pydolphinscheduler.resources_plugin.oss",
+                "pydolphinscheduler.resources_plugin.gitlab",
+                "pydolphinscheduler.resources_plugin.github",
+            },
+        ),
+    ],
+)
+def test_lazy_import(statement: str, expect: set[str], not_expect: set[str]):
+    """Test importing one task or resource plugin do not import others and heavy dependencies."""
+    times, imported = import_time(statement)
+    assert expect <= imported
+    assert not (not_expect | HEAVY_MODULES) & imported
+    assert not HEAVY_MODULES & set(times)
+
+
+def test_lazy_import_all():
+    """Test importing all tasks still works, and it imports more than single task."""
+    single, _ = import_time("from pydolphinscheduler.tasks import Shell")
+    every, imported = import_time("from pydolphinscheduler.tasks import *")
+    assert {
+        f"pydolphinscheduler.tasks.{module}"
+        for module in set(tasks._LAZY_IMPORTS.values())
+    } <= imported
+    assert "stmdency" in every
+    assert set(single) < set(every)
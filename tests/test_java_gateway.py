@@ -0,0 +1,198 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Test module :mod:`pydolphinscheduler.java_gateway` without a running Java gateway."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from py4j.protocol import Py4JError, Py4JNetworkError
+
+from pydolphinscheduler import java_gateway
+from pydolphinscheduler.exceptions import PyDSJavaGatewayException
+from pydolphinscheduler.java_gateway import (
+    AsyncGatewayEntryPoint,
+    GatewayEntryPoint,
+    GatewayPool,
+)
+
+
+@pytest.fixture
+def clean_gateway_versions():
+    """Clean memoized java gateway versions before and after test."""
+    java_gateway._gateway_versions.clear()
+    yield
+    java_gateway._gateway_versions.clear()
+
+
+@patch("pydolphinscheduler.java_gateway.JavaGateway")
+def test_gateway_entry_point_lazy(mock_java_gateway, clean_gateway_versions):
+    """Test create GatewayEntryPoint do not connect to java gateway until first RPC."""
+    entry_point = GatewayEntryPoint()
+    mock_java_gateway.assert_not_called()
+    assert java_gateway._gateway_versions == {}
+
+    entry_point.query_environment_info("env")
+    mock_java_gateway.assert_called_once()
+    entry_point.query_environment_info("env")
+    mock_java_gateway.assert_called_once()
+
+
+@patch("pydolphinscheduler.java_gateway.JavaGateway")
+def test_gateway_version_memoized(mock_java_gateway, clean_gateway_versions):
+    """Test java gateway version only query once per process for the same address and port."""
+    get_version = MagicMock(return_value="3.2.0")
+    mock_java_gateway.return_value.entry_point.getGatewayVersion = get_version
+
+    for _ in range(3):
+        entry_point = GatewayEntryPoint(address="127.0.0.1", port=25333)
+        assert entry_point.get_gateway_version() == "3.2.0"
+    get_version.assert_called_once()
+
+    GatewayEntryPoint(address="127.0.0.1", port=25334).get_gateway_version()
+    assert get_version.call_count == 2
+
+
+def test_gateway_pool_reuse_connection():
+    """Test gateway pool reuse idle connection instead of create new one."""
+    factory = MagicMock()
+    pool = GatewayPool(factory, size=2)
+    for _ in range(3):
+        with pool.connection():
+            pass
+    factory.assert_called_once()
+
+
+def test_gateway_pool_size_bound():
+    """Test gateway pool do not create connections more than pool size when used in threads."""
+    size = 3
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = GatewayPool(factory, size=size)
+    in_use = []
+    max_in_use = []
+    lock = threading.Lock()
+
+    def work():
+        with pool.connection():
+            with lock:
+                in_use.append(1)
+                max_in_use.append(len(in_use))
+            time.sleep(0.01)
+            with lock:
+                in_use.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert factory.call_count <= size
+    assert max(max_in_use) <= size
+
+
+def test_gateway_pool_idle_timeout():
+    """Test gateway pool close connection which idle more than idle timeout."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = GatewayPool(factory, size=1, idle_timeout=1)
+    with pool.connection() as first:
+        pass
+    expired = time.monotonic() + 10
+    with patch("time.monotonic", return_value=expired), pool.connection() as second:
+        pass
+    first.close.assert_called_once()
+    assert first is not second
+    assert factory.call_count == 2
+
+
+def test_gateway_pool_health_check():
+    """Test gateway pool replace unhealthy connection when health check enabled."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = GatewayPool(factory, size=1, health_check=True)
+    with pool.connection() as first:
+        first.entry_point.ping.side_effect = Py4JError("unhealthy")
+    with pool.connection() as second:
+        pass
+    assert first is not second
+    first.close.assert_called_once()
+
+
+def test_gateway_pool_discard_network_error():
+    """Test gateway pool discard connection which raise network error."""
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    pool = GatewayPool(factory, size=1)
+    with pytest.raises(Py4JNetworkError), pool.connection() as first:
+        raise Py4JNetworkError("broken")
+    with pool.connection() as second:
+        pass
+    assert first is not second
+    first.close.assert_called_once()
+
+
+def test_gateway_pool_size_error():
+    """Test gateway pool raise error with invalid size."""
+    with pytest.raises(PyDSJavaGatewayException, match="pool size must be greater"):
+        GatewayPool(MagicMock(), size=0)
+
+
+@patch(
+    "pydolphinscheduler.java_gateway.GatewayEntryPoint.get_workflow_info",
+    return_value={"code": 123},
+)
+def test_async_gateway_entry_point_method(mock_workflow_info):
+    """Test async gateway entry point reuse method of GatewayEntryPoint."""
+    async_gateway = AsyncGatewayEntryPoint(GatewayEntryPoint(), max_concurrency=2)
+    result = asyncio.run(async_gateway.get_workflow_info("user", "project", "wf"))
+    assert result == {"code": 123}
+    mock_workflow_info.assert_called_once_with("user", "project", "wf")
+    async_gateway.close()
+
+    with pytest.raises(AttributeError):
+        _ = async_gateway._call
+    with pytest.raises(AttributeError):
+        _ = async_gateway.not_exists_method
+
+
+def test_async_gateway_entry_point_bounded_concurrency():
+    """Test async gateway entry point run blocking function with bounded concurrency."""
+    max_concurrency = 3
+    async_gateway = AsyncGatewayEntryPoint(
+        GatewayEntryPoint(), max_concurrency=max_concurrency
+    )
+    in_use = []
+    max_in_use = []
+    lock = threading.Lock()
+
+    def blocking(idx: int) -> int:
+        with lock:
+            in_use.append(idx)
+            max_in_use.append(len(in_use))
+        time.sleep(0.01)
+        with lock:
+            in_use.remove(idx)
+        return idx
+
+    async def main():
+        return await asyncio.gather(
+            *(async_gateway.run(blocking, idx) for idx in range(20))
+        )
+
+    assert asyncio.run(main()) == list(range(20))
+    assert max(max_in_use) <= max_concurrency
+    async_gateway.close()
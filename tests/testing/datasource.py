@@ -0,0 +1,28 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Mock datasource returned by Java gateway for other test."""
+
+from unittest.mock import Mock
+
+
+def java_datasource(id_: int, type_: str = "mysql") -> Mock:
+    """Mock Java datasource object with its id and type description, returned by Java gateway."""
+    datasource = Mock()
+    datasource.getId.return_value = id_
+    datasource.getType.return_value.getDescp.return_value = type_
+    return datasource
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Test batch helpers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pydolphinscheduler.utils.batch import run_shared, split_waves
+
+
+@dataclass
+class Result:
+    """Result for testing run_shared."""
+
+    name: str
+    error: BaseException | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether result is failed or not."""
+        return self.error is None
+
+
+def test_split_waves():
+    """Test split waves order dependencies first, ignore outside keys and put cycle in the last wave."""
+    depends = {
+        "a": ["b", "outside"],
+        "b": ["c", "b"],
+        "c": [],
+        "x": ["y"],
+        "y": ["x"],
+        "z": ["c"],
+    }
+    waves = split_waves(list(depends), lambda item: item, depends.get)
+    assert waves == [["c"], ["b", "z"], ["a"], ["x", "y"]]
+
+
+def test_run_shared():
+    """Test run shared function once with first not failed result, and record error to all of them."""
+    failed = Result("failed", error=ValueError("failed before"))
+    shared = [failed, Result("first"), Result("second")]
+    called = []
+
+    def func(result):
+        called.append(result.name)
+        raise RuntimeError("shared error")
+
+    run_shared(shared, func)
+    assert called == ["first"]
+    assert str(failed.error) == "failed before"
+    assert [str(result.error) for result in shared[1:]] == ["shared error"] * 2
+
+    run_shared(shared, func)
+    assert called == ["first"]
@@ -0,0 +1,92 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test utils.cache module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pydolphinscheduler.utils.cache import TTLCache
+
+
+def test_ttl_cache_get_set():
+    """Test TTLCache get, set and hit or miss stats."""
+    cache = TTLCache(ttl=60)
+    assert cache.get("key") is None
+    assert cache.get("key", "default") == "default"
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_ttl_cache_contains_not_counted():
+    """Test TTLCache membership test do not count hits or misses, and expired key is not contained."""
+    with patch("pydolphinscheduler.utils.cache.time.monotonic", return_value=100):
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+        assert "key" in cache
+        assert "other" not in cache
+    with patch("pydolphinscheduler.utils.cache.time.monotonic", return_value=110):
+        assert "key" not in cache
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 1}
+
+
+@pytest.mark.parametrize("ttl, expect", [(0, None), (-1, "value")])
+def test_ttl_cache_disable_and_never_expired(ttl: int, expect: str | None):
+    """Test TTLCache with ttl zero disable cache and negative ttl never expired."""
+    cache = TTLCache(ttl=ttl)
+    cache.set("key", "value")
+    with patch("pydolphinscheduler.utils.cache.time.monotonic", return_value=1e12):
+        assert cache.get("key") == expect
+
+
+def test_ttl_cache_expired():
+    """Test TTLCache entries expired after ttl seconds."""
+    with patch("pydolphinscheduler.utils.cache.time.monotonic", return_value=100):
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+    with patch("pydolphinscheduler.utils.cache.time.monotonic", return_value=109):
+        assert cache.get("key") == "value"
+    with patch("pydolphinscheduler.utils.cache.time.monotonic", return_value=110):
+        assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_get_or_set():
+    """Test TTLCache get_or_set only call function when key missing."""
+    cache = TTLCache(ttl=60)
+    func = Mock(return_value="value")
+    assert cache.get_or_set("key", func) == "value"
+    assert cache.get_or_set("key", func) == "value"
+    func.assert_called_once()
+
+
+def test_ttl_cache_invalidate():
+    """Test TTLCache invalidate single key, keys match predicate and all keys."""
+    cache = TTLCache(ttl=60)
+    for key in [("a", 1), ("a", 2), ("b", 1), ("c", 1)]:
+        cache.set(key, "value")
+    cache.invalidate(("c", 1))
+    assert len(cache) == 3
+    cache.invalidate(predicate=lambda key: key[0] == "a")
+    assert len(cache) == 1 and ("b", 1) in cache
+    cache.invalidate()
+    assert len(cache) == 0
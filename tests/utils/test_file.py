@@ -83,3 +83,12 @@ def test_write_overwrite_error(setup_crt_first):
         FileExistsError, match=".*already exists and you choose not overwrite mode\\."
     ):
         file.write(content=new_content, to_path=file_path)
+
+
+def test_lock(tmp_path):
+    """Test lock file is created in missing directory and could be acquired again after released."""
+    path = tmp_path.joinpath("missing", "file.lock")
+    with file.lock(path):
+        assert path.exists()
+    with file.lock(path):
+        pass
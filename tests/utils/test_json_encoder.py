@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""Test utils.json_encoder module."""
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+from ruamel.yaml import YAML
+
+from pydolphinscheduler.exceptions import PyDSConfException
+from pydolphinscheduler.utils import json_encoder
+
+payload = {
+    "name": "中文",
+    "code": 123,
+    "params": {"localParams": [], "flag": True, "value": None},
+    "weight": 1.5,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_encoder():
+    """Clear encoders cache before and after each test."""
+    json_encoder._load_dumps.cache_clear()
+    yield
+    json_encoder._load_dumps.cache_clear()
+
+
+@pytest.mark.parametrize("encoder", ["auto", "orjson", "ujson", "json", "JSON"])
+def test_dumps(encoder):
+    """Test all encoders get the same JSON object."""
+    if encoder in ("orjson", "ujson"):
+        pytest.importorskip(encoder)
+    assert json.loads(json_encoder.dumps(payload, encoder)) == payload
+
+
+@pytest.mark.parametrize("encoder", ["auto", "orjson", "ujson", "json"])
+def test_dumps_yaml_values(encoder):
+    """Test all encoders encode values loaded by ruamel, which are subclasses of builtin types."""
+    if encoder in ("orjson", "ujson"):
+        pytest.importorskip(encoder)
+    content = "param:\n  ratio: 1.5\n  big: 1e3\n  hex: 0x10\n  flag: true\n  list: [0.5, a]\n"
+    value = YAML().load(content)
+    assert json.loads(json_encoder.dumps(value, encoder)) == {
+        "param": {
+            "ratio": 1.5,
+            "big": 1000.0,
+            "hex": 16,
+            "flag": True,
+            "list": [0.5, "a"],
+        }
+    }
+
+
+def test_dumps_not_serializable():
+    """Test encoders still raise error for types not serializable."""
+    for encoder in ("auto", "json"):
+        with pytest.raises(TypeError):
+            json_encoder.dumps({"key": object()}, encoder)
+
+
+@pytest.mark.parametrize("encoder", ["auto", "json"])
+def test_dumps_array(encoder):
+    """Test encode items from generator to JSON array."""
+    items = (dict(payload, code=idx) for idx in range(3))
+    assert json.loads(json_encoder.dumps_array(items, encoder)) == [
+        dict(payload, code=idx) for idx in range(3)
+    ]
+    assert json_encoder.dumps_array(iter([]), encoder) == "[]"
+
+
+def test_auto_fall_back():
+    """Test encoder auto fall back to built-in json when others not installed."""
+    with patch.dict(sys.modules, {"orjson": None, "ujson": None}):
+        assert json_encoder.get_dumps("auto") is json.dumps
+
+
+def test_encoder_not_installed():
+    """Test specific encoder not installed raise error."""
+    with patch.dict(sys.modules, {"ujson": None}), pytest.raises(
+        PyDSConfException, match="not installed"
+    ):
+        json_encoder.get_dumps("ujson")
+
+
+def test_encoder_not_support():
+    """Test not supported encoder raise error."""
+    with pytest.raises(PyDSConfException, match="not supported"):
+        json_encoder.get_dumps("not-exists")
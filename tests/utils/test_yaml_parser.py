@@ -45,6 +45,18 @@ expects = [
         "java_gateway.address": ("127.0.0.1", "127.1.1.1"),
         "java_gateway.port": (25333, 25555),
         "java_gateway.auto_convert": (True, False),
+        "java_gateway.pool": yaml.load("no need test"),
+        "java_gateway.pool.size": (8, 16),
+        "java_gateway.pool.idle_timeout": (300, 600),
+        "java_gateway.pool.health_check": (False, True),
+        "cache": yaml.load("no need test"),
+        "cache.side_model_ttl": (600, 60),
+        "cache.environment_ttl": (600, 60),
+        "cache.datasource_ttl": (600, 60),
+        "cache.dependent_ttl": (600, 60),
+        "cache.resource_ttl": (600, 60),
+        "cache.engine_resource_ttl": (600, 60),
+        "cache.workflow_code_ttl": (600, 60),
         "default": yaml.load("no need test"),
         "default.user": yaml.load("no need test"),
         "default.user.name": ("userPythonGateway", "userPythonGatewayEdit"),
@@ -65,6 +77,8 @@ expects = [
         "default.workflow.time_zone": ("Asia/Shanghai", "Europe/Amsterdam"),
         "default.workflow.warning_type": ("NONE", "SUCCESS"),
         "default.workflow.execution_type": ("parallel", "serial_wait"),
+        "default.workflow.skip_unchanged": (False, True),
+        "default.workflow.json_encoder": ("auto", "json"),
     },
 ]
 
@@ -253,3 +267,19 @@ def test_yaml_parser_str_repr(src: str, setter: dict, expect: str):
     # Equal after changed
     assert expect == str(yaml_parser)
     assert f"YamlParser({expect})" == repr(yaml_parser)
+
+
+def test_yaml_parser_set_nested_map():
+    """Test set value of nested map keeps index of its nested keys in sync."""
+    yaml_parser = YamlParser(param[0])
+    assert yaml_parser["name.mark.name_mark"] is yaml_parser["name.mark"]["name_mark"]
+
+    yaml_parser["name.mark"] = YamlParser("other:\n  key: new").src_parser
+    assert "name.mark.name_mark" not in yaml_parser
+    assert "name.mark.name_mark.key" not in yaml_parser
+    assert yaml_parser["name.mark.other.key"] == "new"
+
+    yaml_parser["name.mark.other.key"] = "changed"
+    assert yaml_parser["name.mark"]["other"]["key"] == "changed"
+    with pytest.raises(KeyError):
+        yaml_parser["name.mark.name_mark.key"] = "not exists"